@@ -0,0 +1,5 @@
+"""Make the simulator importable as a package: its modules use relative imports."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -3,12 +3,15 @@
 import numpy as np
 import uuid
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 class ComputationalIdeaSimulator:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.idea_library = {}  # Stores ideas and their evolution states
         self.current_state = {}  # Global state or summary of the universe
+        # Every idea gets its own stream spawned from this seed, so runs replay exactly
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
         self._initialize_universe_state()
 
     def _initialize_universe_state(self):
@@ -28,7 +31,11 @@ class ComputationalIdeaSimulator:
 
     def simulate_idea_evolution(self, idea_description: str, simulation_steps: int = 10, mutation_rate: float = 0.1) -> Dict[str, Any]:
         idea_id = str(uuid.uuid4())
-        initial_vector = np.random.rand(5)  # Initial 5-dimensional vector for the idea
+        rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        initial_vector = rng.random(5)  # Initial 5-dimensional vector for the idea
+        # Draw all step randomness in one block
+        mutations = (rng.random((simulation_steps, 5)) - 0.5) * mutation_rate
+        complexity_changes = (rng.random(simulation_steps) - 0.5) * 0.05
         
         evolution_trace = []
         current_vector_state = initial_vector
@@ -37,6 +44,7 @@ class ComputationalIdeaSimulator:
         self.idea_library[idea_id] = {
             "idea_description": idea_description,
             "initial_vector": initial_vector.tolist(),
+            "rng_spawn_key": rng.bit_generator.seed_seq.spawn_key,
             "evolution_trace": [],
             "complexity_trend": [],
             "final_state": current_vector_state.tolist(),
@@ -46,13 +54,11 @@ class ComputationalIdeaSimulator:
 
         for step in range(simulation_steps):
             # Simulate mutation: small random changes to the vector
-            mutation = (np.random.rand(5) - 0.5) * mutation_rate
-            current_vector_state = current_vector_state + mutation
+            current_vector_state = current_vector_state + mutations[step]
             current_vector_state = np.clip(current_vector_state, 0, 1) # Keep values between 0 and 1
 
             # Simulate complexity change: can increase or decrease
-            complexity_change = (np.random.rand() - 0.5) * 0.05
-            current_complexity = max(0.1, min(1.0, current_complexity + complexity_change))
+            current_complexity = max(0.1, min(1.0, current_complexity + float(complexity_changes[step])))
 
             evolution_trace.append({
                 "step": step,
@@ -107,7 +113,7 @@ class ComputationalIdeaSimulator:
             "new_idea_id": new_idea_id,
             "new_idea_description": new_idea_description,
             "hybrid_vector_state": new_vector.tolist(),
-            "novelty_score": np.random.rand() # Mock novelty score
+            "novelty_score": self.rng.random() # Mock novelty score
         }
 
     def batch_simulate_ideas(self, ideas: List[str], simulations_per_idea: int = 5) -> List[Dict[str, Any]]:
@@ -192,18 +198,18 @@ class ComputationalIdeaSimulator:
         """Mock: Embeds text into a vector."""
         print(f"LDB-V Mock: Embedding text for '{purpose}': '{text}'")
         # Return a random vector for now
-        return np.random.rand(5)
+        return self.rng.random(5)
 
     def similarity_search(self, query_vector: Any, search_width: int, similarity_threshold: float) -> List[Dict]:
         """Mock: Performs a similarity search."""
         print(f"LDB-V Mock: Performing similarity search with width={search_width}, threshold={similarity_threshold}")
         # Return mock results
-        return [{"id": "mock_id_1", "score": 0.9, "vector": np.random.rand(5).tolist()}]
+        return [{"id": "mock_id_1", "score": 0.9, "vector": self.rng.random(5).tolist()}]
 
     def complexity_analyze(self, complexity_threshold: float = 0.5, depth_analysis: bool = False, decomposition_levels: int = 1) -> Dict:
         """Mock: Analyzes complexity of a concept/vector."""
         print(f"LDB-V Mock: Analyzing complexity (threshold={complexity_threshold}, depth={depth_analysis}, levels={decomposition_levels})")
-        return {"complexity_score": np.random.rand(), "depth_analyzed": depth_analysis}
+        return {"complexity_score": self.rng.random(), "depth_analyzed": depth_analysis}
 
     def structure_decompose(self) -> Dict:
         """Mock: Decomposes a structure."""
@@ -213,32 +219,32 @@ class ComputationalIdeaSimulator:
     def idea_evolve(self, mutation_rate: float, evolution_strength: float) -> Dict:
         """Mock: Evolves an idea vector."""
         print(f"LDB-V Mock: Evolving idea with mutation={mutation_rate}, strength={evolution_strength}")
-        return {"evolved_vector": np.random.rand(5).tolist(), "new_complexity": np.random.rand()}
+        return {"evolved_vector": self.rng.random(5).tolist(), "new_complexity": self.rng.random()}
 
     def entropy_maximize(self, target_entropy_increase: float) -> Dict:
         """Mock: Maximizes entropy of a vector state."""
         print(f"LDB-V Mock: Maximizing entropy with target increase={target_entropy_increase}")
-        return {"entropy_change": target_entropy_increase * np.random.rand()}
+        return {"entropy_change": target_entropy_increase * self.rng.random()}
 
     def convergence_check(self, stability_threshold: float) -> Dict:
         """Mock: Checks for convergence/stability."""
         print(f"LDB-V Mock: Checking convergence with stability threshold={stability_threshold}")
-        return {"converged": np.random.rand() > 0.8, "stability_metric": np.random.rand()}
+        return {"converged": self.rng.random() > 0.8, "stability_metric": self.rng.random()}
 
     def idea_crossover(self, input_vectors: List[Any], crossover_strength: float) -> Dict:
         """Mock: Performs crossover between idea vectors."""
         print(f"LDB-V Mock: Performing crossover with strength={crossover_strength}")
-        return {"hybrid_vector": np.random.rand(5).tolist()}
+        return {"hybrid_vector": self.rng.random(5).tolist()}
 
     def complexity_balance(self, balance_threshold: float) -> Dict:
         """Mock: Balances complexity."""
         print(f"LDB-V Mock: Balancing complexity with threshold={balance_threshold}")
-        return {"balanced_complexity": np.random.rand()}
+        return {"balanced_complexity": self.rng.random()}
 
     def vector_cluster(self, num_clusters: int, method: str) -> Dict:
         """Mock: Clusters vectors."""
         print(f"LDB-V Mock: Clustering vectors into {num_clusters} with method={method}")
-        return {"clusters": {"c1": ["v1", "v2"]}, "cohesion": np.random.rand()}
+        return {"clusters": {"c1": ["v1", "v2"]}, "cohesion": self.rng.random()}
 
     def relationship_map(self, show_connections: bool) -> Dict:
         """Mock: Maps relationships."""
@@ -248,7 +254,7 @@ class ComputationalIdeaSimulator:
     def load_vectors_for_clustering(self, criteria: str) -> List[Dict]:
         """Mock: Loads vectors based on criteria for clustering."""
         print(f"LDB-V Mock: Loading vectors for clustering based on '{criteria}'")
-        return [{"id": "v1", "vector": np.random.rand(5).tolist()}]
+        return [{"id": "v1", "vector": self.rng.random(5).tolist()}]
 
     def semantic_expand(self, expansion_factor: float) -> Dict:
         """Mock: Expands semantic understanding."""
@@ -258,7 +264,7 @@ class ComputationalIdeaSimulator:
     def calculate_similarity(self, vector1: Any, vector2: Any, metric: str) -> Dict:
         """Mock: Calculates similarity between two vectors."""
         print(f"LDB-V Mock: Calculating similarity between two vectors using metric '{metric}'")
-        return {"similarity_score": np.random.rand()}
+        return {"similarity_score": self.rng.random()}
 
     def difference_highlight(self, threshold: float) -> Dict:
         """Mock: Highlights differences."""
@@ -0,0 +1,50 @@
+"""execute_computation: energy accounting and seeded replay"""
+import pytest
+
+from simulator.vector_computational_universe import VectorComputationalUniverse
+
+
+def test_failed_operation_still_charges_its_energy():
+    universe = VectorComputationalUniverse(32, seed=2, energy_refill_rate=0.0)
+    idea_id = universe.create_computation("failing idea")
+
+    def fail(computation, params):
+        raise RuntimeError("boom")
+
+    universe.ldb_v_operations["fail"] = fail
+    before = universe.energy_budget
+    results = universe.execute_computation(idea_id, ["vector_evolve", "fail"], max_iterations=1)
+    assert universe.computations[idea_id].metadata["error"] == "boom"
+    assert results["operations_executed"] == 1
+    assert results["energy_used"] == pytest.approx(before - universe.energy_budget)
+    assert results["energy_used"] > universe._calculate_energy_cost("vector_evolve", universe.computations[idea_id])
+
+
+def test_complexity_reduce_without_fft_out_matches(monkeypatch):
+    import simulator.vector_computational_universe as vcu
+
+    def run():
+        universe = VectorComputationalUniverse(64, seed=4)
+        idea_id = universe.create_computation("spectral idea")
+        universe.execute_computation(idea_id, ["complexity_reduce"], max_iterations=3)
+        return universe.computations[idea_id].state_vector.copy()
+
+    expected = run()
+    monkeypatch.setattr(vcu, "_FFT_HAS_OUT", False)
+    assert (run() == expected).all()
+
+
+def test_seeded_replay_is_exact():
+    plan = ["vector_evolve", "computational_mutate", "state_superpose", "entropy_maximize"]
+
+    def run(seed):
+        universe = VectorComputationalUniverse(128, seed=seed, state_tolerance=0.0, complexity_tolerance=0.0)
+        ids = universe.create_computation(["first idea", "second idea"])
+        return [universe.execute_computation(idea_id, plan, max_iterations=8) for idea_id in ids]
+
+    first, replay, other = run(11), run(11), run(12)
+    for a, b in zip(first, replay):
+        assert a["final_state"] == b["final_state"]
+        assert a["complexity_evolution"] == b["complexity_evolution"]
+        assert a["energy_used"] == b["energy_used"]
+    assert first[0]["final_state"] != other[0]["final_state"]
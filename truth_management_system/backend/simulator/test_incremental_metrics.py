@@ -0,0 +1,50 @@
+"""IncrementalMetrics: sparse updates against full recomputes"""
+import numpy as np
+import pytest
+
+from simulator.vector_computational_universe import IncrementalMetrics, VectorComputationalUniverse
+
+
+def fresh(vector):
+    return IncrementalMetrics(vector.copy())
+
+
+@pytest.mark.parametrize("changes", [1, 2])
+def test_small_change_updates_cached_spectrum(changes):
+    rng = np.random.default_rng(0)
+    vector = rng.normal(size=256)
+    metrics = IncrementalMetrics(vector)
+    metrics.complexity  # builds the spectrum
+    indices = np.sort(rng.choice(256, changes, replace=False))
+    old_values = vector[indices]
+    new_values = old_values + rng.normal(size=changes)
+    scale = 0.5
+    updated = vector.copy()
+    updated[indices] = new_values
+    updated *= scale
+
+    metrics.update_sparse(updated, indices, old_values, new_values, scale)
+    assert metrics.stats["sparse_spectrum_updates"] == 1
+    np.testing.assert_allclose(metrics.spectrum, np.fft.fft(updated), atol=1e-9)
+    assert metrics.complexity == pytest.approx(fresh(updated).complexity)
+    assert metrics.entropy == pytest.approx(fresh(updated).entropy)
+    assert metrics.stats["spectrum_recomputes"] == 1
+
+
+def test_typical_mutation_drops_spectrum_but_keeps_entropy_incremental():
+    universe = VectorComputationalUniverse(1024, seed=3)
+    idea_id = universe.create_computation("mutating idea")
+    computation = universe.computations[idea_id]
+    computation.metrics.complexity
+    stats = computation.metrics.stats
+    full_before, rebuilds_before = stats["full_recomputes"], stats["spectrum_recomputes"]
+
+    universe.execute_computation(idea_id, ["computational_mutate"], max_iterations=5)
+    assert stats["sparse_updates"] == 5
+    assert stats["sparse_spectrum_updates"] == 0
+    assert stats["full_recomputes"] == full_before
+    assert stats["spectrum_recomputes"] > rebuilds_before
+
+    state = computation.state_vector
+    assert computation.metrics.entropy == pytest.approx(fresh(state).entropy)
+    assert computation.metrics.complexity == pytest.approx(fresh(state).complexity)
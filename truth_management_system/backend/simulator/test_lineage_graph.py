@@ -0,0 +1,77 @@
+"""LineageGraph queries, checked against networkx"""
+import random
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+
+from simulator.vector_computational_universe import LineageGraph, VectorComputationalUniverse
+
+
+def random_lineage(seed: int, nodes: int = 60, edges: int = 150, acyclic: bool = False):
+    rng = random.Random(seed)
+    names = [f"idea_{i}" for i in range(nodes)]
+    pairs = []
+    for _ in range(edges):
+        u, v = rng.sample(range(nodes), 2)
+        if acyclic and u > v:
+            u, v = v, u
+        pairs.append((names[u], names[v]))
+    graph = LineageGraph()
+    for name in names:
+        graph.add_node(name)
+    # Half in bulk, half one by one, with queries in between
+    graph.add_edges(pairs[:edges // 2])
+    graph.successors(names[0])
+    for u, v in pairs[edges // 2:]:
+        graph.add_edge(u, v)
+    reference = nx.DiGraph()
+    reference.add_nodes_from(names)
+    reference.add_edges_from(pairs)
+    return graph, reference
+
+
+def condensation_depths(reference: nx.DiGraph) -> dict:
+    condensed = nx.condensation(reference)
+    level = {}
+    for component in nx.topological_sort(condensed):
+        level[component] = max((level[p] + 1 for p in condensed.predecessors(component)), default=0)
+    return {node: level[condensed.graph["mapping"][node]] for node in reference}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_queries_match_networkx(seed):
+    graph, reference = random_lineage(seed)
+    assert graph.number_of_edges() == reference.number_of_edges()
+    for node in reference:
+        assert sorted(graph.successors(node)) == sorted(reference.successors(node))
+        assert sorted(graph.predecessors(node)) == sorted(reference.predecessors(node))
+        assert graph.descendants(node) == nx.descendants(reference, node)
+        assert graph.ancestors(node) == nx.ancestors(reference, node)
+    assert nx.utils.graphs_equal(graph.to_networkx(), reference)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_depth_is_longest_path(seed):
+    graph, reference = random_lineage(seed, acyclic=True)
+    expected = condensation_depths(reference)
+    assert {node: graph.depth(node) for node in reference} == expected
+    assert max(expected.values()) == nx.dag_longest_path_length(reference)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_depth_of_cyclic_lineage_uses_condensation(seed):
+    graph, reference = random_lineage(seed, edges=90)
+    assert not nx.is_directed_acyclic_graph(reference)
+    assert {node: graph.depth(node) for node in reference} == condensation_depths(reference)
+
+
+def test_mutual_crossover_counts_as_one_generation():
+    universe = VectorComputationalUniverse(64, seed=3)
+    a, b, c = universe.create_computation(["idea a", "idea b", "idea c"])
+    universe.ldb_v_operations["idea_crossover"](universe.computations[a], {"other_idea_id": b})
+    universe.ldb_v_operations["idea_crossover"](universe.computations[b], {"other_idea_id": a})
+    universe.ldb_v_operations["idea_crossover"](universe.computations[a], {"other_idea_id": c})
+    graph = universe.computational_graph
+    assert graph.depth(a) == graph.depth(b) == 0
+    assert graph.depth(c) == 1
@@ -0,0 +1,62 @@
+"""Batched embedding and sparse initial states against their dense references"""
+import numpy as np
+import pytest
+
+from simulator.vector_computational_universe import FeatureHashingEmbedder, VectorComputationalUniverse
+
+DESCRIPTIONS = ["graphs and vectors", "", "Repeated words repeated WORDS", "graphs and vectors",
+                "a single long description with many different words in it"]
+CONDITIONS = [{"x": 1}, None, {"y": -2, "z": 0.5}, None, {"x": 3}]
+
+
+def test_batch_embedding_matches_single_embedding():
+    universe = VectorComputationalUniverse(97, seed=0)
+    batch = FeatureHashingEmbedder(97).embed_batch(DESCRIPTIONS, CONDITIONS)
+    for row, (description, conditions) in enumerate(zip(DESCRIPTIONS, CONDITIONS)):
+        np.testing.assert_allclose(batch[row], universe._idea_to_vector(description, conditions), atol=1e-15)
+
+    assert not batch[1].any()
+    np.testing.assert_allclose(np.linalg.norm(batch[3]), 1.0)
+
+
+def test_embedding_cache_returns_same_values():
+    embedder = FeatureHashingEmbedder(64)
+    first = embedder.embed_batch(DESCRIPTIONS, CONDITIONS)
+    again = embedder.embed_batch(DESCRIPTIONS, CONDITIONS)
+    np.testing.assert_array_equal(first, again)
+    assert embedder.get_stats()["embedding_cache"]["hits"] >= len(DESCRIPTIONS)
+
+    sparse = embedder.embed_batch_sparse(DESCRIPTIONS, CONDITIONS)
+    np.testing.assert_array_equal(np.stack([state.to_dense() for state in sparse]), first)
+
+
+def test_sparse_states_match_dense_states():
+    dense = VectorComputationalUniverse(256, seed=4)
+    sparse = VectorComputationalUniverse(256, seed=4, sparse_states=True)
+    dense_ids = dense.create_computation(DESCRIPTIONS, CONDITIONS)
+    sparse_ids = sparse.create_computation(DESCRIPTIONS, CONDITIONS)
+    assert dense_ids == sparse_ids
+
+    for idea_id in dense_ids:
+        a, b = dense.computations[idea_id], sparse.computations[idea_id]
+        assert b.is_sparse
+        assert b.nbytes < a.nbytes
+        np.testing.assert_allclose(b.state_list(), a.state_vector, atol=1e-15)
+        assert b.metadata["complexity"] == pytest.approx(a.metadata["complexity"])
+        assert b.metrics.entropy == pytest.approx(a.metrics.entropy)
+
+    first, second = dense_ids[0], dense_ids[2]
+    for universe in (dense, sparse):
+        universe.ldb_v_operations["idea_crossover"](universe.computations[first], {"other_idea_id": second})
+    assert sparse.computations[first].is_sparse
+    np.testing.assert_allclose(sparse.computations[first].state_list(), dense.computations[first].state_vector,
+                               atol=1e-15)
+    assert sparse.computations[first].similarity(sparse.computations[second]) == pytest.approx(
+        dense.computations[first].similarity(dense.computations[second]))
+
+    # Dense operations densify a sparse state and then follow the dense trajectory
+    plan = ["vector_evolve", "computational_mutate", "complexity_reduce"]
+    expected = dense.execute_computation(second, plan, max_iterations=3)
+    result = sparse.execute_computation(second, plan, max_iterations=3)
+    assert not sparse.computations[second].is_sparse
+    np.testing.assert_allclose(result["final_state"], expected["final_state"], atol=1e-12)
@@ -0,0 +1,151 @@
+"""VectorVirtualMachine, VectorScheduler and VectorMemoryManager"""
+import numpy as np
+import pytest
+
+from simulator.vector_computational_universe import VectorComputationalUniverse
+from simulator.vector_virtual_machine import (VectorVirtualMachine, VectorScheduler, VectorMemoryManager,
+                                              SubspaceExhaustedError)
+
+PLAN = ["vector_evolve", "computational_mutate", "entropy_maximize"]
+
+
+def make_universe(dimensionality: int = 64, seed: int = 7) -> VectorComputationalUniverse:
+    # No refill and no early stopping, so runs depend only on the seed
+    return VectorComputationalUniverse(dimensionality, seed=seed, energy_capacity=1e9, energy_refill_rate=0.0,
+                                       state_tolerance=0.0, complexity_tolerance=0.0)
+
+
+def test_checkpoint_resume_in_new_vm_matches_uninterrupted(tmp_path):
+    vm = VectorVirtualMachine(make_universe(), max_workers=1)
+    reference = vm.create_process("resumable idea", iteration_limit=20)
+    for _ in range(2):
+        vm.execute_process(reference, PLAN, max_iterations=5)
+    expected = vm.get_process_state(reference)
+
+    first = VectorVirtualMachine(make_universe(), max_workers=1)
+    process_id = first.create_process("resumable idea", iteration_limit=20)
+    first.execute_process(process_id, PLAN, max_iterations=5)
+    path = str(tmp_path / "process.ckpt")
+    first.suspend_process(process_id, checkpoint_path=path)
+
+    # A fresh VM over a differently seeded universe: everything comes from the file
+    second = VectorVirtualMachine(make_universe(seed=99), max_workers=1)
+    assert second.resume_process(checkpoint=path) == process_id
+    second.execute_process(process_id, PLAN, max_iterations=5)
+    resumed = second.get_process_state(process_id)
+
+    assert resumed["computation_state"] == expected["computation_state"]
+    assert resumed["accounting"] == expected["accounting"]
+    assert resumed["status"] == expected["status"]
+
+
+def test_allocator_first_fit_coalesces_and_reports_exhaustion():
+    manager = VectorMemoryManager(make_universe(100))
+    a = manager.allocate_resources("a", 10)
+    b = manager.allocate_resources("b", 20)
+    c = manager.allocate_resources("c", 30)
+    assert [a["subspace_start"], b["subspace_start"], c["subspace_start"]] == [0, 10, 30]
+    assert manager.allocate_resources("a", 10) is a
+
+    manager.release_resources("b")
+    assert manager.memory_blocks == {10: 20, 60: 40}
+    assert manager.allocate_resources("d", 15)["subspace_start"] == 10  # First fit reuses the hole
+    manager.release_resources("d")
+    manager.release_resources("a")
+    assert manager.memory_blocks == {0: 30, 60: 40}
+    assert manager.get_stats()["largest_free_block"] == 40
+
+    with pytest.raises(SubspaceExhaustedError):
+        manager.allocate_resources("e", 50)
+    with pytest.raises(SubspaceExhaustedError):
+        manager.allocate_resources("f", 50, block=True, timeout=0.01)
+    assert manager.stats["failures"] == 2
+
+    manager.release_resources("c")
+    assert manager.memory_blocks == {0: 100}
+    assert manager.free_subspaces(25) == 4
+
+
+def test_aging_lets_a_waiting_process_overtake_a_higher_priority():
+    scheduler = VectorScheduler(make_universe(), aging_rate=0.1)
+    scheduler.register_process("old", priority=1.0)
+    for i in range(20):
+        scheduler.register_process(f"filler_{i}", priority=5.0)
+    assert scheduler.schedule_next_batch(20) == [f"filler_{i}" for i in range(20)]
+
+    scheduler.register_process("new", priority=2.5)
+    assert scheduler.effective_priority("old") == pytest.approx(3.0)
+    assert scheduler.effective_priority("new") == pytest.approx(2.5)
+    assert scheduler.schedule_next_batch(2) == ["old", "new"]
+
+
+def test_preempted_process_requeues_behind_waiting_ones():
+    scheduler = VectorScheduler(make_universe(), scheduling_policy="fifo")
+    for process_id in ("a", "b", "c"):
+        scheduler.register_process(process_id, priority=1.0)
+    assert scheduler.schedule_next_batch(1) == ["a"]
+    scheduler.preempt("a")
+    assert scheduler.schedule_next_batch(3) == ["b", "c", "a"]
+    assert scheduler.stats["preempted"] == 1
+    with pytest.raises(ValueError):
+        scheduler.preempt("unknown")
+
+
+def test_time_slice_suspends_and_requeues():
+    vm = VectorVirtualMachine(make_universe(), max_workers=1)
+    process_id = vm.create_process("sliced idea", iteration_limit=6)
+    results = vm.execute_process(process_id, PLAN, max_iterations=4)
+    assert results["iterations"] == 4
+    assert vm.running_processes[process_id]["status"] == "suspended"
+    assert vm.scheduler.schedule_next_batch(1) == [process_id]
+    vm.scheduler.preempt(process_id)
+
+    report = vm.run(PLAN, batch_size=1, time_slice=4)
+    assert vm.running_processes[process_id]["status"] == "completed"
+    assert vm.running_processes[process_id]["iterations_run"] == 6
+    assert report["completed"] == 1
+
+
+def test_run_reports_processes_deferred_for_lack_of_subspace():
+    vm = VectorVirtualMachine(make_universe(100), max_workers=1)  # 100 subspaces of size 1
+    for i in range(100):
+        vm.memory_manager.allocate_resources(f"holder_{i}")
+    process_ids = [vm.create_process(f"deferred idea {i}") for i in range(4)]
+
+    report = vm.run(PLAN, batch_size=4, time_slice=2, max_batches=1)
+    assert (report["dispatched"], report["deferred"], report["completed"]) == (4, 4, 0)
+    assert all(process_id in vm.scheduler.entries for process_id in process_ids)
+
+    vm.memory_manager.release_resources("holder_0")
+    report = vm.run(PLAN, batch_size=4, time_slice=2, max_batches=1)
+    assert (report["deferred"], report["suspended"]) == (0, 4)
+    assert vm.memory_manager.free_subspaces() == 1
+
+
+def run_batch(workers: int, energy: float = None, max_iterations: int = 5):
+    universe = make_universe()
+    vm = VectorVirtualMachine(universe, max_workers=workers)
+    try:
+        process_ids = [vm.create_process(f"parallel idea {i}") for i in range(4)]
+        if energy is not None:
+            universe.energy_budget = energy
+        results = vm.parallel_execute(process_ids, PLAN, max_iterations=max_iterations)
+        return [vm.get_process_state(p)["computation_state"] for p in process_ids], list(results.values())
+    finally:
+        vm.shutdown()
+
+
+def test_parallel_batch_matches_serial():
+    serial_states, serial_results = run_batch(workers=1)
+    parallel_states, parallel_results = run_batch(workers=2)
+    assert parallel_states == serial_states
+    assert ([result["energy_used"] for result in parallel_results] ==
+            pytest.approx([result["energy_used"] for result in serial_results]))
+
+
+def test_parallel_batch_gives_each_process_an_equal_energy_share():
+    _, results = run_batch(workers=2, energy=4 * 50.0, max_iterations=100)
+    energies = [result["energy_used"] for result in results]
+    assert all(result["budget_exhausted"] == "universe_energy" for result in results)
+    # Each process spends its 50 share up to one unaffordable operation
+    assert all(40.0 < energy <= 50.0 for energy in energies)
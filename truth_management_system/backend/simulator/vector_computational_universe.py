@@ -1,7 +1,39 @@
 import numpy as np
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, List, Any, Callable, Optional, Union
 from enum import Enum
-import networkx as nx
+from collections import OrderedDict, deque
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+
+def stable_hash(text: str) -> int:
+    """64-bit BLAKE2b hash of a string, identical across processes and restarts
+
+    Python's hash() is salted per process (PYTHONHASHSEED), so it cannot be
+    used for anything that must agree between workers or survive a restart.
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+# np.fft gained `out=` in numpy 2.0; older releases get the same result
+# through an extra temporary.
+_FFT_HAS_OUT = np.lib.NumpyVersion(np.__version__) >= "2.0.0"
+
+def _fft_into(vector: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """np.fft.fft(vector) written into `out`"""
+    if _FFT_HAS_OUT:
+        return np.fft.fft(vector, out=out)
+    out[...] = np.fft.fft(vector)
+    return out
+
+def _ifft_into(spectrum: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """np.fft.ifft(spectrum) written into `out`"""
+    if _FFT_HAS_OUT:
+        return np.fft.ifft(spectrum, out=out)
+    out[...] = np.fft.ifft(spectrum)
+    return out
 
 class ComputationalState(Enum):
     INITIALIZED = "initialized"
@@ -10,21 +42,719 @@ class ComputationalState(Enum):
     ERROR = "error"
     SUSPENDED = "suspended"
 
+class SparseState:
+    """Immutable index/value form of a mostly-zero state vector
+
+    `indices` are sorted and unique. Instances may be shared (e.g. by the
+    embedding cache), so every operation returns a new SparseState.
+    """
+
+    __slots__ = ("indices", "values", "dimensionality")
+
+    def __init__(self, indices: np.ndarray, values: np.ndarray, dimensionality: int):
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.values = np.asarray(values, dtype=float)
+        self.dimensionality = dimensionality
+
+    @classmethod
+    def from_entries(cls, indices: np.ndarray, values: np.ndarray, dimensionality: int) -> "SparseState":
+        """Build from unsorted entries, summing values at repeated indices"""
+        unique, inverse = np.unique(np.asarray(indices, dtype=np.int64), return_inverse=True)
+        return cls(unique, np.bincount(inverse, weights=values, minlength=len(unique)), dimensionality)
+
+    @classmethod
+    def from_dense(cls, vector: np.ndarray) -> "SparseState":
+        indices = np.flatnonzero(vector)
+        return cls(indices, vector[indices], vector.shape[0])
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    @property
+    def nbytes(self) -> int:
+        return self.indices.nbytes + self.values.nbytes
+
+    def to_dense(self, out: np.ndarray = None) -> np.ndarray:
+        if out is None:
+            out = np.zeros(self.dimensionality)
+        else:
+            out[...] = 0
+        out[self.indices] = self.values
+        return out
+
+    def norm(self) -> float:
+        return float(np.linalg.norm(self.values))
+
+    def dot(self, other: Union["SparseState", np.ndarray]) -> float:
+        """Inner product with another SparseState or a dense vector"""
+        if isinstance(other, SparseState):
+            _, mine, theirs = np.intersect1d(self.indices, other.indices,
+                                             assume_unique=True, return_indices=True)
+            return float(np.dot(self.values[mine], other.values[theirs]))
+        return float(np.dot(self.values, other[self.indices]))
+
+    def scale(self, factor: float) -> "SparseState":
+        return SparseState(self.indices, self.values * factor, self.dimensionality)
+
+    def add_entries(self, indices: np.ndarray, values: np.ndarray) -> "SparseState":
+        """This state plus `values` at `indices` (repeats accumulate)"""
+        return SparseState.from_entries(np.concatenate([self.indices, indices]),
+                                        np.concatenate([self.values, values]),
+                                        self.dimensionality)
+
+    def combine(self, other: "SparseState", weight: float) -> "SparseState":
+        """(1 - weight) * self + weight * other over the union of supports"""
+        return SparseState.from_entries(np.concatenate([self.indices, other.indices]),
+                                        np.concatenate([self.values * (1 - weight), other.values * weight]),
+                                        self.dimensionality)
+
+    def spectrum(self) -> np.ndarray:
+        """DFT of the dense vector
+
+        Every frequency depends on every non-zero, so a direct DFT costs
+        O(nnz*n); an FFT over a temporary dense copy is faster in practice.
+        """
+        return np.fft.fft(self.to_dense())
+
+def _as_dense(state: Union[SparseState, np.ndarray]) -> np.ndarray:
+    return state.to_dense() if isinstance(state, SparseState) else state
+
+class IncrementalMetrics:
+    """Cached spectrum and entropy of a state vector with cheap incremental updates"""
+
+    # Cached twiddle factors exp(-2*pi*i*k/n), one table per dimensionality
+    _twiddles: Dict[int, np.ndarray] = {}
+
+    # Largest change count for which the O(k*n) spectrum update beats a fresh
+    # O(n log n) FFT. Measured at n = 256..4096 the crossover sits at 2-3
+    # entries, so typical mutations (5% of entries) drop the spectrum and
+    # rebuild it lazily; their entropy sums are still updated in O(k).
+    sparse_spectrum_max_changes = 2
+
+    def __init__(self, vector: np.ndarray):
+        self.stats = {"full_recomputes": 0, "sparse_updates": 0, "sparse_spectrum_updates": 0,
+                      "spectrum_recomputes": 0}
+        self.reset(vector)
+
+    @staticmethod
+    def _xlogx(values: np.ndarray) -> np.ndarray:
+        """Elementwise x*log(x) with 0*log(0) = 0"""
+        return values * np.log(np.where(values > 0, values, 1.0))
+
+    @classmethod
+    def _twiddle(cls, n: int) -> np.ndarray:
+        if n not in cls._twiddles:
+            cls._twiddles[n] = np.exp(-2j * np.pi * np.arange(n) / n)
+        return cls._twiddles[n]
+
+    def reset(self, vector: np.ndarray, workspace: np.ndarray = None):
+        """Recompute entropy terms from scratch; the spectrum is rebuilt lazily
+
+        `workspace` is an optional (2, n) float array used instead of temporaries.
+        A SparseState is accepted too; its zeros contribute nothing to either sum.
+        """
+        self.vector = vector
+        if isinstance(vector, SparseState):
+            magnitudes = np.abs(vector.values)
+            self.abs_sum = float(magnitudes.sum())
+            self.abs_log_sum = float(self._xlogx(magnitudes).sum())
+            self.spectrum = None
+            self.stats["full_recomputes"] += 1
+            return
+        if workspace is None:
+            workspace = np.empty((2, vector.shape[0]))
+        magnitudes, logs = workspace[0], workspace[1]
+        np.abs(vector, out=magnitudes)
+        # Entropy of p = |v| / S is log(S) - T / S with S = sum|v|, T = sum |v| log|v|
+        self.abs_sum = float(magnitudes.sum())
+        # 0 * log(tiny) == 0, so clamping avoids a mask for zero entries
+        np.maximum(magnitudes, np.finfo(float).tiny, out=logs)
+        np.log(logs, out=logs)
+        self.abs_log_sum = float(np.dot(magnitudes, logs))
+        self.spectrum = None
+        self.stats["full_recomputes"] += 1
+
+    def update_sparse(self, vector: np.ndarray, indices: np.ndarray,
+                      old_values: np.ndarray, new_values: np.ndarray, scale: float = 1.0):
+        """Account for `vector = scale * (previous with values at indices replaced)`"""
+        old_magnitudes, new_magnitudes = np.abs(old_values), np.abs(new_values)
+        self.abs_sum += float(new_magnitudes.sum() - old_magnitudes.sum())
+        self.abs_log_sum += float(self._xlogx(new_magnitudes).sum() - self._xlogx(old_magnitudes).sum())
+
+        n = vector.shape[0]
+        if self.spectrum is not None and len(indices) <= self.sparse_spectrum_max_changes:
+            exponents = np.multiply.outer(indices, np.arange(n))
+            exponents %= n
+            self.spectrum = self.spectrum + (new_values - old_values) @ self._twiddle(n).take(exponents)
+            self.stats["sparse_spectrum_updates"] += 1
+        else:
+            self.spectrum = None
+
+        if scale != 1.0:
+            # Entropy of |v| is scale-invariant; only the running sums move
+            magnitude = abs(scale)
+            self.abs_log_sum = magnitude * self.abs_log_sum + magnitude * self.abs_sum * np.log(magnitude)
+            self.abs_sum *= magnitude
+            if self.spectrum is not None:
+                self.spectrum = self.spectrum * scale
+
+        self.vector = vector
+        self.stats["sparse_updates"] += 1
+
+    def to_checkpoint(self, arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, Any]:
+        """Header entry for ComputationCheckpoint; a cached spectrum goes into `arrays`"""
+        if self.spectrum is not None:
+            arrays[prefix + "spectrum"] = self.spectrum
+        return {"abs_sum": self.abs_sum, "abs_log_sum": self.abs_log_sum, "stats": dict(self.stats)}
+
+    def restore_checkpoint(self, header: Dict[str, Any], arrays: Dict[str, np.ndarray], prefix: str):
+        """Adopt checkpointed running sums, which incremental updates may have rounded differently"""
+        self.abs_sum = header["abs_sum"]
+        self.abs_log_sum = header["abs_log_sum"]
+        self.stats.update(header["stats"])
+        spectrum = arrays.get(prefix + "spectrum")
+        self.spectrum = None if spectrum is None else np.array(spectrum)
+
+    @property
+    def entropy(self) -> float:
+        """Shannon entropy of the normalized magnitude distribution"""
+        if self.abs_sum <= 0:
+            return 0.0
+        return float(np.log(self.abs_sum) - self.abs_log_sum / self.abs_sum)
+
+    @property
+    def complexity(self) -> float:
+        """Mean spectral magnitude (0 for constant vectors)"""
+        vector = self.vector
+        if isinstance(vector, SparseState):
+            n = vector.dimensionality
+            # Constant means all zeros, or fully populated with one value
+            if n == 0 or vector.nnz == 0 or (vector.nnz == n and np.all(vector.values == vector.values[0])):
+                return 0.0
+            if self.spectrum is None:
+                self.spectrum = vector.spectrum()
+                self.stats["spectrum_recomputes"] += 1
+            return float(np.sum(np.abs(self.spectrum)) / n)
+        if vector.shape[0] == 0 or np.all(vector == vector[0]):
+            return 0.0
+        if self.spectrum is None:
+            self.spectrum = np.fft.fft(vector)
+            self.stats["spectrum_recomputes"] += 1
+        return float(np.sum(np.abs(self.spectrum)) / len(vector))
+
+class RandomStream:
+    """Independent, reproducible random stream that draws in bulk blocks
+
+    Wraps a numpy Generator seeded from a SeedSequence child. Small requests
+    are served from a `block_size` block so they do not each pay the
+    generator call overhead; requests of a block or more are drawn straight
+    into the output. Either way the samples are the generator's sequence in
+    order, so results do not depend on `block_size`.
+    """
+
+    def __init__(self, seed_sequence: np.random.SeedSequence, block_size: int = 1 << 10):
+        self.seed_sequence = seed_sequence
+        self.block_size = block_size
+        # The generator and sample blocks are created on first draw, so
+        # computations that are created in bulk but never run stay cheap
+        self._generator: Optional[np.random.Generator] = None
+        self._uniform: Optional[np.ndarray] = None
+        self._normal: Optional[np.ndarray] = None
+        self._uniform_pos = block_size
+        self._normal_pos = block_size
+        # Generator state before each block was drawn, so checkpoints can
+        # regenerate a block instead of storing it
+        self._origins: Dict[str, Optional[Dict]] = {"uniform": None, "normal": None}
+
+    @property
+    def generator(self) -> np.random.Generator:
+        if self._generator is None:
+            self._generator = np.random.default_rng(self.seed_sequence)
+        return self._generator
+
+    def _take(self, kind: str, block: np.ndarray, pos: int, out: np.ndarray, refill: Callable) -> int:
+        flat = out.reshape(-1)
+        filled = min(flat.size, self.block_size - pos)
+        flat[:filled] = block[pos:pos + filled]
+        pos += filled
+        if flat.size - filled >= self.block_size:
+            refill(out=flat[filled:])
+        elif filled < flat.size:
+            self._origins[kind] = self.generator.bit_generator.state
+            refill(out=block)
+            pos = flat.size - filled
+            flat[filled:] = block[:pos]
+        return pos
+
+    def __getstate__(self):
+        # Ship only the unconsumed tail of each block so that a stream moved to
+        # a worker process continues exactly where it left off
+        return {
+            "seed_sequence": self.seed_sequence,
+            "generator": self._generator,
+            "block_size": self.block_size,
+            "uniform": None if self._uniform is None else self._uniform[self._uniform_pos:].copy(),
+            "normal": None if self._normal is None else self._normal[self._normal_pos:].copy(),
+            "origins": dict(self._origins)
+        }
+
+    def __setstate__(self, state):
+        self.seed_sequence = state["seed_sequence"]
+        self._generator = state["generator"]
+        self.block_size = state["block_size"]
+        # A restored tail keeps its offset within the block, so origins stay valid
+        self._uniform, self._uniform_pos = self._restore_block(state["uniform"])
+        self._normal, self._normal_pos = self._restore_block(state["normal"])
+        self._origins = dict(state.get("origins") or {"uniform": None, "normal": None})
+
+    def _restore_block(self, tail: Optional[np.ndarray]) -> tuple:
+        if tail is None or len(tail) == 0:
+            return None, self.block_size
+        block = np.empty(self.block_size)
+        block[self.block_size - len(tail):] = tail
+        return block, self.block_size - len(tail)
+
+    @staticmethod
+    def _refill_functions(generator: np.random.Generator) -> Dict[str, Callable]:
+        return {"uniform": generator.random, "normal": generator.standard_normal}
+
+    def to_checkpoint(self, arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, Any]:
+        """Header entry for ComputationCheckpoint
+
+        A partly used block is recorded as the generator state it was drawn
+        from plus the read position. Only a block of unknown origin has its
+        unconsumed tail stored in `arrays`.
+        """
+        blocks = {}
+        for kind, block, pos in (("uniform", self._uniform, self._uniform_pos),
+                                 ("normal", self._normal, self._normal_pos)):
+            if block is None or pos == self.block_size:
+                blocks[kind] = None
+                continue
+            blocks[kind] = {"origin": self._origins[kind], "position": pos}
+            if self._origins[kind] is None:
+                arrays[prefix + kind] = block[pos:]
+        sequence = self.seed_sequence
+        entropy = sequence.entropy
+        return {
+            "entropy": entropy if isinstance(entropy, int) else [int(word) for word in entropy],
+            "spawn_key": [int(key) for key in sequence.spawn_key],
+            "pool_size": sequence.pool_size,
+            "n_children_spawned": sequence.n_children_spawned,
+            "bit_generator": None if self._generator is None else self._generator.bit_generator.state,
+            "block_size": self.block_size,
+            "blocks": blocks
+        }
+
+    @classmethod
+    def from_checkpoint(cls, header: Dict[str, Any], arrays: Dict[str, np.ndarray],
+                        prefix: str) -> "RandomStream":
+        sequence = np.random.SeedSequence(header["entropy"], spawn_key=tuple(header["spawn_key"]),
+                                          pool_size=header["pool_size"],
+                                          n_children_spawned=header["n_children_spawned"])
+        stream = cls(sequence, header["block_size"])
+        if header["bit_generator"] is not None:
+            stream.generator.bit_generator.state = header["bit_generator"]
+
+        replay = np.random.default_rng(sequence)
+        for kind, entry in header["blocks"].items():
+            if entry is None:
+                continue
+            block = np.empty(stream.block_size)
+            if entry["origin"] is None:
+                block[entry["position"]:] = arrays[prefix + kind]
+            else:
+                # Draw the block again from the state it was originally drawn from
+                replay.bit_generator.state = entry["origin"]
+                cls._refill_functions(replay)[kind](out=block)
+            stream._origins[kind] = entry["origin"]
+            setattr(stream, f"_{kind}", block)
+            setattr(stream, f"_{kind}_pos", entry["position"])
+        return stream
+
+    def uniform(self, out: np.ndarray) -> np.ndarray:
+        """Fill `out` (contiguous) with uniform [0, 1) samples"""
+        if self._uniform is None:
+            self._uniform = np.empty(self.block_size)
+        self._uniform_pos = self._take("uniform", self._uniform, self._uniform_pos, out,
+                                       self.generator.random)
+        return out
+
+    def standard_normal(self, out: np.ndarray) -> np.ndarray:
+        """Fill `out` (contiguous) with standard normal samples"""
+        if self._normal is None:
+            self._normal = np.empty(self.block_size)
+        self._normal_pos = self._take("normal", self._normal, self._normal_pos, out,
+                                      self.generator.standard_normal)
+        return out
+
+    def normal(self, scale: float, size: int) -> np.ndarray:
+        """Return `size` normal(0, scale) samples"""
+        out = self.standard_normal(np.empty(size))
+        out *= scale
+        return out
+
+class ExecutionTrace:
+    """Compact record of state transitions with configurable retention
+
+    States are stored as float32 rows of a buffer allocated on the first
+    recorded transition and only turned into Python lists when a record is
+    read (e.g. for JSON serialization).
+    Retention modes:
+      "all"   - every transition (buffer grows by doubling, without bound)
+      "none"  - count transitions but keep nothing
+      "every" - every `interval`-th transition
+      "last"  - the most recent `capacity` transitions (ring buffer, the default)
+    """
+
+    RETENTION_MODES = ("all", "none", "every", "last")
+
+    def __init__(self, dimensionality: int, retention: str = "last",
+                 interval: int = 1, capacity: int = 100):
+        if retention not in self.RETENTION_MODES:
+            raise ValueError(f"Unknown trace retention: {retention}")
+        if interval < 1 or capacity < 1:
+            raise ValueError("Trace interval and capacity must be positive")
+
+        self.retention = retention
+        self.dimensionality = dimensionality
+        self.interval = interval if retention == "every" else 1
+        self.steps = 0  # Total transitions seen, recorded or not
+        self._start = 0
+        self._count = 0
+        slots = capacity if retention == "last" else (0 if retention == "none" else 16)
+        self._states: Optional[np.ndarray] = None
+        self._records: List[Optional[Dict]] = [None] * slots
+
+    def should_record(self) -> bool:
+        """Whether the next transition will be stored"""
+        return self.retention != "none" and self.steps % self.interval == 0
+
+    def append(self, from_state: np.ndarray, to_state: np.ndarray,
+               transformation: str, parameters: Dict, entropy_change: float):
+        """Record a transition (subject to the retention policy)"""
+        step = self.steps
+        self.steps += 1
+        if self.retention == "none" or step % self.interval:
+            return
+
+        capacity = len(self._records)
+        if self._states is None:
+            self._states = np.empty((capacity, 2, self.dimensionality), dtype=np.float32)
+        if self.retention == "last":
+            if self._count < capacity:
+                slot = (self._start + self._count) % capacity
+                self._count += 1
+            else:
+                # Overwrite the oldest transition
+                slot = self._start
+                self._start = (self._start + 1) % capacity
+        else:
+            if self._count == capacity:
+                self._states = np.concatenate([self._states, np.empty_like(self._states)])
+                self._records.extend([None] * capacity)
+            slot = self._count
+            self._count += 1
+
+        self._states[slot, 0] = from_state
+        self._states[slot, 1] = to_state
+        self._records[slot] = {
+            "step": step,
+            "transformation": transformation,
+            "parameters": parameters,
+            "entropy_change": entropy_change
+        }
+
+    def _slot(self, index: int) -> int:
+        return (self._start + index) % len(self._records)
+
+    def _record(self, index: int) -> Dict[str, Any]:
+        slot = self._slot(index)
+        return {
+            **self._records[slot],
+            "from_state": self._states[slot, 0].tolist(), # Convert to list for JSON
+            "to_state": self._states[slot, 1].tolist()
+        }
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._record(i) for i in range(self._count)[key]]
+        return self._record(range(self._count)[key])
+
+    def __iter__(self):
+        return (self._record(i) for i in range(self._count))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """All retained transitions as JSON-serializable dicts"""
+        return list(self)
+
+    def states(self) -> np.ndarray:
+        """Retained (from, to) state pairs in chronological order, shape (n, 2, dim)"""
+        if self._states is None:
+            return np.empty((0, 2, self.dimensionality), dtype=np.float32)
+        order = [self._slot(i) for i in range(self._count)]
+        return self._states[order]
+
+    @property
+    def nbytes(self) -> int:
+        return 0 if self._states is None else self._states.nbytes
+
+    def to_checkpoint(self, arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, Any]:
+        """Header entry for ComputationCheckpoint; retained states go into `arrays`"""
+        arrays[prefix + "states"] = self.states()
+        return {
+            "dimensionality": self.dimensionality,
+            "retention": self.retention,
+            "interval": self.interval,
+            "slots": len(self._records),
+            "steps": self.steps,
+            "records": [self._records[self._slot(i)] for i in range(self._count)]
+        }
+
+    @classmethod
+    def from_checkpoint(cls, header: Dict[str, Any], arrays: Dict[str, np.ndarray],
+                        prefix: str) -> "ExecutionTrace":
+        # Retained transitions are restored in chronological order from slot 0
+        trace = cls(header["dimensionality"], header["retention"], header["interval"],
+                    max(1, header["slots"]))
+        records = header["records"]
+        trace.steps = header["steps"]
+        trace._count = len(records)
+        trace._records = records + [None] * (header["slots"] - len(records))
+        if records:
+            trace._states = np.empty((header["slots"], 2, header["dimensionality"]), dtype=np.float32)
+            trace._states[:len(records)] = arrays[prefix + "states"]
+        return trace
+
+class EnergyBucket:
+    """Token bucket holding the universe's computational energy
+
+    Operations consume tokens; the bucket refills continuously at
+    `refill_rate` energy per second up to `capacity`.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float = 0.0):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self.stats = {"consumed": 0.0, "refilled": 0.0, "denied": 0}
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.refill_rate > 0 and self.tokens < self.capacity:
+            added = min(self.capacity - self.tokens, (now - self._last_refill) * self.refill_rate)
+            self.tokens += added
+            self.stats["refilled"] += added
+        self._last_refill = now
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self.tokens
+
+    def try_consume(self, amount: float) -> bool:
+        """Take `amount` tokens if they are all available"""
+        with self._lock:
+            self._refill()
+            if self.tokens < amount:
+                self.stats["denied"] += 1
+                return False
+            self.tokens -= amount
+            self.stats["consumed"] += amount
+            return True
+
+    def consume(self, amount: float):
+        """Take up to `amount` tokens unconditionally (for energy already spent elsewhere)"""
+        with self._lock:
+            self._refill()
+            taken = min(self.tokens, amount)
+            self.tokens -= taken
+            self.stats["consumed"] += taken
+
+    def reset(self, tokens: float):
+        """Set the current level, raising capacity if needed"""
+        with self._lock:
+            self.capacity = max(self.capacity, tokens)
+            self.tokens = tokens
+            self._last_refill = time.monotonic()
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (inf if never)"""
+        missing = min(amount, self.capacity) - self.available
+        if missing <= 0:
+            return 0.0
+        return missing / self.refill_rate if self.refill_rate > 0 else float("inf")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "available": self.available, "capacity": self.capacity,
+                "refill_rate": self.refill_rate}
+
+class ConvergenceMonitor:
+    """Rolling window of per-iteration state deltas and complexity
+
+    A computation is converged once the window is full, every relative state
+    change in it is below `state_tolerance` and the complexity spread across
+    it is below `complexity_tolerance`.
+    """
+
+    def __init__(self, window: int = 3, state_tolerance: float = 1e-3,
+                 complexity_tolerance: float = 1e-3):
+        if window < 1:
+            raise ValueError("Convergence window must be positive")
+        self.window = window
+        self.state_tolerance = state_tolerance
+        self.complexity_tolerance = complexity_tolerance
+        self.deltas = deque(maxlen=window)
+        self.complexities = deque(maxlen=window)
+        self._last_state: Optional[np.ndarray] = None
+
+    def observe(self, state: Union[SparseState, np.ndarray], complexity: float) -> bool:
+        """Record one iteration's outcome and return whether converged"""
+        state = _as_dense(state)
+        if self._last_state is not None:
+            norm = np.linalg.norm(self._last_state)
+            self.deltas.append(float(np.linalg.norm(state - self._last_state) / (norm + 1e-10)))
+            self._last_state[...] = state
+        else:
+            self._last_state = np.array(state, dtype=float)
+        self.complexities.append(complexity)
+        return self.converged
+
+    @property
+    def converged(self) -> bool:
+        if len(self.deltas) < self.window:
+            return False
+        return (max(self.deltas) < self.state_tolerance and
+                max(self.complexities) - min(self.complexities) < self.complexity_tolerance)
+
+    def reset(self):
+        self.deltas.clear()
+        self.complexities.clear()
+        self._last_state = None
+
+    def to_checkpoint(self, arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, Any]:
+        """Header entry for ComputationCheckpoint; the last state goes into `arrays`"""
+        if self._last_state is not None:
+            arrays[prefix + "last_state"] = self._last_state
+        return {
+            "window": self.window,
+            "state_tolerance": self.state_tolerance,
+            "complexity_tolerance": self.complexity_tolerance,
+            "deltas": list(self.deltas),
+            "complexities": list(self.complexities)
+        }
+
+    @classmethod
+    def from_checkpoint(cls, header: Dict[str, Any], arrays: Dict[str, np.ndarray],
+                        prefix: str) -> "ConvergenceMonitor":
+        monitor = cls(header["window"], header["state_tolerance"], header["complexity_tolerance"])
+        monitor.deltas.extend(header["deltas"])
+        monitor.complexities.extend(header["complexities"])
+        if prefix + "last_state" in arrays:
+            monitor._last_state = np.array(arrays[prefix + "last_state"], dtype=float)
+        return monitor
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "window": self.window,
+            "state_deltas": list(self.deltas),
+            "complexity_window": list(self.complexities),
+            "converged": self.converged
+        }
+
 class VectorComputation:
-    """A computational idea represented in vector space"""
+    """A computational idea represented in vector space
 
-    def __init__(self, idea_id: str, initial_state_vector: np.ndarray):
+    The initial state may be a SparseState. The computation then stays sparse
+    (sparse-aware operations keep it so) until something reads `state_vector`,
+    which densifies it for good.
+    """
+
+    def __init__(self, idea_id: str, initial_state_vector: Union[SparseState, np.ndarray],
+                 execution_trace: ExecutionTrace = None,
+                 convergence: ConvergenceMonitor = None,
+                 rng: RandomStream = None,
+                 complexity: Optional[float] = None):
         self.idea_id = idea_id
-        self.state_vector = initial_state_vector  # Current computational state
-        self.execution_trace = []  # History of state transitions
+        # Current computational state: exactly one of the two is set
+        if isinstance(initial_state_vector, SparseState):
+            self.sparse_state, self._dense_state = initial_state_vector, None
+            dimensionality = initial_state_vector.dimensionality
+        else:
+            self.sparse_state, self._dense_state = None, initial_state_vector
+            dimensionality = initial_state_vector.shape[0]
+        # History of state transitions
+        if execution_trace is None:
+            execution_trace = ExecutionTrace(dimensionality)
+        self.execution_trace = execution_trace
+        # Back buffer that in-place operations write the next state into (allocated on first use)
+        self._next_state: Optional[np.ndarray] = None
+        self.convergence = convergence or ConvergenceMonitor()
+        self.rng = rng or RandomStream(np.random.SeedSequence())
         self.dependencies = []  # Other computations this depends on
         self.resources = {}  # Computational resources allocated
+        self.metrics = IncrementalMetrics(initial_state_vector)
         self.metadata = {
             "created_at": np.datetime64('now').astype(str), # Convert to string for JSON serialization
-            "complexity": self._calculate_complexity(initial_state_vector),
-            "dimensionality": initial_state_vector.shape[0]
+            # Bulk creators may pass a precomputed (batched) complexity
+            "complexity": self.metrics.complexity if complexity is None else complexity,
+            "dimensionality": dimensionality
         }
 
+    @property
+    def state_vector(self) -> np.ndarray:
+        """Dense current state; densifies a sparse computation"""
+        if self._dense_state is None:
+            self._dense_state = self.sparse_state.to_dense()
+            self.sparse_state = None
+            # Same vector, so a cached spectrum stays valid
+            self.metrics.vector = self._dense_state
+        return self._dense_state
+
+    @state_vector.setter
+    def state_vector(self, vector: np.ndarray):
+        self._dense_state, self.sparse_state = vector, None
+
+    @property
+    def is_sparse(self) -> bool:
+        return self.sparse_state is not None
+
+    @property
+    def state(self) -> Union[SparseState, np.ndarray]:
+        """Current state in whichever form it is held, without densifying"""
+        return self.sparse_state if self.sparse_state is not None else self._dense_state
+
+    def state_list(self) -> List[float]:
+        """Current state as a JSON-serializable list, without densifying"""
+        return _as_dense(self.state).tolist()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the state, its back buffer and the trace"""
+        state = self.sparse_state.nbytes if self.is_sparse else self._dense_state.nbytes
+        buffer = 0 if self._next_state is None else self._next_state.nbytes
+        return state + buffer + self.execution_trace.nbytes
+
+    def similarity(self, other: "VectorComputation") -> float:
+        """Cosine similarity of the two current states, computed without densifying"""
+        mine, theirs = self.state, other.state
+        if isinstance(mine, SparseState):
+            dot = mine.dot(theirs)
+        elif isinstance(theirs, SparseState):
+            dot = theirs.dot(mine)
+        else:
+            dot = float(np.dot(mine, theirs))
+        norms = [state.norm() if isinstance(state, SparseState) else float(np.linalg.norm(state))
+                 for state in (mine, theirs)]
+        return dot / (norms[0] * norms[1] + 1e-10)
+
     def _calculate_complexity(self, vector: np.ndarray) -> float:
         """Calculate computational complexity based on vector properties"""
         # More complex ideas have higher entropy in their state vectors
@@ -32,49 +762,637 @@ class VectorComputation:
             return 0.0
         return float(np.sum(np.abs(np.fft.fft(vector))) / len(vector))
 
-    def evolve_state(self, transformation: Callable, parameters: Dict = None):
-        """Evolve the computational idea using LDB-V operations"""
-        previous_state = self.state_vector.copy()
+    def evolve_state(self, transformation: Callable, parameters: Dict = None,
+                     sparse_update: tuple = None):
+        """Evolve the computational idea using LDB-V operations
+
+        `sparse_update` is an optional (indices, increments, scale) tuple stating
+        that the new state is `scale * (state + increments at indices)`, which
+        lets the cached metrics update without a full recompute.
+        """
+        # Only pay for a copy of the old state when the trace will keep it
+        record = self.execution_trace.should_record()
+        previous_state = self.state_vector.copy() if record else self.state_vector
+        if sparse_update is not None:
+            indices, increments, scale = sparse_update
+            old_values = self.state_vector[indices]
 
         try:
             # Apply transformation (LDB-V operation)
             new_state = transformation(self.state_vector, **(parameters or {}))
+            old_entropy = self.metrics.entropy
+            if sparse_update is not None:
+                self.metrics.update_sparse(new_state, indices, old_values, old_values + increments, scale)
+            else:
+                self.metrics.reset(new_state)
             self.state_vector = new_state
 
             # Record transition
-            transition = {
-                "from_state": previous_state.tolist(), # Convert to list for JSON
-                "to_state": new_state.tolist(),       # Convert to list for JSON
-                "transformation": transformation.__name__,
-                "parameters": parameters,
-                "entropy_change": self._calculate_entropy_change(previous_state, new_state)
-            }
-            self.execution_trace.append(transition)
+            self.execution_trace.append(
+                previous_state, new_state,
+                transformation=transformation.__name__,
+                parameters=parameters,
+                entropy_change=self.metrics.entropy - old_entropy
+            )
 
         except Exception as e:
             self.metadata["error"] = str(e)
             raise
 
+    def next_state_buffer(self) -> np.ndarray:
+        """Buffer for an operation to write the next state into (see commit_state)"""
+        if self._next_state is None or self._next_state.shape != self.state_vector.shape:
+            self._next_state = np.empty_like(self.state_vector, dtype=float)
+        return self._next_state
+
+    def commit_state(self, operation: str, parameters: Dict = None,
+                     sparse_update: tuple = None, workspace: np.ndarray = None):
+        """Make the filled next_state_buffer() the current state
+
+        The two state buffers are swapped rather than copied, so the previous
+        state stays readable until the next operation writes over it. Holders
+        of a reference to `state_vector` should copy it if they need it longer.
+        `sparse_update` is as for evolve_state.
+        """
+        previous_state, new_state = self.state_vector, self.next_state_buffer()
+        old_entropy = self.metrics.entropy
+        if sparse_update is not None:
+            indices, increments, scale = sparse_update
+            old_values = previous_state[indices]
+            self.metrics.update_sparse(new_state, indices, old_values, old_values + increments, scale)
+        else:
+            self.metrics.reset(new_state, workspace)
+        self.state_vector, self._next_state = new_state, previous_state
+
+        self.execution_trace.append(
+            previous_state, new_state,
+            transformation=operation,
+            parameters=parameters,
+            entropy_change=self.metrics.entropy - old_entropy
+        )
+
+    def commit_sparse_state(self, new_state: SparseState, operation: str, parameters: Dict = None):
+        """Replace a sparse current state with `new_state`, keeping it sparse"""
+        previous_state = self.sparse_state
+        old_entropy = self.metrics.entropy
+        self.metrics.reset(new_state)
+        self.sparse_state = new_state
+
+        # Dense copies are only materialized when the trace keeps them
+        if self.execution_trace.should_record():
+            self.execution_trace.append(previous_state.to_dense(), new_state.to_dense(),
+                                        operation, parameters, self.metrics.entropy - old_entropy)
+        else:
+            self.execution_trace.append(None, None, operation, parameters,
+                                        self.metrics.entropy - old_entropy)
+
     def _calculate_entropy_change(self, old_state: np.ndarray, new_state: np.ndarray) -> float:
         """Calculate information entropy change during state transition"""
-        # Ensure states are normalized and non-negative for entropy calculation
-        old_state_norm = old_state / (np.sum(old_state) + 1e-10)
-        new_state_norm = new_state / (np.sum(new_state) + 1e-10)
+        return IncrementalMetrics(new_state).entropy - IncrementalMetrics(old_state).entropy
+
+    def to_checkpoint(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Header entry for ComputationCheckpoint; state arrays go into `arrays`"""
+        if self.is_sparse:
+            arrays["state.indices"] = self.sparse_state.indices
+            arrays["state.values"] = self.sparse_state.values
+        else:
+            arrays["state"] = self._dense_state
+        return {
+            "idea_id": self.idea_id,
+            "sparse": self.is_sparse,
+            "dimensionality": self.metadata["dimensionality"],
+            "metadata": self.metadata,
+            "dependencies": self.dependencies,
+            "resources": self.resources,
+            "metrics": self.metrics.to_checkpoint(arrays, "metrics."),
+            "rng": self.rng.to_checkpoint(arrays, "rng."),
+            "convergence": self.convergence.to_checkpoint(arrays, "convergence."),
+            "trace": self.execution_trace.to_checkpoint(arrays, "trace.")
+        }
+
+    @classmethod
+    def from_checkpoint(cls, header: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> "VectorComputation":
+        if header["sparse"]:
+            state = SparseState(arrays["state.indices"], arrays["state.values"], header["dimensionality"])
+        else:
+            state = np.array(arrays["state"], dtype=float)
+        computation = cls(header["idea_id"], state,
+                          ExecutionTrace.from_checkpoint(header["trace"], arrays, "trace."),
+                          ConvergenceMonitor.from_checkpoint(header["convergence"], arrays, "convergence."),
+                          RandomStream.from_checkpoint(header["rng"], arrays, "rng."),
+                          header["metadata"]["complexity"])
+        computation.metrics.restore_checkpoint(header["metrics"], arrays, "metrics.")
+        computation.metadata = dict(header["metadata"])
+        computation.dependencies = list(header["dependencies"])
+        computation.resources = dict(header["resources"])
+        return computation
+
+def _json_default(value):
+    # numpy scalars and arrays can turn up in operation parameters
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+class ComputationCheckpoint:
+    """Snapshot of a computation, optionally with the unfinished run it was taken in
+
+    Covers the state, RNG stream (generator state and unconsumed sample
+    blocks), metrics, convergence window and execution trace cursors, so a
+    restored computation continues bit-exactly. Serialized as an uncompressed
+    .npz archive: one raw npy member per array plus a JSON header member.
+    Python floats round-trip exactly through JSON.
+    """
 
-        old_entropy = -np.sum(old_state_norm * np.log(old_state_norm + 1e-10))
-        new_entropy = -np.sum(new_state_norm * np.log(new_state_norm + 1e-10))
-        return new_entropy - old_entropy
+    VERSION = 1
+
+    def __init__(self, header: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.header = header
+        self.arrays = arrays
+
+    @property
+    def idea_id(self) -> str:
+        return self.header["computation"]["idea_id"]
+
+    @property
+    def run(self) -> Optional[Dict[str, Any]]:
+        """Progress of the execute_computation run, if taken mid-run"""
+        return self.header.get("run")
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(self.header, default=_json_default).encode("utf-8")
+        buffer = io.BytesIO()
+        np.savez(buffer, __header__=np.frombuffer(header, dtype=np.uint8), **self.arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ComputationCheckpoint":
+        with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+            header = json.loads(archive["__header__"].tobytes().decode("utf-8"))
+            arrays = {name: archive[name] for name in archive.files if name != "__header__"}
+        if header.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {header.get('version')}")
+        return cls(header, arrays)
+
+    def save(self, path: str):
+        """Write atomically, so a crash mid-write leaves the previous checkpoint intact"""
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as handle:
+            handle.write(self.to_bytes())
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ComputationCheckpoint":
+        with open(path, "rb") as handle:
+            return cls.from_bytes(handle.read())
+
+class LineageGraph:
+    """Append-only directed lineage graph backed by CSR arrays
+
+    Nodes are idea ids mapped to dense integer indices. Edges are appended to
+    growable int arrays and compressed into CSR form (forward and reverse)
+    only when a query needs it, so bulk appends stay cheap. Edge direction
+    follows networkx conventions: descendants are reachable along edges,
+    ancestors reach the node.
+    """
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}  # node -> dense index
+        self.nodes: List[str] = []
+        self._src = np.empty(64, dtype=np.int64)
+        self._dst = np.empty(64, dtype=np.int64)
+        self._edge_count = 0
+        self._csr = None  # (indptr, indices, reverse indptr, reverse indices), rebuilt lazily
+        self._depths = None  # Per-node depth (see depth()), recomputed with the CSR
+
+    def add_node(self, node: str) -> int:
+        if node not in self.index:
+            self.index[node] = len(self.nodes)
+            self.nodes.append(node)
+            self._csr = self._depths = None
+        return self.index[node]
+
+    def add_edge(self, source: str, target: str):
+        self.add_edges([(source, target)])
+
+    def add_edges(self, edges: List[tuple]):
+        """Append many (source, target) edges at once; unknown nodes are added"""
+        pairs = np.array([(self.add_node(u), self.add_node(v)) for u, v in edges], dtype=np.int64)
+        if pairs.size == 0:
+            return
+        needed = self._edge_count + len(pairs)
+        if needed > len(self._src):
+            capacity = max(needed, 2 * len(self._src))
+            self._src = np.resize(self._src, capacity)
+            self._dst = np.resize(self._dst, capacity)
+        self._src[self._edge_count:needed] = pairs[:, 0]
+        self._dst[self._edge_count:needed] = pairs[:, 1]
+        self._edge_count = needed
+        self._csr = self._depths = None
+
+    def _build(self):
+        n = len(self.nodes)
+        # Deduplicate edges like a DiGraph would
+        keys = np.unique(self._src[:self._edge_count] * n + self._dst[:self._edge_count])
+        src, dst = keys // n, keys % n
+
+        def compress(rows, cols):
+            order = np.argsort(rows, kind="stable")
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+            return indptr, cols[order]
+
+        self._csr = compress(src, dst) + compress(dst, src)
+
+    def _neighbours(self, frontier: np.ndarray, reverse: bool) -> np.ndarray:
+        if self._csr is None:
+            self._build()
+        indptr, indices = self._csr[2:] if reverse else self._csr[:2]
+        starts, lengths = indptr[frontier], indptr[frontier + 1] - indptr[frontier]
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        # Gather every frontier node's CSR slice in one indexing operation
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+        return indices[offsets]
+
+    def _bfs(self, node: str, reverse: bool) -> np.ndarray:
+        """Indices reachable from `node`"""
+        visited = np.zeros(len(self.nodes), dtype=bool)
+        visited[self.index[node]] = True
+        frontier = np.array([self.index[node]], dtype=np.int64)
+        while True:
+            reached = self._neighbours(frontier, reverse)
+            frontier = np.unique(reached[~visited[reached]])
+            if frontier.size == 0:
+                break
+            visited[frontier] = True
+        visited[self.index[node]] = False
+        return np.flatnonzero(visited)
+
+    def successors(self, node: str) -> List[str]:
+        return [self.nodes[i] for i in np.unique(self._neighbours(np.array([self.index[node]]), False))]
+
+    def predecessors(self, node: str) -> List[str]:
+        return [self.nodes[i] for i in np.unique(self._neighbours(np.array([self.index[node]]), True))]
+
+    def descendants(self, node: str) -> set:
+        return {self.nodes[i] for i in self._bfs(node, reverse=False)}
+
+    def ancestors(self, node: str) -> set:
+        return {self.nodes[i] for i in self._bfs(node, reverse=True)}
+
+    def depth(self, node: str) -> int:
+        """Generations back to the most distant ancestor (0 for a root)
+
+        This is the longest path over ancestors, not the shortest. Lineage
+        may contain cycles (mutual crossover adds A -> B and B -> A), so it
+        is measured on the condensation: the ideas of a cycle count as one
+        generation. Depths of all nodes are computed together in O(V + E)
+        and cached until the graph changes.
+        """
+        if self._depths is None:
+            self._depths = self._condensation_depths()
+        return int(self._depths[self.index[node]])
+
+    def _components(self) -> np.ndarray:
+        """Strongly connected component of every node (iterative Tarjan)"""
+        indptr, indices = (array.tolist() for array in self._csr[:2])
+        n = len(self.nodes)
+        order, low, component = [-1] * n, [0] * n, [-1] * n
+        stack, on_stack = [], [False] * n
+        counter = components = 0
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, indptr[root])]
+            while work:
+                v, edge = work[-1]
+                if edge < indptr[v + 1]:
+                    work[-1] = (v, edge + 1)
+                    w = indices[edge]
+                    if order[w] == -1:
+                        order[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, indptr[w]))
+                    elif on_stack[w]:
+                        low[v] = min(low[v], order[w])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == order[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = components
+                        if w == v:
+                            break
+                    components += 1
+        return np.array(component, dtype=np.int64)
+
+    def _condensation_depths(self) -> np.ndarray:
+        """Longest-path depth of every node over the DAG of its components
+
+        Kahn's algorithm layer by layer: a component is released once all of
+        its parent components are, so its layer is one more than the deepest.
+        """
+        if self._csr is None:
+            self._build()
+        n = len(self.nodes)
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+        component = self._components()
+        count = int(component.max()) + 1
+        indptr, indices = self._csr[:2]
+        src = component[np.repeat(np.arange(n), np.diff(indptr))]
+        dst = component[indices]
+        keys = np.unique(src[src != dst] * count + dst[src != dst])
+        src, dst = keys // count, keys % count
+
+        order = np.argsort(src, kind="stable")
+        out_ptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=count), out=out_ptr[1:])
+        out = dst[order]
+        in_degree = np.bincount(dst, minlength=count)
+        levels = np.zeros(count, dtype=np.int64)
+        frontier = np.flatnonzero(in_degree == 0)
+        layer = 0
+        while frontier.size:
+            levels[frontier] = layer
+            starts, lengths = out_ptr[frontier], out_ptr[frontier + 1] - out_ptr[frontier]
+            reached = out[np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(int(lengths.sum()))]
+            in_degree -= np.bincount(reached, minlength=count)
+            frontier = np.unique(reached[in_degree[reached] == 0])
+            layer += 1
+        return levels[component]
+
+    def has_edge(self, source: str, target: str) -> bool:
+        return source in self.index and target in self.successors(source)
+
+    def number_of_edges(self) -> int:
+        if self._csr is None:
+            self._build()
+        return len(self._csr[1])
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.index
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def to_networkx(self, node_attributes: Dict[str, Dict] = None):
+        """Export as a networkx.DiGraph (networkx is imported only here)"""
+        import networkx as nx
+
+        if self._csr is None:
+            self._build()
+        graph = nx.DiGraph()
+        node_attributes = node_attributes or {}
+        graph.add_nodes_from((node, node_attributes.get(node, {})) for node in self.nodes)
+        indptr, indices = self._csr[:2]
+        sources = np.repeat(np.arange(len(self.nodes)), np.diff(indptr))
+        graph.add_edges_from((self.nodes[u], self.nodes[v]) for u, v in zip(sources, indices))
+        return graph
+
+class LRUCache:
+    """Small least-recently-used mapping with hit/miss counters"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.stats["hits"] += 1
+            return self._data[key]
+        self.stats["misses"] += 1
+        return default
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.capacity:
+            self._data.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class FeatureHashingEmbedder:
+    """Batched feature-hashing text embedder
+
+    A description's vector has weight 1/(i+1) at stable_hash(word_i) mod dim,
+    and is L2-normalized. A batch is tokenized once and its (row, position)
+    entries are summed and normalized row-wise together. Token positions and
+    whole-description embeddings are LRU cached, the latter as SparseStates.
+    """
+
+    def __init__(self, dimensionality: int, token_cache_size: int = 1 << 16,
+                 embedding_cache_size: int = 1 << 12):
+        self.dimensionality = dimensionality
+        self.token_positions = LRUCache(token_cache_size)
+        self.embeddings = LRUCache(embedding_cache_size)
+
+    def _position(self, token: str) -> int:
+        position = self.token_positions.get(token)
+        if position is None:
+            position = stable_hash(token) % self.dimensionality
+            self.token_positions.put(token, position)
+        return position
+
+    def _embed_words(self, descriptions: List[str]) -> List[SparseState]:
+        """Normalized word embeddings of the descriptions (without conditions)"""
+        states = [self.embeddings.get(description) for description in descriptions]
+        pending = [row for row, state in enumerate(states) if state is None]
+        if not pending:
+            return states
+
+        rows, positions, weights = [], [], []
+        for k, row in enumerate(pending):
+            words = descriptions[row].lower().split()
+            rows.extend([k] * len(words))
+            positions.extend(self._position(word) for word in words)
+            weights.extend(1.0 / np.arange(1, len(words) + 1))  # Decreasing influence for later words
+
+        keys, inverse = np.unique(np.asarray(rows, dtype=np.int64) * self.dimensionality +
+                                  np.asarray(positions, dtype=np.int64), return_inverse=True)
+        # bincount returns ints when there are no entries (only empty descriptions)
+        values = np.bincount(inverse, weights=np.asarray(weights, dtype=float),
+                             minlength=len(keys)).astype(float, copy=False)
+        key_rows = keys // self.dimensionality
+        norms = np.sqrt(np.bincount(key_rows, weights=values * values, minlength=len(pending)))
+        values /= np.where(norms > 0, norms, 1.0)[key_rows]
+
+        # Keys are sorted, so each description's entries are one contiguous run
+        bounds = np.searchsorted(key_rows, np.arange(len(pending) + 1))
+        for k, row in enumerate(pending):
+            lo, hi = bounds[k], bounds[k + 1]
+            state = SparseState(keys[lo:hi] % self.dimensionality, values[lo:hi].copy(), self.dimensionality)
+            self.embeddings.put(descriptions[row], state)
+            states[row] = state
+        return states
+
+    def _condition_entries(self, row_conditions: Optional[Dict]) -> tuple:
+        items = list((row_conditions or {}).items())
+        return (np.array([self._position(str(key)) for key, _ in items], dtype=np.int64),
+                np.array([float(value) * 0.1 for _, value in items]))
+
+    def embed_batch(self, descriptions: List[str], conditions: List[Optional[Dict]] = None) -> np.ndarray:
+        """Embed descriptions into a fresh (len(descriptions) x dim) matrix"""
+        conditions = conditions or [None] * len(descriptions)
+        states = self._embed_words(descriptions)
+        matrix = np.zeros((len(descriptions), self.dimensionality))
+        rows = np.repeat(np.arange(len(states)), [state.nnz for state in states])
+        if len(rows):
+            matrix[rows, np.concatenate([state.indices for state in states])] = \
+                np.concatenate([state.values for state in states])
+
+        # Apply initial conditions if provided
+        for row, row_conditions in enumerate(conditions):
+            for key, value in (row_conditions or {}).items():
+                matrix[row, self._position(str(key))] += float(value) * 0.1
+
+        return matrix
+
+    def embed_batch_sparse(self, descriptions: List[str],
+                           conditions: List[Optional[Dict]] = None) -> List[SparseState]:
+        """Embed descriptions as SparseStates (same values as embed_batch)"""
+        conditions = conditions or [None] * len(descriptions)
+        states = self._embed_words(descriptions)
+        return [state.add_entries(*self._condition_entries(row_conditions)) if row_conditions else state
+                for state, row_conditions in zip(states, conditions)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "token_cache": {**self.token_positions.stats, "size": len(self.token_positions)},
+            "embedding_cache": {**self.embeddings.stats, "size": len(self.embeddings)}
+        }
+
+def _batch_complexity(states: np.ndarray) -> np.ndarray:
+    """Row-wise IncrementalMetrics.complexity for an (N x dim) matrix"""
+    complexity = np.abs(np.fft.fft(states, axis=1)).sum(axis=1) / states.shape[1]
+    complexity[np.std(states, axis=1) == 0] = 0.0
+    return complexity
+
+def _sparse_batch_complexity(states: List[SparseState], dimensionality: int,
+                             chunk: int = 256) -> np.ndarray:
+    """_batch_complexity of sparse states, densified one chunk at a time"""
+    complexity = np.empty(len(states))
+    block = np.empty((min(chunk, len(states)), dimensionality))
+    for start in range(0, len(states), chunk):
+        rows = states[start:start + chunk]
+        for row, state in zip(block, rows):
+            state.to_dense(out=row)
+        complexity[start:start + len(rows)] = _batch_complexity(block[:len(rows)])
+    return complexity
+
+def _normalize_rows(states: np.ndarray) -> np.ndarray:
+    return states / (np.linalg.norm(states, axis=1, keepdims=True) + 1e-10)
+
+class PopulationConvergence:
+    """ConvergenceMonitor over the rows of a population matrix"""
+
+    def __init__(self, size: int, window: int = 3, state_tolerance: float = 1e-3,
+                 complexity_tolerance: float = 1e-3):
+        self.window = window
+        self.state_tolerance = state_tolerance
+        self.complexity_tolerance = complexity_tolerance
+        self.deltas = np.full((window, size), np.inf)
+        self.complexities = np.full((window, size), np.nan)
+        self.observations = 0
+        self._last_states: Optional[np.ndarray] = None
+
+    def observe(self, states: np.ndarray, complexities: np.ndarray) -> np.ndarray:
+        """Record one iteration for every row and return the converged mask"""
+        slot = self.observations % self.window
+        if self._last_states is not None:
+            norms = np.linalg.norm(self._last_states, axis=1)
+            self.deltas[slot] = np.linalg.norm(states - self._last_states, axis=1) / (norms + 1e-10)
+            self._last_states[...] = states
+        else:
+            self._last_states = states.copy()
+        self.complexities[slot] = complexities
+        self.observations += 1
+        return self.converged
+
+    @property
+    def converged(self) -> np.ndarray:
+        if self.observations <= self.window:
+            return np.zeros(self.deltas.shape[1], dtype=bool)
+        spread = self.complexities.max(axis=0) - self.complexities.min(axis=0)
+        return ((self.deltas.max(axis=0) < self.state_tolerance) &
+                (spread < self.complexity_tolerance))
 
 class VectorComputationalUniverse:
     """The main environment for simulating computational ideas"""
 
-    def __init__(self, dimensionality: int = 1024):
+    # Base energy cost per LDB-V operation, scaled by (1 + complexity)
+    OPERATION_COSTS = {
+        "vector_evolve": 1.0,
+        "idea_crossover": 2.0,
+        "computational_mutate": 1.5,
+        "state_superpose": 3.0,
+        "entropy_maximize": 2.5,
+        "complexity_reduce": 2.0,
+        "convergence_check": 0.5 # Cheaper to check than to execute
+    }
+
+    def __init__(self, dimensionality: int = 1024, trace_retention: str = "last",
+                 trace_interval: int = 1, trace_capacity: int = 100,
+                 convergence_window: int = 3, state_tolerance: float = 1e-3,
+                 complexity_tolerance: float = 1e-3, seed: Optional[int] = None,
+                 energy_capacity: float = 1000.0, energy_refill_rate: float = 100.0,
+                 sparse_states: bool = False):
         self.dimensionality = dimensionality
+        # Create computations with SparseState initial states (see VectorComputation)
+        self.sparse_states = sparse_states
+        # Root of all randomness: the universe and each computation get spawned streams
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        # Execution trace policy for new computations (see ExecutionTrace)
+        self.trace_config = {
+            "retention": trace_retention,
+            "interval": trace_interval,
+            "capacity": trace_capacity
+        }
+        # Early-stopping policy for execute_computation (see ConvergenceMonitor)
+        self.convergence_config = {
+            "window": convergence_window,
+            "state_tolerance": state_tolerance,
+            "complexity_tolerance": complexity_tolerance
+        }
         self.computations = {}  # idea_id -> VectorComputation
+        self.embedder = FeatureHashingEmbedder(dimensionality)
         self.ldb_v_operations = self._initialize_ldb_v_operations()
-        self.computational_graph = nx.DiGraph()
-        self.global_state = np.random.random(dimensionality)
-        self.energy_budget = 1000.0  # Computational energy available
+        self.batched_operations = self._initialize_batched_operations()
+        self.computational_graph = LineageGraph()  # Crossover lineage between computations
+        self.global_state = self.rng.random(dimensionality)
+        # Reusable scratch space so per-step operations do not allocate
+        self._scratch = np.empty((3, dimensionality))
+        self._scratch_mask = np.empty(dimensionality, dtype=bool)
+        self._scratch_spectrum = np.empty(dimensionality, dtype=complex)
+        # Computational energy available, replenished over time
+        self.energy = EnergyBucket(energy_capacity, energy_refill_rate)
+
+    @property
+    def energy_budget(self) -> float:
+        """Energy currently available in the universe's token bucket"""
+        return self.energy.available
+
+    @energy_budget.setter
+    def energy_budget(self, value: float):
+        self.energy.reset(value)
 
     def _initialize_ldb_v_operations(self) -> Dict[str, Callable]:
         """Initialize LDB-V operations for computational simulation"""
@@ -88,62 +1406,205 @@ class VectorComputationalUniverse:
             "convergence_check": self._op_convergence_check
         }
 
-    def create_computation(self, idea_description: str,
-                           initial_conditions: Dict = None) -> str:
-        """Create a new computational idea from description"""
-        # Simple ID generation
-        idea_id = f"comp_{len(self.computations)}_{hash(idea_description)}"
+    def _initialize_batched_operations(self) -> Dict[str, Callable]:
+        """Row-wise LDB-V operations over an (N x dim) population matrix
 
-        # Convert idea description to initial state vector
-        initial_vector = self._idea_to_vector(idea_description, initial_conditions)
+        Each takes (states, params, streams, idea_ids, population) where
+        streams holds the RandomStream of every row, so a row's trajectory is
+        the same whether it runs alone or inside a population. idea_ids names
+        each row, and population maps every member of the population to its
+        current row, for operations that read other ideas.
+        """
+        return {
+            "vector_evolve": self._batch_vector_evolve,
+            "idea_crossover": self._batch_idea_crossover,
+            "computational_mutate": self._batch_computational_mutate,
+            "state_superpose": self._batch_state_superpose,
+            "entropy_maximize": self._batch_entropy_maximize,
+            "complexity_reduce": self._batch_complexity_reduce,
+            "convergence_check": lambda states, params, streams, idea_ids, population: states
+        }
 
-        computation = VectorComputation(idea_id, initial_vector)
-        self.computations[idea_id] = computation
-        self.computational_graph.add_node(idea_id, computation=computation)
+    def create_computation(self, idea_description: Union[str, List[str]],
+                           initial_conditions: Union[Dict, List[Dict], None] = None) -> Union[str, List[str]]:
+        """Create a new computational idea from description
 
-        return idea_id
+        Given a list of descriptions, creates them all from one batched
+        embedding and returns the list of ids. `initial_conditions` may then be
+        a single dict for every idea or one dict per idea.
+        """
+        if isinstance(idea_description, str):
+            return self.create_computation([idea_description], [initial_conditions])[0]
+
+        descriptions = list(idea_description)
+        if initial_conditions is None or isinstance(initial_conditions, dict):
+            initial_conditions = [initial_conditions] * len(descriptions)
+        initial_conditions = list(initial_conditions)
+        if len(initial_conditions) != len(descriptions):
+            raise ValueError(f"Got {len(initial_conditions)} initial conditions "
+                             f"for {len(descriptions)} descriptions")
+
+        # Convert idea descriptions to initial state vectors
+        if self.sparse_states:
+            initial_vectors = self.embedder.embed_batch_sparse(descriptions, initial_conditions)
+            complexities = _sparse_batch_complexity(initial_vectors, self.dimensionality)
+        else:
+            initial_vectors = self.embedder.embed_batch(descriptions, initial_conditions)
+            complexities = _batch_complexity(initial_vectors)
+        seeds = self.seed_sequence.spawn(len(descriptions))
+
+        idea_ids = []
+        for description, initial_vector, complexity, seed in zip(
+                descriptions, initial_vectors, complexities, seeds):
+            # Simple ID generation
+            idea_id = f"comp_{len(self.computations)}_{stable_hash(description):016x}"
+            trace = ExecutionTrace(self.dimensionality, **self.trace_config)
+            computation = VectorComputation(idea_id, initial_vector, trace,
+                                            ConvergenceMonitor(**self.convergence_config),
+                                            RandomStream(seed), float(complexity))
+            self.computations[idea_id] = computation
+            self.computational_graph.add_node(idea_id)
+            idea_ids.append(idea_id)
+
+        return idea_ids
+
+    def export_lineage_graph(self):
+        """Lineage as a networkx.DiGraph with each computation as a node attribute"""
+        return self.computational_graph.to_networkx(
+            {idea_id: {"computation": comp} for idea_id, comp in self.computations.items()})
 
     def _idea_to_vector(self, idea: str, conditions: Dict = None) -> np.ndarray:
         """Convert natural language idea to computational state vector"""
         # Simple embedding - in production would use proper semantic embedding
-        words = idea.lower().split()
-        vector = np.zeros(self.dimensionality)
-
-        for i, word in enumerate(words):
-            # Simple hash-based positioning
-            pos = hash(word) % self.dimensionality
-            vector[pos] += 1.0 / (i + 1)  # Decreasing influence for later words
+        return self.embedder.embed_batch([idea], [conditions])[0]
 
-        # Normalize
-        if np.linalg.norm(vector) > 0:
-            vector = vector / np.linalg.norm(vector)
+    def checkpoint_computation(self, idea_id: str, run: Dict[str, Any] = None,
+                               results: Dict[str, Any] = None) -> ComputationCheckpoint:
+        """Snapshot a computation (and its lineage edges) as a ComputationCheckpoint
 
-        # Apply initial conditions if provided
-        if conditions:
-            for key, value in conditions.items():
-                cond_pos = hash(str(key)) % self.dimensionality
-                vector[cond_pos] += float(value) * 0.1
+        `run` and `results` are the progress of an unfinished execute_computation
+        run, recorded so that resume_computation can continue it.
+        """
+        if idea_id not in self.computations:
+            raise ValueError(f"Computation {idea_id} not found")
+        arrays: Dict[str, np.ndarray] = {}
+        header = {
+            "version": ComputationCheckpoint.VERSION,
+            "computation": self.computations[idea_id].to_checkpoint(arrays),
+            "lineage": (self.computational_graph.successors(idea_id)
+                        if idea_id in self.computational_graph else [])
+        }
+        if run is not None:
+            arrays["run.initial_state"] = np.asarray(results["initial_state"], dtype=float)
+            arrays["run.complexity_evolution"] = np.asarray(results["complexity_evolution"], dtype=float)
+            header["run"] = {
+                **run,
+                "energy_used": results["energy_used"],
+                "operations_executed": results["operations_executed"]
+            }
+        return ComputationCheckpoint(header, arrays)
 
-        return vector
+    def restore_computation(self, checkpoint: Union[ComputationCheckpoint, str]) -> str:
+        """Load a checkpointed computation, replacing any computation with the same id"""
+        if isinstance(checkpoint, str):
+            checkpoint = ComputationCheckpoint.load(checkpoint)
+        computation = VectorComputation.from_checkpoint(checkpoint.header["computation"], checkpoint.arrays)
+        if computation.metadata["dimensionality"] != self.dimensionality:
+            raise ValueError(f"Checkpoint has dimensionality {computation.metadata['dimensionality']}, "
+                             f"universe has {self.dimensionality}")
+        self.computations[computation.idea_id] = computation
+        self.computational_graph.add_node(computation.idea_id)
+        # Duplicate edges are merged by the graph itself
+        self.computational_graph.add_edges([(computation.idea_id, successor)
+                                            for successor in checkpoint.header["lineage"]])
+        return computation.idea_id
 
     def execute_computation(self, idea_id: str,
                             operation_sequence: List[str],
-                            max_iterations: int = 100) -> Dict[str, Any]:
-        """Execute a sequence of LDB-V operations on a computation"""
+                            max_iterations: int = 100,
+                            energy_limit: Optional[float] = None,
+                            operation_quota: Optional[int] = None,
+                            checkpoint_every: Optional[int] = None,
+                            checkpoint_path: Optional[str] = None) -> Dict[str, Any]:
+        """Execute a sequence of LDB-V operations on a computation
+
+        Every operation draws its energy cost from the universe's token bucket.
+        `energy_limit` and `operation_quota` additionally cap what this run may
+        spend. The run stops once any of them would be exceeded and reports
+        which one in `budget_exhausted` ("universe_energy", "energy_budget" or
+        "computation_quota").
+
+        With `checkpoint_every`, a ComputationCheckpoint of the computation and
+        the run's progress is written to `checkpoint_path` every that many
+        iterations; resume_computation continues from it.
+        """
         if idea_id not in self.computations:
             raise ValueError(f"Computation {idea_id} not found")
+        if checkpoint_every and not checkpoint_path:
+            raise ValueError("checkpoint_every requires a checkpoint_path")
 
         computation = self.computations[idea_id]
+        run = {
+            "operation_sequence": list(operation_sequence),
+            "max_iterations": max_iterations,
+            "energy_limit": energy_limit,
+            "operation_quota": operation_quota,
+            "checkpoint_every": checkpoint_every,
+            "checkpoint_path": checkpoint_path,
+            "next_iteration": 0
+        }
         results = {
-            "initial_state": computation.state_vector.tolist(), # Convert to list for JSON
+            "initial_state": computation.state_list(), # Convert to list for JSON
             "final_state": None,
             "iterations": 0,
             "energy_used": 0.0,
             "converged": False,
+            "iterations_saved": 0,
+            "operations_executed": 0,
+            "budget_exhausted": None,
             "complexity_evolution": []
         }
+        # Convergence is judged within this run only
+        computation.convergence.reset()
+        computation.convergence.observe(computation.state, computation.metadata["complexity"])
+        return self._run_computation(computation, run, results)
 
-        for iteration in range(max_iterations):
+    def resume_computation(self, checkpoint: Union[ComputationCheckpoint, str]) -> Dict[str, Any]:
+        """Continue an execute_computation run from one of its checkpoints
+
+        The computation is restored from the checkpoint first, and the returned
+        results are those the uninterrupted run would have produced, provided
+        the universe's energy bucket does not run dry in only one of them.
+        """
+        if isinstance(checkpoint, str):
+            checkpoint = ComputationCheckpoint.load(checkpoint)
+        if checkpoint.run is None:
+            raise ValueError("Checkpoint was not taken during a run")
+        run = dict(checkpoint.run)
+        results = {
+            "initial_state": checkpoint.arrays["run.initial_state"].tolist(),
+            "final_state": None,
+            "iterations": run["next_iteration"],
+            "energy_used": run.pop("energy_used"),
+            "converged": False,
+            "iterations_saved": 0,
+            "operations_executed": run.pop("operations_executed"),
+            "budget_exhausted": None,
+            "complexity_evolution": checkpoint.arrays["run.complexity_evolution"].tolist()
+        }
+        idea_id = self.restore_computation(checkpoint)
+        return self._run_computation(self.computations[idea_id], run, results)
+
+    def _run_computation(self, computation: VectorComputation, run: Dict[str, Any],
+                         results: Dict[str, Any]) -> Dict[str, Any]:
+        """The execute_computation loop, from iteration run["next_iteration"] on"""
+        operation_sequence = run["operation_sequence"]
+        max_iterations = run["max_iterations"]
+        energy_limit, operation_quota = run["energy_limit"], run["operation_quota"]
+        checkpoint_every = run["checkpoint_every"]
+
+        for iteration in range(run["next_iteration"], max_iterations):
+            results["iterations"] = iteration + 1
             current_energy_cost = 0.0
 
             for op_name in operation_sequence:
@@ -154,44 +1615,161 @@ class VectorComputationalUniverse:
                 operation = self.ldb_v_operations[op_name]
                 energy_cost = self._calculate_energy_cost(op_name, computation)
 
-                if current_energy_cost + energy_cost > self.energy_budget:
+                if operation_quota is not None and results["operations_executed"] >= operation_quota:
+                    results["budget_exhausted"] = "computation_quota"
                     break
+                if (energy_limit is not None and
+                        results["energy_used"] + current_energy_cost + energy_cost > energy_limit):
+                    results["budget_exhausted"] = "energy_budget"
+                    break
+                if not self.energy.try_consume(energy_cost):
+                    results["budget_exhausted"] = "universe_energy"
+                    break
+                # The tokens are spent even if the operation then fails
+                current_energy_cost += energy_cost
 
                 try:
                     # Pass default empty dict for parameters for now,
                     # as current frontend doesn't send specific op parameters.
                     operation(computation, {}) # Updated to pass empty dict for params
-                    current_energy_cost += energy_cost
+                    results["operations_executed"] += 1
                 except Exception as e:
                     computation.metadata["error"] = str(e)
                     break
 
             results["energy_used"] += current_energy_cost
-            self.energy_budget -= current_energy_cost
 
             # Update complexity evolution
-            results["complexity_evolution"].append(computation.metadata["complexity"])
-
+            complexity = computation.metrics.complexity
+            computation.metadata["complexity"] = complexity
+            results["complexity_evolution"].append(complexity)
+            if results["budget_exhausted"]:
+                break
 
-            # Check for convergence
-            if self._op_convergence_check(computation):
+            # Check for convergence and stop early
+            if computation.convergence.observe(computation.state, complexity):
                 results["converged"] = True
+                results["iterations_saved"] = max_iterations - (iteration + 1)
                 break
 
-        results["final_state"] = computation.state_vector.tolist() # Convert to list for JSON
-        results["iterations"] = iteration + 1
+            if checkpoint_every and (iteration + 1) % checkpoint_every == 0 and iteration + 1 < max_iterations:
+                run["next_iteration"] = iteration + 1
+                self.checkpoint_computation(computation.idea_id, run, results).save(run["checkpoint_path"])
+
+        results["final_state"] = computation.state_list() # Convert to list for JSON
+        results["convergence"] = computation.convergence.get_stats()
 
         return results
 
+    def execute_population(self, idea_ids: List[str],
+                           operation_sequence: List[str],
+                           max_iterations: int = 100,
+                           operation_params: Dict[str, Dict] = None) -> Dict[str, Any]:
+        """Execute an operation sequence on many computations as one matrix
+
+        States are stacked into an (N x dim) matrix and each LDB-V operation is
+        applied in a single vectorized call over the rows that have not yet
+        converged. Converged rows are frozen; the loop ends when every row has
+        converged, max_iterations is reached or the energy budget runs out.
+        """
+        missing = [idea_id for idea_id in idea_ids if idea_id not in self.computations]
+        if missing:
+            raise ValueError(f"Computation {missing[0]} not found")
+        unknown = [op for op in operation_sequence if op not in self.batched_operations]
+        if unknown:
+            raise ValueError(f"Unknown operation: {unknown[0]}")
+
+        operation_params = operation_params or {}
+        computations = [self.computations[idea_id] for idea_id in idea_ids]
+        streams = [comp.rng for comp in computations]
+        states = np.stack([comp.state_vector for comp in computations]).astype(float)
+        complexities = _batch_complexity(states)
+        monitor = PopulationConvergence(len(computations), **self.convergence_config)
+        monitor.observe(states, complexities)
+
+        population = {computation.idea_id: states[row] for row, computation in enumerate(computations)}
+        iterations = np.zeros(len(computations), dtype=int)
+        converged = np.zeros(len(computations), dtype=bool)
+        energy_used = 0.0
+        exhausted = False
+
+        for iteration in range(max_iterations):
+            active = np.flatnonzero(~converged)
+            if active.size == 0:
+                break
+
+            for op_name in operation_sequence:
+                energy_cost = float(np.sum(self.OPERATION_COSTS.get(op_name, 1.0) *
+                                           (1 + complexities[active])))
+                if not self.energy.try_consume(energy_cost):
+                    exhausted = True
+                    break
+                params = operation_params.get(op_name, {})
+                states[active] = self.batched_operations[op_name](
+                    states[active], params, [streams[row] for row in active],
+                    [computations[row].idea_id for row in active], population)
+                energy_used += energy_cost
+
+            iterations[active] += 1
+            complexities[active] = _batch_complexity(states[active])
+            converged |= monitor.observe(states, complexities)
+            if exhausted:
+                break
+
+        # Write results back to the individual computations
+        per_computation = {}
+        for row, computation in enumerate(computations):
+            if iterations[row]:
+                # Copy out of the shared matrix so no computation keeps a view of it
+                computation.next_state_buffer()[...] = states[row]
+                computation.commit_state("execute_population",
+                                         {"operation_sequence": list(operation_sequence),
+                                          "iterations": int(iterations[row])})
+            computation.metadata["complexity"] = float(complexities[row])
+            per_computation[computation.idea_id] = {
+                "iterations": int(iterations[row]),
+                "converged": bool(converged[row]),
+                "iterations_saved": max_iterations - int(iterations[row]) if converged[row] else 0,
+                "complexity": float(complexities[row])
+            }
+
+        return {
+            "population_size": len(computations),
+            "iterations": int(iterations.max()) if len(computations) else 0,
+            "converged_count": int(converged.sum()),
+            "energy_used": energy_used,
+            "energy_exhausted": exhausted,
+            "computations": per_computation
+        }
+
     # LDB-V Operations for Computational Simulation
+    #
+    # Each operation writes the next state into computation.next_state_buffer()
+    # using out= arguments and the universe's scratch arrays, then commits it.
+    def _uniform(self, computation: VectorComputation, out: np.ndarray) -> np.ndarray:
+        """Fill `out` with uniform [0, 1) samples for this computation"""
+        return computation.rng.uniform(out)
+
+    def _normal(self, computation: VectorComputation, scale: float, size: int) -> np.ndarray:
+        """Draw `size` normal(0, scale) samples for this computation"""
+        return computation.rng.normal(scale, size)
+
+    @staticmethod
+    def _normalize(state: np.ndarray):
+        state /= (np.linalg.norm(state) + 1e-10)
+
     def _op_vector_evolve(self, computation: VectorComputation, params: Dict = None):
         """Evolve computation using gradient-like dynamics"""
         params = params or {}
         learning_rate = params.get("learning_rate", 0.1)
-        gradient = np.random.random(computation.state_vector.shape) - 0.5
-        new_state = computation.state_vector + learning_rate * gradient
-        new_state = new_state / (np.linalg.norm(new_state) + 1e-10) # Normalize
-        computation.evolve_state(lambda x, **p: new_state, parameters={"learning_rate": learning_rate})
+        gradient = self._uniform(computation, self._scratch[0])
+        gradient -= 0.5
+        gradient *= learning_rate
+        new_state = computation.next_state_buffer()
+        np.add(computation.state_vector, gradient, out=new_state)
+        self._normalize(new_state)
+        computation.commit_state("vector_evolve", {"learning_rate": learning_rate},
+                                 workspace=self._scratch[1:])
 
     def _op_idea_crossover(self, computation: VectorComputation, params: Dict = None):
         """Combine with another computational idea"""
@@ -199,15 +1777,27 @@ class VectorComputationalUniverse:
         other_idea_id = params.get("other_idea_id")
         alpha = params.get("alpha", 0.3)
 
+        parameters = {"alpha": alpha, "other_idea_id": other_idea_id}
+
         if other_idea_id and other_idea_id in self.computations:
-            other_comp = self.computations[other_idea_id]
-            new_state = (1 - alpha) * computation.state_vector + alpha * other_comp.state_vector
+            other = self.computations[other_idea_id]
+            if computation.is_sparse and other.is_sparse:
+                # Two sparse parents mix over the union of their supports
+                new_sparse = computation.sparse_state.combine(other.sparse_state, alpha)
+                computation.commit_sparse_state(new_sparse.scale(1.0 / (new_sparse.norm() + 1e-10)),
+                                                "idea_crossover", parameters)
+                self.computational_graph.add_edge(computation.idea_id, other_idea_id)
+                return
+            partner = _as_dense(other.state)
         else:
             # Crossover with global state if no other_idea_id provided or found
-            new_state = (1 - alpha) * computation.state_vector + alpha * self.global_state
+            partner = self.global_state
 
-        new_state = new_state / (np.linalg.norm(new_state) + 1e-10) # Normalize
-        computation.evolve_state(lambda x, **p: new_state, parameters={"alpha": alpha, "other_idea_id": other_idea_id})
+        new_state = computation.next_state_buffer()
+        np.multiply(computation.state_vector, 1 - alpha, out=new_state)
+        new_state += np.multiply(partner, alpha, out=self._scratch[0])
+        self._normalize(new_state)
+        computation.commit_state("idea_crossover", parameters, workspace=self._scratch[1:])
         if other_idea_id:
             self.computational_graph.add_edge(computation.idea_id, other_idea_id)
 
@@ -217,32 +1807,43 @@ class VectorComputationalUniverse:
         mutation_rate = params.get("mutation_rate", 0.05)
         mutation_strength = params.get("mutation_strength", 0.1)
 
-        mutation_mask = np.random.random(computation.state_vector.shape) < mutation_rate
-        mutations = np.random.normal(0, mutation_strength, computation.state_vector.shape)
-        new_state = computation.state_vector + mutation_mask * mutations
-        new_state = new_state / (np.linalg.norm(new_state) + 1e-10) # Normalize
-        computation.evolve_state(lambda x, **p: new_state, parameters={"mutation_rate": mutation_rate, "mutation_strength": mutation_strength})
+        mutation_mask = np.less(self._uniform(computation, self._scratch[0]), mutation_rate,
+                                out=self._scratch_mask)
+        indices = np.flatnonzero(mutation_mask)
+        # Only the mutated positions need normal samples
+        mutations = self._normal(computation, mutation_strength, indices.size)
+        new_state = computation.next_state_buffer()
+        new_state[...] = computation.state_vector
+        new_state[indices] += mutations
+        scale = 1.0 / (np.linalg.norm(new_state) + 1e-10)
+        new_state *= scale # Normalize
+        computation.commit_state("computational_mutate",
+                                 {"mutation_rate": mutation_rate, "mutation_strength": mutation_strength},
+                                 sparse_update=(indices, mutations, scale))
 
     def _op_state_superpose(self, computation: VectorComputation, params: Dict = None):
         """Create quantum-like superposition of computational states"""
         params = params or {}
         superposition_strength = params.get("superposition_strength", 0.2)
+        state = computation.state_vector
+        state_energy = np.dot(state, state)
 
-        orthogonal = np.random.random(computation.state_vector.shape)
-        # Gram-Schmidt to make it orthogonal to current state
-        if np.linalg.norm(computation.state_vector) > 1e-10:
-            orthogonal = orthogonal - np.dot(orthogonal, computation.state_vector) * computation.state_vector / (np.linalg.norm(computation.state_vector)**2)
-        if np.linalg.norm(orthogonal) > 1e-10:
-            orthogonal = orthogonal / np.linalg.norm(orthogonal)
-        else: # if orthogonal is zero vector, generate another random vector
-            orthogonal = np.random.random(computation.state_vector.shape)
-            if np.linalg.norm(computation.state_vector) > 1e-10:
-                orthogonal = orthogonal - np.dot(orthogonal, computation.state_vector) * computation.state_vector / (np.linalg.norm(computation.state_vector)**2)
-            orthogonal = orthogonal / (np.linalg.norm(orthogonal) + 1e-10)
-
-        new_state = computation.state_vector + superposition_strength * orthogonal
-        new_state = new_state / (np.linalg.norm(new_state) + 1e-10)
-        computation.evolve_state(lambda x, **p: new_state, parameters={"superposition_strength": superposition_strength})
+        orthogonal, projection = self._scratch[0], self._scratch[1]
+        for _ in range(2): # Retry once if the sample is parallel to the state
+            self._uniform(computation, orthogonal)
+            # Gram-Schmidt to make it orthogonal to current state
+            if np.sqrt(state_energy) > 1e-10:
+                orthogonal -= np.multiply(state, np.dot(orthogonal, state) / state_energy, out=projection)
+            if np.linalg.norm(orthogonal) > 1e-10:
+                break
+        self._normalize(orthogonal)
+
+        new_state = computation.next_state_buffer()
+        np.multiply(orthogonal, superposition_strength, out=new_state)
+        new_state += state
+        self._normalize(new_state)
+        computation.commit_state("state_superpose", {"superposition_strength": superposition_strength},
+                                 workspace=self._scratch[1:])
 
     def _op_entropy_maximize(self, computation: VectorComputation, params: Dict = None):
         """Increase computational entropy/information content"""
@@ -250,60 +1851,113 @@ class VectorComputationalUniverse:
         increase_factor = params.get("increase_factor", 1.1)
         step_size = params.get("step_size", 0.05)
 
-        # Avoid log of zero or negative
-        state_for_log = np.maximum(computation.state_vector, 1e-10)
-        current_entropy = -np.sum(state_for_log * np.log(state_for_log))
-
-        # Aim for entropy increase
         # This is a simplified gradient ascent. Real entropy maximization is complex.
         # Here, we push values towards a more uniform distribution.
-        new_state = computation.state_vector + step_size * (np.random.random(computation.state_vector.shape) - 0.5)
-        new_state = np.clip(new_state, 1e-10, None) # Ensure non-negative
-        new_state = new_state / (np.sum(new_state) + 1e-10) # Normalize
-        computation.evolve_state(lambda x, **p: new_state, parameters={"increase_factor": increase_factor, "step_size": step_size})
+        step = self._uniform(computation, self._scratch[0])
+        step -= 0.5
+        step *= step_size
+        new_state = computation.next_state_buffer()
+        np.add(computation.state_vector, step, out=new_state)
+        np.clip(new_state, 1e-10, None, out=new_state) # Ensure non-negative
+        new_state /= (new_state.sum() + 1e-10) # Normalize
+        computation.commit_state("entropy_maximize", {"increase_factor": increase_factor, "step_size": step_size},
+                                 workspace=self._scratch[1:])
 
     def _op_complexity_reduce(self, computation: VectorComputation, params: Dict = None):
         """Reduce computational complexity while preserving information"""
         params = params or {}
         cutoff_factor = params.get("cutoff_factor", 0.25) # 0.25 means keep lowest 25% frequencies
 
-        freq_domain = np.fft.fft(computation.state_vector)
+        freq_domain = _fft_into(computation.state_vector, self._scratch_spectrum)
         cutoff_idx = int(len(freq_domain) * cutoff_factor)
 
         # Zero out high frequencies (complexity reduction)
         freq_domain[cutoff_idx:-cutoff_idx] = 0
-        new_state = np.real(np.fft.ifft(freq_domain))
-        new_state = new_state / (np.linalg.norm(new_state) + 1e-10) # Normalize
-        computation.evolve_state(lambda x, **p: new_state, parameters={"cutoff_factor": cutoff_factor})
+        new_state = computation.next_state_buffer()
+        new_state[...] = _ifft_into(freq_domain, freq_domain).real
+        self._normalize(new_state)
+        computation.commit_state("complexity_reduce", {"cutoff_factor": cutoff_factor},
+                                 workspace=self._scratch[1:])
 
-
-    def _op_convergence_check(self, computation: VectorComputation) -> bool:
+    def _op_convergence_check(self, computation: VectorComputation, params: Dict = None) -> bool:
         """Check if computation has converged to stable state"""
-        if len(computation.execution_trace) < 3: # Need at least 3 steps to compare changes
-            return False
+        # execute_computation feeds the monitor once per iteration; this is a pure query
+        return computation.convergence.converged
 
-        # Consider recent changes in metadata (e.g., complexity, entropy)
-        recent_complexities = [
-            comp_meta["complexity"] for comp_meta in computation.execution_trace[-3:]
-        ]
-        # Check if changes in complexity are small
-        if all(abs(recent_complexities[i] - recent_complexities[i-1]) < 0.001 for i in range(1, len(recent_complexities))):
-            return True
-        return False
 
+    # Batched LDB-V operations: each maps an (N x dim) matrix to a new one
+    @staticmethod
+    def _batch_uniform(streams: List[RandomStream], shape: tuple) -> np.ndarray:
+        samples = np.empty(shape)
+        for row, stream in zip(samples, streams):
+            stream.uniform(row)
+        return samples
+
+    def _batch_vector_evolve(self, states: np.ndarray, params: Dict, streams: List[RandomStream],
+                             idea_ids: List[str], population: Dict[str, np.ndarray]) -> np.ndarray:
+        learning_rate = params.get("learning_rate", 0.1)
+        gradient = self._batch_uniform(streams, states.shape) - 0.5
+        return _normalize_rows(states + learning_rate * gradient)
+
+    def _batch_idea_crossover(self, states: np.ndarray, params: Dict, streams: List[RandomStream],
+                              idea_ids: List[str], population: Dict[str, np.ndarray]) -> np.ndarray:
+        other_idea_id = params.get("other_idea_id")
+        alpha = params.get("alpha", 0.3)
+        if other_idea_id in population:
+            # A partner inside the population has moved on from its committed state
+            partner = population[other_idea_id].copy()
+        elif other_idea_id and other_idea_id in self.computations:
+            partner = _as_dense(self.computations[other_idea_id].state)
+        else:
+            partner = self.global_state
+        if other_idea_id:
+            self.computational_graph.add_edges([(idea_id, other_idea_id) for idea_id in idea_ids])
+        return _normalize_rows((1 - alpha) * states + alpha * partner)
+
+    def _batch_computational_mutate(self, states: np.ndarray, params: Dict, streams: List[RandomStream],
+                                    idea_ids: List[str], population: Dict[str, np.ndarray]) -> np.ndarray:
+        mutation_rate = params.get("mutation_rate", 0.05)
+        mutation_strength = params.get("mutation_strength", 0.1)
+        mutation_mask = self._batch_uniform(streams, states.shape) < mutation_rate
+        # One draw per row for that row's mutated positions, in the row-major
+        # order boolean indexing uses, then a single masked update
+        counts = np.count_nonzero(mutation_mask, axis=1)
+        ends = np.cumsum(counts)
+        mutations = np.empty(int(counts.sum()))
+        for stream, start, end in zip(streams, ends - counts, ends):
+            stream.standard_normal(mutations[start:end])
+        mutations *= mutation_strength
+        new_states = states.copy()
+        new_states[mutation_mask] += mutations
+        return _normalize_rows(new_states)
+
+    def _batch_state_superpose(self, states: np.ndarray, params: Dict, streams: List[RandomStream],
+                               idea_ids: List[str], population: Dict[str, np.ndarray]) -> np.ndarray:
+        superposition_strength = params.get("superposition_strength", 0.2)
+        orthogonal = self._batch_uniform(streams, states.shape)
+        # Row-wise Gram-Schmidt against the current states
+        energy = np.einsum("ij,ij->i", states, states)
+        overlap = np.einsum("ij,ij->i", orthogonal, states) / np.where(energy > 1e-20, energy, np.inf)
+        orthogonal = _normalize_rows(orthogonal - overlap[:, None] * states)
+        return _normalize_rows(states + superposition_strength * orthogonal)
+
+    def _batch_entropy_maximize(self, states: np.ndarray, params: Dict, streams: List[RandomStream],
+                                idea_ids: List[str], population: Dict[str, np.ndarray]) -> np.ndarray:
+        step_size = params.get("step_size", 0.05)
+        new_states = states + step_size * (self._batch_uniform(streams, states.shape) - 0.5)
+        new_states = np.clip(new_states, 1e-10, None)
+        return new_states / (new_states.sum(axis=1, keepdims=True) + 1e-10)
+
+    def _batch_complexity_reduce(self, states: np.ndarray, params: Dict, streams: List[RandomStream],
+                                 idea_ids: List[str], population: Dict[str, np.ndarray]) -> np.ndarray:
+        cutoff_factor = params.get("cutoff_factor", 0.25)
+        freq_domain = np.fft.fft(states, axis=1)
+        cutoff_idx = int(states.shape[1] * cutoff_factor)
+        freq_domain[:, cutoff_idx:-cutoff_idx] = 0
+        return _normalize_rows(np.real(np.fft.ifft(freq_domain, axis=1)))
 
     def _calculate_energy_cost(self, operation: str, computation: VectorComputation) -> float:
         """Calculate energy cost of LDB-V operation"""
-        base_costs = {
-            "vector_evolve": 1.0,
-            "idea_crossover": 2.0,
-            "computational_mutate": 1.5,
-            "state_superpose": 3.0,
-            "entropy_maximize": 2.5,
-            "complexity_reduce": 2.0,
-            "convergence_check": 0.5 # Cheaper to check than to execute
-        }
-
         # Energy cost scales with complexity (more complex ideas cost more to operate on)
         complexity_factor = computation.metadata["complexity"]
-        return base_costs.get(operation, 1.0) * (1 + complexity_factor)
\ No newline at end of file
+        return self.OPERATION_COSTS.get(operation, 1.0) * (1 + complexity_factor)
\ No newline at end of file
@@ -1,63 +1,190 @@
+import asyncio
+import bisect
+import heapq
+import os
+import threading
+import time
 import numpy as np
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Any, Callable, Optional, Union
 from enum import Enum
 # Assuming vector_computational_universe.py is in the same directory
-from .vector_computational_universe import VectorComputationalUniverse, VectorComputation, ComputationalState
+from .vector_computational_universe import (VectorComputationalUniverse, VectorComputation, ComputationalState,
+                                            ExecutionTrace, ConvergenceMonitor, RandomStream,
+                                            ComputationCheckpoint, stable_hash)
+
+DEFAULT_OPERATION_PLAN = ["vector_evolve", "entropy_maximize", "convergence_check"]
+DEFAULT_ITERATION_LIMIT = 100  # Total iterations a process may use across time slices
+
+def _execute_shard(shm_name: str, shape: tuple, rows: List[int], computation_ids: List[str],
+                   streams: List[RandomStream], complexities: List[float], global_state: np.ndarray,
+                   operation_plan: List[str], limits: List[Dict[str, Any]], energy_allowance: float,
+                   convergence_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point: run a shard of computations whose states live in shared memory
+
+    Every computation gets the same fixed `energy_allowance` of universe
+    energy (no refill in workers), so early rows cannot starve later ones.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        states = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        universe = VectorComputationalUniverse(shape[1], trace_retention="none",
+                                               energy_capacity=energy_allowance, energy_refill_rate=0.0)
+        universe.convergence_config = convergence_config
+        universe.global_state = global_state
+
+        results = {}
+        energy_used = 0.0
+        for row, computation_id, stream, complexity, row_limits in zip(
+                rows, computation_ids, streams, complexities, limits):
+            universe.energy.reset(energy_allowance)
+            computation = VectorComputation(computation_id, states[row].copy(),
+                                            ExecutionTrace(shape[1], retention="none"),
+                                            ConvergenceMonitor(**convergence_config), stream)
+            computation.metadata["complexity"] = complexity
+            universe.computations[computation_id] = computation
+            try:
+                results[computation_id] = universe.execute_computation(
+                    computation_id, operation_plan, **row_limits)
+                states[row] = computation.state_vector
+            except Exception as e:
+                results[computation_id] = {"error": str(e)}
+            energy_used += energy_allowance - universe.energy_budget
+        del states # Drop the view before the segment is closed
 
-class VectorVirtualMachine:
-    """A virtual machine that executes computations in vector space"""
+        return {
+            "results": results,
+            "streams": {cid: comp.rng for cid, comp in universe.computations.items()},
+            "energy_used": energy_used
+        }
+    finally:
+        shm.close()
 
-    def __init__(self, universe: VectorComputationalUniverse):
+class VectorVirtualMachine:
+    """A virtual machine that executes computations in vector space
+
+    With `checkpoint_dir` and `checkpoint_every`, each process is checkpointed
+    to `<checkpoint_dir>/<process_id>.ckpt` every `checkpoint_every`
+    iterations, whichever run path executes it; resume_process continues it
+    from that file, e.g. in a new VM after the machine went down.
+    """
+
+    def __init__(self, universe: VectorComputationalUniverse, max_workers: Optional[int] = None,
+                 checkpoint_dir: Optional[str] = None, checkpoint_every: Optional[int] = None):
+        if checkpoint_every and not checkpoint_dir:
+            raise ValueError("checkpoint_every requires a checkpoint_dir")
         self.universe = universe
         self.running_processes = {}
         self.scheduler = VectorScheduler(universe)
         self.memory_manager = VectorMemoryManager(universe)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None # Created on first parallel batch
+        self._running = False
+        # Guards the process table, scheduler and universe: run_async executes
+        # batches on a worker thread while the event loop may create processes
+        self._lock = threading.RLock()
+        # Serializes computations run in this process, which share the
+        # universe's scratch buffers; held without _lock
+        self._execute_lock = threading.Lock()
+        # Periodic process checkpoints (see _finish_slice and checkpoint_path)
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every = checkpoint_every
+        if checkpoint_dir:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def create_process(self, idea_description: str,
-                       priority: float = 1.0) -> str:
-        """Create a new computational process"""
-        process_id = f"proc_{len(self.running_processes)}_{hash(idea_description)}"
-
-        computation_id = self.universe.create_computation(idea_description)
-        process = {
-            "process_id": process_id,
-            "computation_id": computation_id,
-            "priority": priority,
-            "status": ComputationalState.INITIALIZED.value,
-            "created_at": np.datetime64('now').astype(str),
-            "resources_allocated": {},
-            "execution_history": []
-        }
-
-        self.running_processes[process_id] = process
-        self.scheduler.register_process(process_id, priority)
-
-        return process_id
+                       priority: float = 1.0,
+                       iteration_limit: int = DEFAULT_ITERATION_LIMIT,
+                       energy_budget: Optional[float] = None,
+                       computation_quota: Optional[int] = None) -> str:
+        """Create a new computational process
+
+        `energy_budget` and `computation_quota` bound what the process may spend
+        over its whole lifetime (defaults come from the memory manager).
+        """
+        with self._lock:
+            process_id = f"proc_{len(self.running_processes)}_{stable_hash(idea_description):016x}"
+
+            computation_id = self.universe.create_computation(idea_description)
+            process = {
+                "process_id": process_id,
+                "computation_id": computation_id,
+                "priority": priority,
+                "status": ComputationalState.INITIALIZED.value,
+                "created_at": np.datetime64('now').astype(str),
+                "resources_allocated": {},
+                "iterations_run": 0,
+                "iteration_limit": iteration_limit,
+                "budget": {
+                    "energy_budget": self.memory_manager.energy_budget if energy_budget is None else energy_budget,
+                    "computation_quota": (self.memory_manager.computation_quota
+                                          if computation_quota is None else computation_quota)
+                },
+                "accounting": {"energy_used": 0.0, "operations": 0, "slices": 0, "throttled": 0},
+                "execution_history": []
+            }
+
+            self.running_processes[process_id] = process
+            self.scheduler.register_process(process_id, priority,
+                                            cost=self.universe.computations[computation_id].metadata["complexity"])
+            return process_id
 
     def execute_process(self, process_id: str,
-                        operation_plan: List[str] = None) -> Dict[str, Any]:
-        """Execute a computational process"""
-        if process_id not in self.running_processes:
-            raise ValueError(f"Process {process_id} not found")
-
-        process = self.running_processes[process_id]
-        process["status"] = ComputationalState.EXECUTING.value
-
-        # Use default operation plan if none provided
-        if not operation_plan:
-            operation_plan = ["vector_evolve", "entropy_maximize", "convergence_check"]
-
-        # Allocate computational resources
-        resources = self.memory_manager.allocate_resources(process_id)
-        process["resources_allocated"] = resources
+                        operation_plan: List[str] = None,
+                        max_iterations: Optional[int] = None) -> Dict[str, Any]:
+        """Execute a computational process
+
+        When `max_iterations` is given it acts as a time slice: a process that
+        uses all of it without converging is SUSPENDED and requeued. A queued
+        process is taken off the queue while it executes.
+        """
+        with self._lock:
+            if process_id not in self.running_processes:
+                raise ValueError(f"Process {process_id} not found")
+            if self._is_dispatched(process_id):
+                raise ValueError(f"Process {process_id} is already executing")
+            self.scheduler.dispatch(process_id)
+        return self._execute_dispatched(process_id, operation_plan, max_iterations)
+
+    def _execute_dispatched(self, process_id: str, operation_plan: Optional[List[str]],
+                            max_iterations: Optional[int]) -> Dict[str, Any]:
+        """Run one time slice of a dispatched process in this process"""
+        with self._lock:
+            process = self.running_processes[process_id]
+            process["status"] = ComputationalState.EXECUTING.value
+
+            # Use default operation plan if none provided
+            if not operation_plan:
+                operation_plan = DEFAULT_OPERATION_PLAN
+
+            # Allocate computational resources
+            resources = self._allocate_or_defer(process)
+            if resources is None:
+                return {"deferred": "No free subspace; process requeued"}
+            limits = self._execution_limits(process, max_iterations)
 
         try:
-            # Execute computation
-            results = self.universe.execute_computation(
-                process["computation_id"], operation_plan
-            )
+            # Without _lock, like the pool path, so processes can be created meanwhile
+            with self._execute_lock:
+                results = self.universe.execute_computation(process["computation_id"], operation_plan, **limits)
+        except Exception as e:
+            with self._lock:
+                process["status"] = ComputationalState.ERROR.value
+                process["error"] = str(e)
+                self.scheduler.complete(process_id)
+                # Release resources even on error
+                self.memory_manager.release_resources(process_id)
+            raise
 
-            process["status"] = ComputationalState.COMPLETED.value
+        with self._lock:
+            self._finish_slice(process, results, max_iterations)
             process["execution_history"].append({
                 "timestamp": np.datetime64('now').astype(str),
                 "operations": operation_plan,
@@ -69,99 +196,717 @@ class VectorVirtualMachine:
 
             return results
 
-        except Exception as e:
-            process["status"] = ComputationalState.ERROR.value
-            process["error"] = str(e)
-            # Release resources even on error
-            self.memory_manager.release_resources(process_id)
-            raise
+    def run(self, operation_plan: List[str] = None, batch_size: Optional[int] = None,
+            time_slice: Optional[int] = None, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """Drain the scheduler, dispatching batches to parallel_execute
+
+        Runs until the queue is empty (suspended processes are requeued and run
+        again) or `max_batches` batches have been dispatched. Returns throughput
+        and queue-wait latency for the run.
+        """
+        report = self._new_run_report()
+        self._running = True
+        while self._running and (max_batches is None or report["batches"] < max_batches):
+            size = batch_size or self._default_batch_size(operation_plan)
+            wait = self._energy_wait(operation_plan, size)
+            if wait == float("inf"):
+                report["stopped_reason"] = "universe_energy"
+                break
+            time.sleep(wait)
+            batch, waits = self._schedule_batch(size)
+            if not batch:
+                break
+            results = self.parallel_execute(batch, operation_plan, time_slice or self.scheduler.time_slice)
+            self._record_batch(report, batch, waits, results)
+        self._running = False
+        return self._finish_run_report(report)
+
+    async def run_async(self, operation_plan: List[str] = None, batch_size: Optional[int] = None,
+                        time_slice: Optional[int] = None, max_batches: Optional[int] = None,
+                        until_empty: bool = True, poll_interval: float = 0.05) -> Dict[str, Any]:
+        """asyncio variant of run()
+
+        Batches execute in a thread so the event loop stays free to submit more
+        work. With `until_empty=False` the loop keeps polling for new processes
+        every `poll_interval` seconds until stop() is called.
+        """
+        loop = asyncio.get_running_loop()
+        report = self._new_run_report()
+        self._running = True
+        while self._running and (max_batches is None or report["batches"] < max_batches):
+            size = batch_size or self._default_batch_size(operation_plan)
+            wait = self._energy_wait(operation_plan, size)
+            if wait == float("inf"):
+                report["stopped_reason"] = "universe_energy"
+                break
+            if wait:
+                await asyncio.sleep(wait)
+            batch, waits = self._schedule_batch(size)
+            if not batch:
+                if until_empty:
+                    break
+                await asyncio.sleep(poll_interval)
+                continue
+            results = await loop.run_in_executor(
+                None, self.parallel_execute, batch, operation_plan, time_slice or self.scheduler.time_slice)
+            self._record_batch(report, batch, waits, results)
+        self._running = False
+        return self._finish_run_report(report)
+
+    def _energy_wait(self, operation_plan: List[str], batch_size: int) -> float:
+        """Seconds to wait for the universe energy bucket before the next batch
+
+        Waits until the bucket can pay one iteration of the plan for every
+        process in the batch (at unit complexity), so throttled batches do not
+        spin on an empty bucket.
+        """
+        with self._lock:
+            queued = min(len(self.scheduler), batch_size)
+        if not queued:
+            return 0.0
+        return self.universe.energy.time_until(self._iteration_cost(operation_plan) * queued)
+
+    def _iteration_cost(self, operation_plan: Optional[List[str]]) -> float:
+        """Energy one iteration of the plan costs at unit complexity"""
+        costs = self.universe.OPERATION_COSTS
+        return sum(2 * costs.get(op, 1.0) for op in operation_plan or DEFAULT_OPERATION_PLAN)
+
+    def _schedule_batch(self, batch_size: int) -> tuple:
+        """Dequeue the next batch and the queue waits of its processes"""
+        with self._lock:
+            batch = self.scheduler.schedule_next_batch(batch_size)
+            return batch, self.scheduler.last_waits
+
+    def stop(self):
+        """Ask a running run()/run_async() loop to return after its current batch"""
+        self._running = False
+
+    def _default_batch_size(self, operation_plan: Optional[List[str]] = None) -> int:
+        """A few processes per worker, capped by what can run right now
+
+        A process beyond the free subspaces would only be deferred, and one
+        the energy bucket cannot fund an iteration of would be throttled.
+        """
+        # A few processes per worker keeps every core busy through a batch's tail
+        size = self.max_workers * 4
+        size = min(size, self.memory_manager.free_subspaces())
+        fundable = self.universe.energy_budget / self._iteration_cost(operation_plan)
+        if fundable < size:
+            size = int(fundable)
+        return max(1, size)
+
+    @staticmethod
+    def _new_run_report() -> Dict[str, Any]:
+        return {"batches": 0, "dispatched": 0, "completed": 0, "suspended": 0, "deferred": 0,
+                "errors": 0, "stopped_reason": None, "queue_waits": [], "started": time.monotonic()}
+
+    def _record_batch(self, report: Dict[str, Any], batch: List[str], waits: List[float],
+                      results: Dict[str, Any]):
+        report["batches"] += 1
+        report["dispatched"] += len(batch)
+        report["queue_waits"].extend(waits)
+        for process_id in batch:
+            status = self.running_processes[process_id]["status"]
+            if "error" in results.get(process_id, {}):
+                report["errors"] += 1
+            elif "deferred" in results.get(process_id, {}):
+                # Requeued without running: no free subspace
+                report["deferred"] += 1
+            elif status == ComputationalState.SUSPENDED.value:
+                report["suspended"] += 1
+            else:
+                report["completed"] += 1
+
+    @staticmethod
+    def _finish_run_report(report: Dict[str, Any]) -> Dict[str, Any]:
+        elapsed = time.monotonic() - report.pop("started")
+        waits = np.array(report.pop("queue_waits"))
+        report["elapsed_seconds"] = elapsed
+        report["throughput"] = report["completed"] / elapsed if elapsed > 0 else 0.0 # Processes per second
+        report["queue_wait"] = {
+            "mean": float(waits.mean()) if waits.size else 0.0,
+            "p50": float(np.percentile(waits, 50)) if waits.size else 0.0,
+            "p95": float(np.percentile(waits, 95)) if waits.size else 0.0,
+            "max": float(waits.max()) if waits.size else 0.0
+        }
+        return report
+
+    def _allocate_or_defer(self, process: Dict) -> Optional[Dict[str, Any]]:
+        """Allocate a subspace, or suspend and requeue the process if none is free
+
+        Processes unknown to the scheduler cannot be requeued, so for them the
+        SubspaceExhaustedError propagates.
+        """
+        process_id = process["process_id"]
+        try:
+            resources = self.memory_manager.allocate_resources(process_id)
+        except SubspaceExhaustedError:
+            if process_id not in self.scheduler:
+                process["status"] = ComputationalState.ERROR.value
+                raise
+            self._requeue(process)
+            return None
+        process["resources_allocated"] = resources
+        return resources
+
+    @staticmethod
+    def _execution_limits(process: Dict, max_iterations: Optional[int]) -> Dict[str, Any]:
+        """execute_computation keyword arguments enforcing what is left of a process's budget"""
+        budget, accounting = process["budget"], process["accounting"]
+        # A slice never runs past the process's lifetime iteration limit
+        remaining = max(0, process["iteration_limit"] - process["iterations_run"])
+        return {
+            "energy_limit": max(0.0, budget["energy_budget"] - accounting["energy_used"]),
+            "operation_quota": max(0, budget["computation_quota"] - accounting["operations"]),
+            "max_iterations": min(max_iterations or remaining, remaining)
+        }
+
+    def _finish_slice(self, process: Dict, results: Dict[str, Any], max_iterations: Optional[int]):
+        """Complete a process, or suspend and requeue it if its time slice ran out
+
+        A process stopped by an empty universe energy bucket is also requeued,
+        to continue once the bucket refills. With periodic checkpointing on,
+        the process is checkpointed to checkpoint_path() whenever its
+        iterations cross a multiple of `checkpoint_every`, and when it
+        completes. Processes are only checkpointed between slices, so the
+        interval is effectively rounded up to the time slice.
+        """
+        iterations_before = process["iterations_run"]
+        process["iterations_run"] += results["iterations"]
+        accounting = process["accounting"]
+        accounting["energy_used"] += results["energy_used"]
+        accounting["operations"] += results["operations_executed"]
+        accounting["slices"] += 1
+        throttled = results["budget_exhausted"] == "universe_energy"
+        accounting["throttled"] += throttled
+        out_of_slice = max_iterations and results["iterations"] >= max_iterations
+        if ((out_of_slice or throttled) and not results["converged"] and
+                process["iterations_run"] < process["iteration_limit"] and
+                process["process_id"] in self.scheduler):
+            self._requeue(process)
+        else:
+            process.pop("suspend_requested", None)
+            process["status"] = ComputationalState.COMPLETED.value
+            self.scheduler.complete(process["process_id"])
+
+        every = self.checkpoint_every
+        if every and (process["iterations_run"] // every > iterations_before // every or
+                      process["status"] == ComputationalState.COMPLETED.value):
+            self.checkpoint_process(process["process_id"]).save(self.checkpoint_path(process["process_id"]))
+
+    def checkpoint_path(self, process_id: str) -> Optional[str]:
+        """Where periodic checkpoints of a process are saved (None if disabled)"""
+        if not self.checkpoint_dir:
+            return None
+        return os.path.join(self.checkpoint_dir, f"{process_id}.ckpt")
+
+    def _is_dispatched(self, process_id: str) -> bool:
+        """Whether a process has been handed out in a batch and is executing"""
+        return process_id in self.scheduler and process_id not in self.scheduler.entries
+
+    def _requeue(self, process: Dict):
+        """Suspend a process and requeue it, or park it if suspend_process asked for that"""
+        request = process.pop("suspend_requested", None)
+        if request is not None:
+            self._park(process, request["checkpoint_path"])
+            return
+        process["status"] = ComputationalState.SUSPENDED.value
+        self.scheduler.preempt(process["process_id"])
+
+    def checkpoint_process(self, process_id: str) -> ComputationCheckpoint:
+        """Checkpoint a process record and its computation (see ComputationCheckpoint)
+
+        Execution history and allocated resources are not included. Take
+        checkpoints between time slices, i.e. not while the process executes.
+        """
+        with self._lock:
+            if process_id not in self.running_processes:
+                raise ValueError(f"Process {process_id} not found")
+            process = self.running_processes[process_id]
+            checkpoint = self.universe.checkpoint_computation(process["computation_id"])
+            checkpoint.header["process"] = {
+                key: value for key, value in process.items()
+                if key not in ("execution_history", "resources_allocated", "suspend_requested")
+            }
+            return checkpoint
+
+    def suspend_process(self, process_id: str,
+                        checkpoint_path: Optional[str] = None) -> Optional[ComputationCheckpoint]:
+        """Take a process out of scheduling until resume_process is called
+
+        A queued process is parked immediately and its checkpoint returned. A
+        process that is executing is parked when its current time slice ends,
+        unless it finishes in that slice, and None is returned. With
+        `checkpoint_path` the checkpoint is also saved there, so the process
+        can be resumed by another VM, e.g. after the machine is preempted.
+        """
+        with self._lock:
+            if process_id not in self.running_processes:
+                raise ValueError(f"Process {process_id} not found")
+            process = self.running_processes[process_id]
+            if process["status"] in (ComputationalState.COMPLETED.value, ComputationalState.ERROR.value):
+                raise ValueError(f"Process {process_id} has already finished")
+            if process.get("parked"):
+                return self.checkpoint_process(process_id)
+            if self._is_dispatched(process_id):
+                # Dispatched: _requeue parks it once its slice is over
+                process["suspend_requested"] = {"checkpoint_path": checkpoint_path}
+                return None
+            return self._park(process, checkpoint_path)
+
+    def _park(self, process: Dict, checkpoint_path: Optional[str]) -> ComputationCheckpoint:
+        process["status"] = ComputationalState.SUSPENDED.value
+        process["parked"] = True
+        self.scheduler.complete(process["process_id"])
+        checkpoint = self.checkpoint_process(process["process_id"])
+        if checkpoint_path:
+            checkpoint.save(checkpoint_path)
+        return checkpoint
+
+    def resume_process(self, process_id: Optional[str] = None,
+                       checkpoint: Union[ComputationCheckpoint, str, None] = None) -> str:
+        """Requeue a process parked by suspend_process
+
+        Given a checkpoint (or a path to one) instead, the process and its
+        computation are restored from it first, replacing any live copies, and
+        continue bit-exactly from where the checkpoint was taken. Any
+        checkpoint of an unfinished process can be resumed, parked or not
+        (e.g. a periodic one), as long as the live copy is not executing.
+        """
+        with self._lock:
+            if checkpoint is not None:
+                if isinstance(checkpoint, str):
+                    checkpoint = ComputationCheckpoint.load(checkpoint)
+                if "process" not in checkpoint.header:
+                    raise ValueError("Checkpoint does not hold a process")
+                # Validate everything before the live copy is touched
+                process = {**checkpoint.header["process"], "parked": False,
+                           "resources_allocated": {}, "execution_history": []}
+                process_id = process["process_id"]
+                if process["status"] in (ComputationalState.COMPLETED.value, ComputationalState.ERROR.value):
+                    raise ValueError(f"Process {process_id} had already finished when checkpointed")
+                if self._is_dispatched(process_id):
+                    raise ValueError(f"Process {process_id} is executing; suspend it before restoring it")
+                if process["status"] == ComputationalState.EXECUTING.value:
+                    process["status"] = ComputationalState.SUSPENDED.value
+                self.universe.restore_computation(checkpoint)
+                self.scheduler.complete(process_id)  # Drop any live copy from the queue
+                self.memory_manager.release_resources(process_id)
+                self.running_processes[process_id] = process
+            else:
+                if process_id not in self.running_processes:
+                    raise ValueError(f"Process {process_id} not found")
+                process = self.running_processes[process_id]
+                if not process.get("parked"):
+                    raise ValueError(f"Process {process_id} is not suspended")
+                process["parked"] = False
+            self.scheduler.register_process(
+                process_id, process["priority"],
+                cost=self.universe.computations[process["computation_id"]].metadata["complexity"])
+            return process_id
 
     def parallel_execute(self, process_ids: List[str],
-                         operation_plan: List[str] = None) -> Dict[str, Any]:
-        """Execute multiple processes in parallel (vectorized)"""
-        # Batch execution using LDB-V GPU acceleration
+                         operation_plan: List[str] = None,
+                         max_iterations: Optional[int] = None) -> Dict[str, Any]:
+        """Execute multiple processes in parallel across a worker pool
+
+        State vectors are copied once into a shared-memory matrix and the rows
+        are sharded across worker processes. Each process runs with an equal
+        share of the universe energy budget. Final states, RNG streams and results
+        are merged back into the universe and the process histories.
+        `max_iterations` is a time slice as for execute_process.
+        """
         batch_results = {}
-
-        for process_id in process_ids:
-            if process_id in self.running_processes:
+        valid_ids = []
+        with self._lock:
+            for process_id in process_ids:
+                if process_id in self.running_processes:
+                    # Processes passed in while queued are taken off the queue
+                    self.scheduler.dispatch(process_id)
+                    valid_ids.append(process_id)
+                else:
+                    batch_results[process_id] = {"error": f"Process {process_id} not found."}
+
+        workers = min(self.max_workers, len(valid_ids))
+        if workers <= 1:
+            for process_id in valid_ids:
                 try:
-                    result = self.execute_process(process_id, operation_plan)
-                    batch_results[process_id] = result
+                    batch_results[process_id] = self._execute_dispatched(process_id, operation_plan, max_iterations)
                 except Exception as e:
                     # Capture error for individual process in batch
                     batch_results[process_id] = {"error": str(e)}
-            else:
-                batch_results[process_id] = {"error": f"Process {process_id} not found."}
+            return batch_results
+
+        operation_plan = operation_plan or DEFAULT_OPERATION_PLAN
+        with self._lock:
+            processes = []
+            for process_id in valid_ids:
+                process = self.running_processes[process_id]
+                try:
+                    resources = self._allocate_or_defer(process)
+                except SubspaceExhaustedError as e:
+                    batch_results[process_id] = {"error": str(e)}
+                    continue
+                if resources is None:
+                    batch_results[process_id] = {"deferred": "No free subspace; process requeued"}
+                    continue
+                process["status"] = ComputationalState.EXECUTING.value
+                processes.append(process)
+            if not processes:
+                return batch_results
+            valid_ids = [process["process_id"] for process in processes]
+            computations = [self.universe.computations[proc["computation_id"]] for proc in processes]
+
+            shape = (len(computations), self.universe.dimensionality)
+            shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            states = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            with self._lock:
+                for row, computation in enumerate(computations):
+                    states[row] = computation.state_vector
+
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                shards = np.array_split(np.arange(len(computations)), workers)
+                energy_share = self.universe.energy_budget / len(computations)
+                futures = [
+                    self._executor.submit(
+                        _execute_shard, shm.name, shape, rows.tolist(),
+                        [computations[row].idea_id for row in rows],
+                        [computations[row].rng for row in rows],
+                        [computations[row].metadata["complexity"] for row in rows],
+                        self.universe.global_state, operation_plan,
+                        [self._execution_limits(processes[row], max_iterations)
+                         for row in rows],
+                        energy_share,
+                        self.universe.convergence_config)
+                    for rows in shards
+                ]
+
+            # Wait without the lock so processes can be created meanwhile
+            shard_results = []
+            for rows, future in zip(shards, futures):
+                try:
+                    shard_results.append(future.result())
+                except Exception as e:
+                    shard_results.append({"results": {computations[row].idea_id: {"error": str(e)} for row in rows},
+                                          "streams": {}, "energy_used": 0.0})
+
+            energy_used = 0.0
+            with self._lock:
+                for rows, shard in zip(shards, shard_results):
+                    energy_used += shard["energy_used"]
+                    for row in rows:
+                        batch_results[valid_ids[row]] = self._merge_result(
+                            processes[row], computations[row], states[row], operation_plan, max_iterations,
+                            shard["results"][computations[row].idea_id],
+                            shard["streams"].get(computations[row].idea_id))
+            self.universe.energy.consume(energy_used)
+            del states
+        finally:
+            shm.close()
+            shm.unlink()
 
         return batch_results
 
+    def _merge_result(self, process: Dict, computation: VectorComputation, final_state: np.ndarray,
+                      operation_plan: List[str], max_iterations: Optional[int], results: Dict[str, Any],
+                      stream: Optional[RandomStream]) -> Dict[str, Any]:
+        """Apply a worker's outcome to the local computation and process record"""
+        if "error" in results:
+            process["status"] = ComputationalState.ERROR.value
+            process["error"] = results["error"]
+            self.scheduler.complete(process["process_id"])
+        else:
+            computation.next_state_buffer()[...] = final_state
+            computation.commit_state("parallel_execute",
+                                     {"operations": operation_plan, "iterations": results["iterations"]})
+            if results["complexity_evolution"]:
+                computation.metadata["complexity"] = results["complexity_evolution"][-1]
+            computation.rng = stream
+            self._finish_slice(process, results, max_iterations)
+            process["execution_history"].append({
+                "timestamp": np.datetime64('now').astype(str),
+                "operations": operation_plan,
+                "results": results
+            })
+        self.memory_manager.release_resources(process["process_id"])
+        return results
+
     def get_process_state(self, process_id: str) -> Dict[str, Any]:
         """Get current state of a computational process"""
-        if process_id not in self.running_processes:
-            return {"error": "Process not found"}
-
-        process = self.running_processes[process_id]
-        computation = self.universe.computations.get(process["computation_id"])
-
-        return {
-            "process_id": process_id,
-            "status": process["status"],
-            "computation_state": computation.state_vector.tolist() if computation else None,
-            "complexity": computation.metadata["complexity"] if computation else 0,
-            "execution_count": len(process["execution_history"]),
-            "resources": process["resources_allocated"]
-        }
+        with self._lock:
+            if process_id not in self.running_processes:
+                return {"error": "Process not found"}
+
+            process = self.running_processes[process_id]
+            computation = self.universe.computations.get(process["computation_id"])
+
+            return {
+                "process_id": process_id,
+                "status": process["status"],
+                "parked": bool(process.get("parked")),
+                "computation_state": computation.state_list() if computation else None,
+                "complexity": computation.metadata["complexity"] if computation else 0,
+                "execution_count": len(process["execution_history"]),
+                "resources": process["resources_allocated"],
+                "budget": process["budget"],
+                "accounting": {
+                    **process["accounting"],
+                    "iterations": process["iterations_run"],
+                    "energy_remaining": max(0.0, process["budget"]["energy_budget"] - process["accounting"]["energy_used"]),
+                    "quota_remaining": max(0, process["budget"]["computation_quota"] - process["accounting"]["operations"])
+                }
+            }
+
+# Scheduling policies map a queue entry to a heap key (smallest runs first).
+# Keys are computed once at enqueue time, so they must not depend on "now".
+SCHEDULING_POLICIES: Dict[str, Callable[["VectorScheduler", Dict[str, Any]], float]] = {
+    # Effective priority grows by aging_rate per clock tick spent waiting:
+    # priority + rate * (now - enqueued_at). "now" is common to every entry,
+    # so ordering by priority - rate * enqueued_at is equivalent and static.
+    "priority_based": lambda scheduler, entry: -(entry["priority"] - scheduler.aging_rate * entry["enqueued_at"]),
+    "fifo": lambda scheduler, entry: entry["seq"],
+    "shortest_job_first": lambda scheduler, entry: entry["cost"]
+}
 
 class VectorScheduler:
     """Schedules computational processes in vector space"""
 
-    def __init__(self, universe: VectorComputationalUniverse):
+    def __init__(self, universe: VectorComputationalUniverse, scheduling_policy: str = "priority_based",
+                 aging_rate: float = 0.01, time_slice: int = 10):
         self.universe = universe
-        self.process_queue = []
-        self.scheduling_policy = "priority_based"
-
-    def register_process(self, process_id: str, priority: float):
-        """Register a process for scheduling"""
-        self.process_queue.append({"process_id": process_id, "priority": priority})
-        # Sort by priority (higher priority first)
-        self.process_queue.sort(key=lambda x: x["priority"], reverse=True)
+        self.process_queue = []  # Heap of (key, seq, process_id)
+        self.entries = {}  # process_id -> queue entry for queued processes
+        self.policies = dict(SCHEDULING_POLICIES)
+        if scheduling_policy not in self.policies:
+            raise ValueError(f"Unknown scheduling policy: {scheduling_policy}")
+        self.scheduling_policy = scheduling_policy
+        self.aging_rate = aging_rate  # Priority gained per clock tick while waiting
+        self.time_slice = time_slice  # Iterations a process may run before preemption
+        self.clock = 0  # Advances by one per dispatched process
+        self._dispatched = {}  # process_id -> entry, kept until completed or preempted
+        self.last_waits: List[float] = []  # Queue-wait seconds of the last dispatched batch
+        self._seq = 0
+        self.stats = {"registered": 0, "dispatched": 0, "preempted": 0}
+
+    def register_policy(self, name: str, key: Callable[["VectorScheduler", Dict[str, Any]], float]):
+        """Add a scheduling policy; `key(scheduler, entry)` orders the queue ascending"""
+        self.policies[name] = key
+
+    def set_policy(self, name: str):
+        """Switch policy and rebuild the queue under it"""
+        if name not in self.policies:
+            raise ValueError(f"Unknown scheduling policy: {name}")
+        self.scheduling_policy = name
+        self.process_queue = [(self._key(entry), entry["seq"], pid) for pid, entry in self.entries.items()]
+        heapq.heapify(self.process_queue)
+
+    def _key(self, entry: Dict[str, Any]) -> float:
+        return self.policies[self.scheduling_policy](self, entry)
+
+    def _enqueue(self, process_id: str, priority: float, cost: float):
+        self._seq += 1
+        entry = {
+            "process_id": process_id,
+            "priority": priority,
+            "cost": cost,
+            "seq": self._seq,
+            "enqueued_at": self.clock,
+            "enqueued_time": time.monotonic()  # Wall clock, for queue-wait latency
+        }
+        self.entries[process_id] = entry
+        heapq.heappush(self.process_queue, (self._key(entry), entry["seq"], process_id))
+
+    def register_process(self, process_id: str, priority: float, cost: float = 1.0):
+        """Register a process for scheduling (O(log n))"""
+        self._enqueue(process_id, priority, cost)
+        self.stats["registered"] += 1
+
+    def preempt(self, process_id: str):
+        """Requeue a process whose time slice ran out (it keeps its priority and cost)"""
+        entry = self.entries.get(process_id) or self._dispatched.pop(process_id, None)
+        if entry is None:
+            raise ValueError(f"Process {process_id} is not known to the scheduler")
+        self._enqueue(process_id, entry["priority"], entry["cost"])
+        self.stats["preempted"] += 1
+
+    def __contains__(self, process_id: str) -> bool:
+        """Whether the process is queued or dispatched and not yet completed"""
+        return process_id in self.entries or process_id in self._dispatched
+
+    def remove(self, process_id: str):
+        """Drop a queued process; its heap slot is discarded lazily"""
+        self.entries.pop(process_id, None)
+
+    def dispatch(self, process_id: str):
+        """Dispatch one queued process out of order (no-op if it is not queued)"""
+        entry = self.entries.pop(process_id, None)
+        if entry is None:
+            return
+        self._dispatched[process_id] = entry
+        self.clock += 1
+        self.stats["dispatched"] += 1
 
     def schedule_next_batch(self, batch_size: int = 10) -> List[str]:
         """Schedule next batch of processes for execution"""
         scheduled = []
-        for i in range(min(batch_size, len(self.process_queue))):
-            scheduled.append(self.process_queue[i]["process_id"])
+        self.last_waits = []
+        now = time.monotonic()
+        while self.process_queue and len(scheduled) < batch_size:
+            _, seq, process_id = heapq.heappop(self.process_queue)
+            entry = self.entries.get(process_id)
+            if entry is None or entry["seq"] != seq:
+                continue  # Removed or requeued since this slot was pushed
+            del self.entries[process_id]
+            self._dispatched[process_id] = entry
+            scheduled.append(process_id)
+            self.last_waits.append(now - entry["enqueued_time"])
+
+        self.clock += len(scheduled)
+        self.stats["dispatched"] += len(scheduled)
+        return scheduled
 
-        # Remove scheduled processes from queue
-        self.process_queue = self.process_queue[batch_size:]
+    def complete(self, process_id: str):
+        """Forget a finished process, whether still queued or dispatched"""
+        self.entries.pop(process_id, None)
+        self._dispatched.pop(process_id, None)
 
-        return scheduled
+    def effective_priority(self, process_id: str) -> float:
+        """Priority of a queued process including aging"""
+        entry = self.entries[process_id]
+        return entry["priority"] + self.aging_rate * (self.clock - entry["enqueued_at"])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued": len(self.entries),
+            "policy": self.scheduling_policy,
+            "clock": self.clock
+        }
+
+class SubspaceExhaustedError(RuntimeError):
+    """No free subspace is large enough for an allocation"""
 
 class VectorMemoryManager:
-    """Manages computational memory in vector space"""
+    """Manages computational memory in vector space
 
-    def __init__(self, universe: VectorComputationalUniverse):
+    The universe's dimensions are handed out as disjoint [start, start+size)
+    subspaces by a first-fit free-list allocator; released subspaces are
+    coalesced with free neighbours.
+    """
+
+    def __init__(self, universe: VectorComputationalUniverse, energy_budget: float = 100.0,
+                 computation_quota: int = 1000):
         self.universe = universe
         self.allocated_memory = {}
-        self.memory_blocks = {}
-
-    def allocate_resources(self, process_id: str) -> Dict[str, Any]:
-        """Allocate computational resources for a process"""
+        self.memory_blocks = {0: universe.dimensionality}  # Free blocks: start -> size
+        self._free_starts = [0] if universe.dimensionality else []  # Sorted keys of memory_blocks
+        self.energy_budget = energy_budget  # Per-process limits handed out with each subspace
+        self.computation_quota = computation_quota
+        self._released = threading.Condition()
+        self.stats = {"allocations": 0, "releases": 0, "failures": 0}
+
+    def _take_block(self, size: int) -> Optional[int]:
+        """First-fit: carve `size` dimensions off the lowest free block that fits"""
+        for i, start in enumerate(self._free_starts):
+            block_size = self.memory_blocks[start]
+            if block_size < size:
+                continue
+            del self.memory_blocks[start]
+            if block_size == size:
+                del self._free_starts[i]
+            else:
+                self._free_starts[i] = start + size
+                self.memory_blocks[start + size] = block_size - size
+            return start
+        return None
+
+    def _free_block(self, start: int, size: int):
+        """Return a block to the free list, merging it with adjacent free blocks"""
+        i = bisect.bisect_left(self._free_starts, start)
+        if i < len(self._free_starts) and start + size == self._free_starts[i]:
+            size += self.memory_blocks.pop(self._free_starts.pop(i))
+        if i > 0:
+            previous = self._free_starts[i - 1]
+            if previous + self.memory_blocks[previous] == start:
+                self.memory_blocks[previous] += size
+                return
+        self._free_starts.insert(i, start)
+        self.memory_blocks[start] = size
+
+    def default_subspace_size(self) -> int:
         # In vector space, "memory" is subspace allocation
-        subspace_size = self.universe.dimensionality // 100  # 1% of total space
-        start_pos = len(self.allocated_memory) * subspace_size
-
-        resources = {
-            "subspace_start": start_pos,
-            "subspace_size": subspace_size,
-            "energy_budget": 100.0,
-            "computation_quota": 1000
-        }
-
-        self.allocated_memory[process_id] = resources
-        return resources
+        return max(1, self.universe.dimensionality // 100)  # 1% of total space
+
+    def free_subspaces(self, subspace_size: Optional[int] = None) -> int:
+        """How many more subspaces of the given (default) size could be allocated now"""
+        size = subspace_size or self.default_subspace_size()
+        with self._released:
+            return sum(block_size // size for block_size in self.memory_blocks.values())
+
+    def allocate_resources(self, process_id: str, subspace_size: Optional[int] = None,
+                           block: bool = False, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Allocate computational resources for a process
+
+        Raises SubspaceExhaustedError when no free block fits, or, with
+        `block=True`, waits up to `timeout` seconds for a release first.
+        """
+        size = subspace_size or self.default_subspace_size()
+        with self._released:
+            if process_id in self.allocated_memory:
+                return self.allocated_memory[process_id]
+
+            start_pos = self._take_block(size)
+            if start_pos is None and block:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while start_pos is None:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._released.wait(remaining)
+                    start_pos = self._take_block(size)
+            if start_pos is None:
+                self.stats["failures"] += 1
+                raise SubspaceExhaustedError(
+                    f"No free subspace of size {size} for process {process_id}")
+
+            resources = {
+                "subspace_start": start_pos,
+                "subspace_size": size,
+                "energy_budget": self.energy_budget,
+                "computation_quota": self.computation_quota
+            }
+            self.allocated_memory[process_id] = resources
+            self.stats["allocations"] += 1
+            return resources
 
     def release_resources(self, process_id: str):
         """Release resources allocated to a process"""
-        if process_id in self.allocated_memory:
-            del self.allocated_memory[process_id]
\ No newline at end of file
+        with self._released:
+            resources = self.allocated_memory.pop(process_id, None)
+            if resources is None:
+                return
+            self._free_block(resources["subspace_start"], resources["subspace_size"])
+            self.stats["releases"] += 1
+            self._released.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Allocation counters and fragmentation of the free space"""
+        with self._released:
+            free = sum(self.memory_blocks.values())
+            largest = max(self.memory_blocks.values(), default=0)
+            return {
+                **self.stats,
+                "total": self.universe.dimensionality,
+                "allocated": self.universe.dimensionality - free,
+                "free": free,
+                "free_blocks": len(self.memory_blocks),
+                "largest_free_block": largest,
+                # Share of free space unusable by a single allocation of the largest size
+                "fragmentation": 1.0 - largest / free if free else 0.0,
+                "active_allocations": len(self.allocated_memory)
+            }
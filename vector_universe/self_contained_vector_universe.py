@@ -8,17 +8,26 @@ without external file dependencies.
 """
 
 import os
+import errno
+import hashlib
+import heapq
 import json
 import logging
+import math
+import mmap
 import time
 import uuid
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 import re
+import posixpath
+import shlex
 import struct
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 
 # Configure logging for self-contained operation
 logging.basicConfig(
@@ -188,6 +197,7 @@ class SelfContainedVectorUniverse:
         operation_map = {
             'hypervisor_create_vm': self.vector_hypervisor.create_vm,
             'hypervisor_execute': self.vector_hypervisor.execute_vm,
+            'hypervisor_submit': self.vector_hypervisor.submit_vm,
             # 'hypervisor_manage': self.vector_hypervisor.manage_vm,
             'hypervisor_boot_linux': self.vector_hypervisor.boot_linux
         }
@@ -203,6 +213,7 @@ class SelfContainedVectorUniverse:
         operation_map = {
             'linux_boot': self.linux_simulator.boot_system,
             'linux_execute': self.linux_simulator.execute_command,
+            'linux_execute_batch': self.linux_simulator.execute_batch,
             # 'linux_process': self.linux_simulator.manage_process,
             # 'linux_memory': self.linux_simulator.manage_memory
         }
@@ -217,7 +228,10 @@ class SelfContainedVectorUniverse:
         """Execute x86 abstraction operations."""
         operation_map = {
             'x86_translate': self.x86_abstraction.translate_instruction,
+            'x86_translate_program': self.x86_abstraction.translate_program,
+            'x86_translate_binary': self.x86_abstraction.translate_binary,
             'x86_execute': self.x86_abstraction.execute_operation,
+            'x86_execute_program': self.x86_abstraction.execute_program,
             'x86_optimize': self.x86_abstraction.optimize_operation
         }
 
@@ -380,6 +394,20 @@ class SelfContainedVectorDatabase:
 class VectorHypervisorEngine:
     """Self-contained vector hypervisor engine."""
 
+    # Firmware, bootloader, kernel and init run in sequence; once init is up,
+    # systemd-style units start concurrently and login waits on the ones it needs
+    DEFAULT_BOOT_PHASES = [
+        {'phase': 'bios', 'duration': 0.5, 'after': []},
+        {'phase': 'bootloader', 'duration': 0.8, 'after': ['bios'], 'cacheable': True},
+        {'phase': 'kernel', 'duration': 1.2, 'after': ['bootloader'], 'cacheable': True},
+        {'phase': 'init', 'duration': 0.7, 'after': ['kernel'], 'cacheable': True},
+        {'phase': 'udev', 'duration': 0.4, 'after': ['init']},
+        {'phase': 'filesystems', 'duration': 0.3, 'after': ['init']},
+        {'phase': 'logging', 'duration': 0.2, 'after': ['init']},
+        {'phase': 'network', 'duration': 0.5, 'after': ['init']},
+        {'phase': 'userspace', 'duration': 0.3, 'after': ['udev', 'filesystems', 'logging']}
+    ]
+
     def __init__(self):
         self.virtual_machines = {}
         self.vm_stats = {
@@ -388,6 +416,8 @@ class VectorHypervisorEngine:
             'executions': 0,
             'memory_usage': 0
         }
+        self.execution_engine = VMExecutionEngine()
+        self.boot_checkpoints = {}  # (image name, phase graph fingerprint) -> completed cacheable phases
 
     def initialize(self, config):
         """Initialize hypervisor with configuration."""
@@ -395,7 +425,11 @@ class VectorHypervisorEngine:
         self.max_vms = config.get('max_vms', 10)
         self.memory_limit = config.get('memory_limit_mb', 1024)
 
-        logger.info(f"Vector hypervisor initialized (max {self.max_vms} VMs, {self.memory_limit}MB memory)")
+        # Size the worker pool to the host unless overridden
+        self.execution_engine.configure(config.get('worker_threads'))
+
+        logger.info(f"Vector hypervisor initialized (max {self.max_vms} VMs, {self.memory_limit}MB memory, "
+                    f"{self.execution_engine.workers} workers)")
 
     def create_vm(self, config):
         """Create a new virtual machine."""
@@ -417,6 +451,7 @@ class VectorHypervisorEngine:
         }
 
         self.virtual_machines[vm_id] = vm
+        self.execution_engine.register_vm(vm_id, vm['cpu_cores'])
         self.vm_stats['active_vms'] += 1
         self.vm_stats['total_created'] += 1
         self.vm_stats['memory_usage'] += vm['memory_mb']
@@ -425,67 +460,118 @@ class VectorHypervisorEngine:
         return vm
 
     def execute_vm(self, vm_id, operation):
-        """Execute operation on a virtual machine."""
+        """
+        Execute operation on a virtual machine and wait for the result.
+
+        Called from inside a VM operation (i.e. on a pool worker), the
+        operation runs inline: waiting on the pool from one of its own
+        workers would deadlock once every worker is busy.
+        """
+        if self.execution_engine.in_worker():
+            return self._run_vm_operation(self._prepare_vm_operation(vm_id, operation), operation)
+        return self.submit_vm(vm_id, operation).result()
+
+    def submit_vm(self, vm_id, operation):
+        """
+        Queue an operation on a virtual machine without waiting for it.
+
+        Args:
+            vm_id: Target VM identifier
+            operation: Name of a built-in VM operation (see
+                _vm_operation_map), or a callable taking the VM dict; either
+                way its return value is reported as the operation output
+
+        Returns:
+            concurrent.futures.Future resolving to the execution result
+        """
+        vm = self._prepare_vm_operation(vm_id, operation)
+        return self.execution_engine.submit(vm_id, lambda: self._run_vm_operation(vm, operation))
+
+    def _vm_operation_map(self):
+        """Built-in operations that can be requested by name."""
+        return {
+            'status': lambda vm: dict(vm),
+            'boot_linux': lambda vm: self.boot_linux(vm['id'], {})
+        }
+
+    def _prepare_vm_operation(self, vm_id, operation):
+        """Validate an operation and record its use on the VM."""
         if vm_id not in self.virtual_machines:
             raise ValueError(f"VM not found: {vm_id}")
+        if not callable(operation) and operation not in self._vm_operation_map():
+            raise ValueError(f"Unknown VM operation: {operation}")
 
         vm = self.virtual_machines[vm_id]
         vm['last_used'] = datetime.now().isoformat()
         vm['execution_count'] += 1
         self.vm_stats['executions'] += 1
+        return vm
+
+    def _run_vm_operation(self, vm, operation):
+        """Run a single VM operation on a worker thread."""
+        start_time = time.perf_counter()
+        handler = operation if callable(operation) else self._vm_operation_map()[operation]
+        output = handler(vm)
 
-        # Simulate VM execution
         execution_result = {
-            'vm_id': vm_id,
-            'operation': operation,
+            'vm_id': vm['id'],
+            'operation': getattr(operation, '__name__', operation),
             'status': 'completed',
-            'execution_time': 0.01 * vm['cpu_cores'],  # Simulated
+            'output': output,
+            'execution_time': time.perf_counter() - start_time,
+            'worker': threading.current_thread().name,
             'timestamp': datetime.now().isoformat()
         }
 
-        logger.debug(f"Executed {operation} on VM {vm_id}")
+        logger.debug(f"Executed {execution_result['operation']} on VM {vm['id']}")
         return execution_result
 
     def boot_linux(self, vm_id, boot_config):
-        """Boot Linux operating system on a VM."""
+        """
+        Boot Linux operating system on a VM.
+
+        Phases run as a dependency DAG and the reported boot time is the
+        critical path. With ``resume_from_checkpoint`` set in ``boot_config``,
+        cacheable phases already completed for the same ``image`` and the same
+        phase graph are skipped.
+        """
         if vm_id not in self.virtual_machines:
             raise ValueError(f"VM not found: {vm_id}")
 
         vm = self.virtual_machines[vm_id]
+        boot_config = boot_config or {}
+        image = boot_config.get('image', 'default')
 
         # Simulate Linux boot process
-        boot_phases = [
-            {'phase': 'bios', 'duration': 0.5},
-            {'phase': 'bootloader', 'duration': 0.8},
-            {'phase': 'kernel', 'duration': 1.2},
-            {'phase': 'init', 'duration': 0.7},
-            {'phase': 'userspace', 'duration': 1.0}
-        ]
+        boot_graph = BootPhaseGraph(boot_config.get('boot_phases') or self.DEFAULT_BOOT_PHASES)
+        # A checkpoint is only valid for the phase graph that produced it
+        checkpoint_key = (image, boot_graph.fingerprint())
 
-        boot_results = []
-        total_boot_time = 0
+        completed = set()
+        if boot_config.get('resume_from_checkpoint'):
+            completed = self.boot_checkpoints.get(checkpoint_key, set())
 
-        for phase in boot_phases:
-            # Simulate phase execution
-            phase_result = {
-                'phase': phase['phase'],
-                'duration': phase['duration'] * vm['cpu_cores'] / 2,  # CPU scaling
-                'status': 'completed',
-                'timestamp': datetime.now().isoformat()
-            }
-            boot_results.append(phase_result)
-            total_boot_time += phase_result['duration']
+        schedule = boot_graph.schedule(
+            duration_scale=vm['cpu_cores'] / 2,  # CPU scaling
+            completed=completed
+        )
+        self.boot_checkpoints[checkpoint_key] = boot_graph.checkpoint()
+        total_boot_time = schedule['total_boot_time']
 
         # Update VM status
         vm['status'] = 'booted'
         vm['os_type'] = 'linux'
         vm['boot_time'] = total_boot_time
 
-        logger.info(f"Linux boot completed on VM {vm_id} in {total_boot_time:.2f}s")
+        logger.info(f"Linux boot completed on VM {vm_id} in {total_boot_time:.2f}s "
+                    f"({len(schedule['skipped_phases'])} phases resumed from checkpoint)")
         return {
             'vm_id': vm_id,
-            'boot_phases': boot_results,
+            'boot_phases': schedule['phases'],
             'total_boot_time': total_boot_time,
+            'serial_boot_time': schedule['serial_boot_time'],
+            'critical_path': schedule['critical_path'],
+            'skipped_phases': schedule['skipped_phases'],
             'status': 'success',
             'timestamp': datetime.now().isoformat()
         }
@@ -497,9 +583,14 @@ class VectorHypervisorEngine:
             'total_created': self.vm_stats['total_created'],
             'executions': self.vm_stats['executions'],
             'memory_usage_mb': self.vm_stats['memory_usage'],
+            'scheduler': self.execution_engine.get_stats(),
             'timestamp': datetime.now().isoformat()
         }
 
+    def shutdown(self):
+        """Drain queued VM operations and stop the worker pool."""
+        self.execution_engine.shutdown()
+
     def optimize(self):
         """Run hypervisor optimization routines."""
         optimizations = []
@@ -531,22 +622,40 @@ class EmbeddedLinuxSimulator:
             'services': {}
         }
 
-        self.filesystem = {
-            'root': {
-                'etc': {'config': 'sample config content'},
-                'var': {'log': {'system.log': 'log content'}},
-                'home': {}
-            }
-        }
+        self.filesystem = VectorFileSystem.from_tree({
+            'etc': {'config': 'sample config content'},
+            'var': {'log': {'system.log': 'log content'}},
+            'home': {}
+        })
 
-        self.process_table = {}
-        self.memory_map = {}
+        self.process_table = {}  # pid -> process record
+        self.memory_map = {}  # pid -> resident memory in KB
+        self.memory_used_kb = 0
+        self.runqueue = []  # heap of (vruntime, seq, pid); may hold stale entries
+        self.nr_runnable = 0  # Live runqueue entries (stale ones are not counted)
+        self.next_pid = 1
+        self.run_sequence = 0
+        self.clock = 0.0  # Simulated CPU-time clock in seconds
+        self.cpus = 1
+        self.total_memory_kb = 1024 * 1024
+        self.boot_checkpoint = set()  # Cacheable phases completed by the last boot
+
+    # CFS tuning, in simulated seconds
+    SCHED_LATENCY = 0.006
+    SCHED_MIN_GRANULARITY = 0.00075
+    NICE_0_WEIGHT = 1024
+    LOAD_AVERAGE_PERIODS = (60.0, 300.0, 900.0)
+
+    # Pipeline streams hand file contents downstream in views of this size
+    STREAM_CHUNK_SIZE = 64 * 1024
 
     def initialize(self, config):
         """Initialize Linux simulator with configuration."""
         # Set system parameters
         self.system_state['hostname'] = config.get('hostname', 'vector-linux')
         self.system_state['kernel_version'] = config.get('kernel_version', '5.15.0-vector')
+        self.cpus = config.get('cpus', 1)
+        self.total_memory_kb = config.get('memory_mb', 1024) * 1024
 
         # Start essential services
         self._start_essential_services()
@@ -562,37 +671,36 @@ class EmbeddedLinuxSimulator:
         ]
 
         for service in essential_services:
+            # Services idle in the process table until woken; they hold memory
+            # but never sit on the runqueue
+            pid = self.spawn_process(service['name'], cpu_time=0.0, runnable=False)
             self.system_state['services'][service['name']] = {
-                'pid': service['pid'],
+                'pid': pid,
                 'status': 'running',
                 'started_at': datetime.now().isoformat()
             }
 
-        self.system_state['processes'] = len(essential_services)
-
-    def boot_system(self):
-        """Simulate complete Linux system boot."""
-        boot_sequence = [
-            {'phase': 'bios_init', 'duration': 0.3},
-            {'phase': 'hardware_detect', 'duration': 0.5},
-            {'phase': 'kernel_load', 'duration': 0.8},
-            {'phase': 'initramfs', 'duration': 0.4},
-            {'phase': 'root_mount', 'duration': 0.6},
-            {'phase': 'service_start', 'duration': 1.2}
-        ]
-
-        boot_log = []
-        total_time = 0
+    def boot_system(self, resume_from_checkpoint=False):
+        """
+        Simulate complete Linux system boot.
 
-        for phase in boot_sequence:
-            phase_log = {
-                'phase': phase['phase'],
-                'duration': phase['duration'],
-                'status': 'completed',
-                'timestamp': datetime.now().isoformat()
-            }
-            boot_log.append(phase_log)
-            total_time += phase['duration']
+        Independent phases run concurrently; the reported boot time is the
+        critical path through the phase DAG. ``resume_from_checkpoint`` skips
+        cacheable phases completed by a previous boot.
+        """
+        boot_graph = BootPhaseGraph([
+            {'phase': 'bios_init', 'duration': 0.3, 'after': []},
+            {'phase': 'hardware_detect', 'duration': 0.5, 'after': ['bios_init']},
+            {'phase': 'kernel_load', 'duration': 0.8, 'after': ['bios_init'], 'cacheable': True},
+            {'phase': 'initramfs', 'duration': 0.4, 'after': ['kernel_load'], 'cacheable': True},
+            {'phase': 'root_mount', 'duration': 0.6, 'after': ['hardware_detect', 'initramfs']},
+            {'phase': 'service_start', 'duration': 1.2, 'after': ['root_mount']}
+        ])
+
+        completed = self.boot_checkpoint if resume_from_checkpoint else set()
+        schedule = boot_graph.schedule(completed=completed)
+        self.boot_checkpoint = boot_graph.checkpoint()
+        total_time = schedule['total_boot_time']
 
         # Update system state
         self.system_state.update({
@@ -603,31 +711,397 @@ class EmbeddedLinuxSimulator:
 
         logger.info(f"Linux system boot completed in {total_time:.2f}s")
         return {
-            'boot_sequence': boot_log,
+            'boot_sequence': schedule['phases'],
             'total_boot_time': total_time,
+            'serial_boot_time': schedule['serial_boot_time'],
+            'critical_path': schedule['critical_path'],
+            'skipped_phases': schedule['skipped_phases'],
             'system_state': self.system_state,
             'timestamp': datetime.now().isoformat()
         }
 
     def execute_command(self, command):
-        """Execute a Linux command in the simulated environment."""
-        # Simulate command execution
-        execution_result = {
-            'command': command,
-            'status': 'completed',
-            'output': f"Executed: {command}",
-            'exit_code': 0,
-            'duration': 0.01 + len(command) * 0.001,
+        """Execute a Linux command (or ``a | b | c`` pipeline) in the simulated environment."""
+        execution_result = self.execute_batch([command])['results'][0]
+        execution_result['timestamp'] = datetime.now().isoformat()
+
+        logger.debug(f"Executed command: {command}")
+        return execution_result
+
+    def execute_batch(self, commands):
+        """
+        Execute independent commands in one call.
+
+        Every command (and every stage of a pipeline) becomes a process, and
+        all of them share the CPU through the scheduler at once. Per-call
+        bookkeeping such as timestamps and logging happens once per batch.
+
+        Args:
+            commands: List of command lines
+
+        Returns:
+            Dictionary with per-command results and batch throughput
+        """
+        started_at = self.clock
+        # Run every command line before spawning any process, so nothing is
+        # left on the runqueue if one of them raises
+        dispatched = [self._dispatch_command(command) for command in commands]
+        jobs = []
+        for command, (exit_code, output, stages) in zip(commands, dispatched):
+            # Each process competes with every runnable process for CPU; a
+            # command's duration is the turnaround until its last stage exits
+            pids = [self.spawn_process(stage, cpu_time=0.01 + len(stage) * 0.001) for stage in stages]
+            jobs.append((command, exit_code, output, pids))
+
+        exit_times = self.run_until_exit(pid for _, _, _, pids in jobs for pid in pids)
+
+        results = []
+        for command, exit_code, output, pids in jobs:
+            results.append({
+                'command': command,
+                'pids': pids,
+                'status': 'completed' if exit_code == 0 else 'failed',
+                'output': output,
+                'exit_code': exit_code,
+                'duration': max(exit_times.get(pid, self.clock) for pid in pids) - started_at
+            })
+
+        total_duration = self.clock - started_at
+        logger.debug(f"Executed batch of {len(commands)} commands")
+        return {
+            'results': results,
+            'commands': len(commands),
+            'failed': sum(1 for result in results if result['exit_code'] != 0),
+            'total_duration': total_duration,
+            'throughput': len(commands) / total_duration if total_duration > 0 else 0.0,
             'timestamp': datetime.now().isoformat()
         }
 
-        # Update system state
-        self.system_state['processes'] += 1
-        if self.system_state['processes'] > 0:
-            self.system_state['load_average'][0] += 0.1
+    def spawn_process(self, command, cpu_time, nice=0, memory_kb=4096, runnable=True):
+        """
+        Create a process and (optionally) enqueue it on the CFS runqueue.
 
-        logger.debug(f"Executed command: {command}")
-        return execution_result
+        Args:
+            command: Command line the process runs
+            cpu_time: Simulated CPU seconds the process needs before exiting
+            nice: Nice value; each step is a ~1.25x change in CPU share
+            memory_kb: Resident memory charged while the process lives
+            runnable: False creates a sleeping process (e.g. a daemon)
+
+        Returns:
+            The new PID
+        """
+        pid = self.next_pid
+        self.next_pid += 1
+
+        # New tasks start at the queue minimum so they neither starve nor
+        # get a burst of catch-up time
+        min_vruntime = self._min_vruntime()
+        self.process_table[pid] = {
+            'pid': pid,
+            'command': command,
+            'state': 'runnable' if runnable else 'sleeping',
+            'nice': nice,
+            'weight': self.NICE_0_WEIGHT / (1.25 ** nice),
+            'vruntime': min_vruntime,
+            'cpu_time': 0.0,
+            'remaining': cpu_time,
+            'started_at': self.clock
+        }
+        self.memory_map[pid] = memory_kb
+        self.memory_used_kb += memory_kb
+
+        if runnable:
+            self._enqueue(pid)
+        self._refresh_process_stats()
+        return pid
+
+    def _enqueue(self, pid):
+        """Put a process on the runqueue keyed by virtual runtime."""
+        self.run_sequence += 1
+        process = self.process_table[pid]
+        process['run_sequence'] = self.run_sequence
+        heapq.heappush(self.runqueue, (process['vruntime'], self.run_sequence, pid))
+        self.nr_runnable += 1
+
+    def _is_live(self, entry):
+        """Whether a runqueue entry still belongs to a queued, runnable process."""
+        _, sequence, pid = entry
+        process = self.process_table.get(pid)
+        return (process is not None and process['state'] == 'runnable' and
+                process.get('run_sequence') == sequence)
+
+    def _min_vruntime(self):
+        """Smallest vruntime on the runqueue, discarding stale entries at the top."""
+        while self.runqueue and not self._is_live(self.runqueue[0]):
+            heapq.heappop(self.runqueue)
+        return self.runqueue[0][0] if self.runqueue else 0.0
+
+    def exit_process(self, pid, exit_code=0):
+        """Terminate a process and release its memory."""
+        process = self.process_table.pop(pid, None)
+        if process is None:
+            raise ValueError(f"Process not found: {pid}")
+        if process['state'] == 'runnable':
+            self.nr_runnable -= 1
+        process['state'] = 'exited'
+        process['exit_code'] = exit_code
+        self.memory_used_kb -= self.memory_map.pop(pid, 0)
+        # Its runqueue entry is now stale and is discarded lazily when popped
+        self._refresh_process_stats()
+        return process
+
+    def schedule_tick(self):
+        """
+        Run one scheduling quantum.
+
+        The lowest-vruntime processes (one per CPU) run for a slice of the
+        target latency, their vruntime advances inversely to their weight,
+        and finished processes exit.
+
+        Returns:
+            PIDs of processes that exited during this quantum
+        """
+        picked = []
+        while self.runqueue and len(picked) < self.cpus:
+            entry = heapq.heappop(self.runqueue)
+            if self._is_live(entry):
+                process = self.process_table[entry[2]]
+                process['state'] = 'running'
+                self.nr_runnable -= 1
+                picked.append(process)
+
+        if not picked:
+            return []
+
+        nr_running = self.nr_runnable + len(picked)
+        time_slice = max(self.SCHED_MIN_GRANULARITY, self.SCHED_LATENCY / nr_running)
+        elapsed = min(time_slice, min(process['remaining'] for process in picked))
+
+        self._update_load_average(elapsed, nr_running)
+        self.clock += elapsed
+        self.system_state['uptime'] += elapsed
+
+        exited = []
+        for process in picked:
+            process['cpu_time'] += elapsed
+            process['remaining'] -= elapsed
+            process['vruntime'] += elapsed * self.NICE_0_WEIGHT / process['weight']
+            if process['remaining'] <= 1e-12:
+                self.exit_process(process['pid'])
+                exited.append(process['pid'])
+            else:
+                process['state'] = 'runnable'
+                self._enqueue(process['pid'])
+
+        return exited
+
+    def run_until_exit(self, pids):
+        """
+        Schedule until all the given processes exit.
+
+        Returns:
+            Dictionary mapping each PID to the simulated clock at its exit
+        """
+        pending = {pid for pid in pids if pid in self.process_table}
+        exit_times = {}
+        while pending and self.nr_runnable:
+            for pid in self.schedule_tick():
+                exit_times[pid] = self.clock
+                pending.discard(pid)
+        return exit_times
+
+    def run_scheduler(self, duration):
+        """Schedule runnable processes for up to ``duration`` simulated seconds."""
+        deadline = self.clock + duration
+        while self.clock < deadline and self.nr_runnable:
+            self.schedule_tick()
+
+        # Idle time still decays the load average
+        if self.clock < deadline:
+            idle = deadline - self.clock
+            self._update_load_average(idle, 0)
+            self.clock += idle
+            self.system_state['uptime'] += idle
+
+        return {
+            'clock': self.clock,
+            'runnable': self.nr_runnable,
+            'load_average': self.system_state['load_average']
+        }
+
+    def _update_load_average(self, elapsed, nr_running):
+        """Exponentially decay the 1/5/15-minute load averages over ``elapsed``."""
+        load = self.system_state['load_average']
+        for i, period in enumerate(self.LOAD_AVERAGE_PERIODS):
+            decay = math.exp(-elapsed / period)
+            load[i] = load[i] * decay + nr_running * (1 - decay)
+
+    def _refresh_process_stats(self):
+        """Mirror the process table into the summary counters."""
+        self.system_state['processes'] = len(self.process_table)
+        self.system_state['memory_usage'] = round(100.0 * self.memory_used_kb / self.total_memory_kb, 2)
+
+    def _dispatch_command(self, command):
+        """
+        Run a command line against the builtins.
+
+        Pipeline stages are chained generators, so bytes stream from one
+        stage to the next without materializing intermediate outputs. A
+        trailing ``>`` or ``>>`` redirects the last stage into a file.
+
+        Returns:
+            Tuple of (exit_code, output, stage command lines); a command line
+            that cannot be parsed exits with code 2 like a shell syntax error
+        """
+        lexer = shlex.shlex(command, posix=True, punctuation_chars='>|')
+        lexer.whitespace_split = True
+        try:
+            tokens = list(lexer)
+        except ValueError as e:
+            return 2, f"sh: syntax error: {e}", [command]
+
+        # Only a trailing redirect is understood; it applies to the last stage
+        redirect = None
+        if tokens and tokens[-1] in ('>', '>>'):
+            return 2, f"sh: syntax error near unexpected token '{tokens[-1]}'", [command]
+        if len(tokens) >= 2 and tokens[-2] in ('>', '>>'):
+            redirect = (tokens[-2], tokens[-1])
+            tokens = tokens[:-2]
+
+        stages = [[]]
+        for token in tokens:
+            if token == '|':
+                stages.append([])
+            else:
+                stages[-1].append(token)
+        labels = [command] if len(stages) == 1 else [' '.join(argv) for argv in stages]
+
+        builtins = self._builtin_commands()
+        exit_codes = [0] * len(stages)
+        errors = []
+        stream = iter(())
+        for index, argv in enumerate(stages):
+            builtin = builtins.get(argv[0]) if argv else None
+            if builtin is None:
+                stage = self._cmd_external(labels[index], stream)
+            else:
+                stage = builtin(argv[1:], stream)
+            stream = self._guard_stage(argv[0] if argv else 'sh', stage, index, exit_codes, errors)
+
+        try:
+            if redirect:
+                operator, target = redirect
+                self.filesystem.write(target, b''.join(stream), append=operator == '>>')
+                stdout = b''
+            else:
+                stdout = b''.join(stream)
+        except OSError as e:
+            stdout = b''
+            exit_codes[-1] = 1
+            errors.append(f"sh: {e.filename}: {e.strerror}")
+
+        # Like command substitution, drop the trailing newline
+        output = stdout.decode('utf-8', 'replace').rstrip('\n')
+        return exit_codes[-1], '\n'.join(part for part in [output] + errors if part), labels
+
+    @staticmethod
+    def _guard_stage(name, stage, index, exit_codes, errors):
+        """Stream a stage's output, turning failures into an exit code and stderr line."""
+        try:
+            yield from stage
+        except OSError as e:
+            exit_codes[index] = 1
+            errors.append(f"{name}: {e.filename}: {e.strerror}")
+        except ValueError as e:
+            exit_codes[index] = 2
+            errors.append(f"{name}: {e}")
+
+    @staticmethod
+    def _iter_lines(stream):
+        """Re-chunk a byte stream into lines (the last may lack a newline)."""
+        pending = b''
+        for chunk in stream:
+            lines = (pending + bytes(chunk)).split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line + b'\n'
+        if pending:
+            yield pending
+
+    def _builtin_commands(self):
+        """Commands served by the in-memory filesystem and stream utilities."""
+        return {
+            'ls': self._cmd_ls,
+            'cat': self._cmd_cat,
+            'echo': self._cmd_echo,
+            'grep': self._cmd_grep,
+            'head': self._cmd_head,
+            'wc': self._cmd_wc
+        }
+
+    def _cmd_external(self, label, stdin):
+        """Stand-in for commands the simulator does not implement."""
+        yield f"Executed: {label}\n".encode('utf-8')
+
+    def _cmd_ls(self, args, stdin):
+        """List directory entries (or echo a file path)."""
+        for path in args or ['/']:
+            if self.filesystem.stat(path)['type'] == 'dir':
+                for name in self.filesystem.listdir(path):
+                    yield name.encode('utf-8') + b'\n'
+            else:
+                yield path.encode('utf-8') + b'\n'
+
+    def _cmd_cat(self, args, stdin):
+        """Concatenate file contents, or pass stdin through."""
+        if not args:
+            yield from stdin
+        for path in args:
+            data = memoryview(self.filesystem.read(path))
+            for offset in range(0, len(data), self.STREAM_CHUNK_SIZE):
+                yield data[offset:offset + self.STREAM_CHUNK_SIZE]
+
+    def _cmd_echo(self, args, stdin):
+        """Echo arguments."""
+        yield ' '.join(args).encode('utf-8') + b'\n'
+
+    def _cmd_grep(self, args, stdin):
+        """Print lines matching a regular expression."""
+        if not args:
+            raise ValueError("usage: grep PATTERN [FILE...]")
+        try:
+            pattern = re.compile(args[0].encode('utf-8'))
+        except re.error as e:
+            raise ValueError(f"invalid pattern: {e}") from e
+        source = self._cmd_cat(args[1:], stdin)
+        for line in self._iter_lines(source):
+            if pattern.search(line):
+                yield line
+
+    def _cmd_head(self, args, stdin):
+        """Print the first lines of the input (``-n N``, default 10)."""
+        count = 10
+        if args[:1] == ['-n'] and len(args) > 1:
+            count = int(args[1])
+            args = args[2:]
+        if count <= 0:
+            return
+        for index, line in enumerate(self._iter_lines(self._cmd_cat(args, stdin))):
+            yield line
+            if index + 1 >= count:
+                return
+
+    def _cmd_wc(self, args, stdin):
+        """Count lines, words and bytes (``-l`` for lines only)."""
+        lines_only = '-l' in args
+        lines = words = size = 0
+        for line in self._iter_lines(self._cmd_cat([a for a in args if a != '-l'], stdin)):
+            lines += line.endswith(b'\n')
+            words += len(line.split())
+            size += len(line)
+        counts = [lines] if lines_only else [lines, words, size]
+        yield ' '.join(str(count) for count in counts).encode('utf-8') + b'\n'
 
     def get_stats(self):
         """Get Linux simulator statistics."""
@@ -638,6 +1112,8 @@ class EmbeddedLinuxSimulator:
             'memory_usage': self.system_state['memory_usage'],
             'load_average': self.system_state['load_average'],
             'services': len(self.system_state['services']),
+            'runqueue': self.nr_runnable,
+            'filesystem': self.filesystem.get_stats(),
             'timestamp': datetime.now().isoformat()
         }
 
@@ -751,6 +1227,8 @@ class PerformanceMonitoring:
             'success_rate': 0.0,
             'error_rate': 0.0
         }
+        self.success_count = 0
+        self.total_latency = 0.0
         self.start_time = time.time()
 
     def start(self):
@@ -767,10 +1245,11 @@ class PerformanceMonitoring:
             'timestamp': datetime.now().isoformat()
         })
 
-        # Update rates
+        # Update rates from running totals so recording stays O(1)
         total = len(self.metrics['operations'])
-        success = len([op for op in self.metrics['operations'] if op['status'] == 'success'])
-        self.metrics['success_rate'] = success / total if total > 0 else 1.0
+        self.success_count += status == 'success'
+        self.total_latency += duration
+        self.metrics['success_rate'] = self.success_count / total if total > 0 else 1.0
         self.metrics['error_rate'] = 1.0 - self.metrics['success_rate']
 
     def get_metrics(self):
@@ -784,7 +1263,7 @@ class PerformanceMonitoring:
                 'timestamp': datetime.now().isoformat()
             }
 
-        avg_latency = sum(op['duration'] for op in self.metrics['operations']) / len(self.metrics['operations'])
+        avg_latency = self.total_latency / len(self.metrics['operations'])
 
         return {
             'total_operations': len(self.metrics['operations']),
@@ -798,14 +1277,51 @@ class PerformanceMonitoring:
 class VectorX86AbstractionLayer:
     """Self-contained x86 abstraction layer."""
 
-    def __init__(self):
+    # Opcodes that end a basic block
+    BLOCK_TERMINATORS = ('JMP', 'CALL', 'RET')
+    OPCODE_MAP = {
+        'MOV': 'memory_copy',
+        'ADD': 'elementwise_add',
+        'SUB': 'elementwise_sub',
+        'MUL': 'elementwise_mul',
+        'AND': 'elementwise_and',
+        'OR': 'elementwise_or',
+        'XOR': 'elementwise_xor',
+        'CMP': 'flags_compare',
+        'TEST': 'flags_test',
+        'JMP': 'control_flow_jump',
+        'CALL': 'function_call',
+        'RET': 'function_return'
+    }
+    UFUNCS = {'ADD': np.add, 'SUB': np.subtract, 'MUL': np.multiply,
+              'AND': np.bitwise_and, 'OR': np.bitwise_or, 'XOR': np.bitwise_xor}
+    # Decoded mnemonics with no faithful translation: carries, RDX:RAX
+    # products and quotients, and indirect or far transfers
+    UNTRANSLATABLE = frozenset(('ADC', 'SBB', 'DIV', 'IDIV', 'CALLF', 'JMPF'))
+    # Mnemonics that only set flags (or only touch the stack), never a register operand
+    NON_WRITING = frozenset(('CMP', 'TEST', 'PUSH', 'CALL', 'JMP', 'RET', 'NOP'))
+
+    def __init__(self, cache_size=1024):
         self.opcode_map = self._create_opcode_map()
-        self.translation_cache = {}
+        self.translation_cache = LRUCache(max_size=cache_size)
         self.performance_stats = {
             'translations': 0,
             'executions': 0,
-            'optimizations': 0
+            'optimizations': {
+                'runs': 0,
+                'ops_before': 0,
+                'ops_after': 0,
+                'passes': defaultdict(int),
+                'last_speedup': None
+            },
+            'block_translations': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'cache_evictions': 0
         }
+        self.kernel_cache = LRUCache(max_size=cache_size)
+        self.optimized_blocks = LRUCache(max_size=cache_size)
+        self.context = VectorExecutionContext()  # Default context for single-operation execution
 
     def initialize(self):
         """Initialize x86 abstraction layer."""
@@ -813,64 +1329,1362 @@ class VectorX86AbstractionLayer:
 
     def _create_opcode_map(self):
         """Create x86 opcode to vector operation mapping."""
-        return {
-            'MOV': 'memory_copy',
-            'ADD': 'elementwise_add',
-            'SUB': 'elementwise_sub',
-            'MUL': 'elementwise_mul',
-            'JMP': 'control_flow_jump',
-            'CALL': 'function_call',
-            'RET': 'function_return'
-        }
+        return dict(self.OPCODE_MAP)
+
+    def _parse_instruction(self, instruction):
+        """Split a textual instruction into (opcode, operands)."""
+        opcode, _, rest = instruction.strip().partition(' ')
+        operands = [operand.strip() for operand in rest.split(',') if operand.strip()]
+        return opcode.upper(), operands
+
+    def _expand_instruction(self, opcode, operands):
+        """
+        Rewrite an instruction into (opcode, operands) pairs the layer executes.
+
+        INC/DEC, NOT/NEG, two- and three-operand IMUL and PUSH/POP become
+        sequences of supported ops; NOP becomes nothing. Returns None for
+        instructions with no translation.
+        """
+        if opcode in self.opcode_map:
+            return [(opcode, operands)]
+        if opcode == 'NOP':
+            return []
+        if opcode == 'IMUL' and len(operands) == 2:
+            return [('MUL', operands)]
+        if opcode == 'IMUL' and len(operands) == 3:
+            return [('MOV', operands[:2]), ('MUL', [operands[0], operands[2]])]
+        if len(operands) != 1:
+            return None
+        operand = operands[0]
+        if opcode in ('INC', 'DEC'):
+            return [('ADD' if opcode == 'INC' else 'SUB', [operand, '1'])]
+        if opcode == 'NOT':
+            return [('XOR', [operand, '-1'])]
+        if opcode == 'NEG':
+            return [('MUL', [operand, '-1'])]
+        if opcode == 'PUSH':
+            # The source address is computed before RSP moves
+            return [('MOV', ['[RSP-8]', operand]), ('SUB', ['RSP', '8'])]
+        if opcode == 'POP':
+            # A destination address is computed after RSP moves
+            return [('ADD', ['RSP', '8']), ('MOV', [operand, '[RSP-8]'])]
+        return None
 
     def translate_instruction(self, instruction):
         """Translate x86 instruction to vector operations."""
+        # Raw machine code goes through the binary decoder
+        if isinstance(instruction, (bytes, bytearray, memoryview, mmap.mmap)):
+            return self.translate_binary(instruction)
+
         # Simple translation for demonstration
-        parts = instruction.split()
-        if not parts:
+        if not instruction.split():
             return None
 
-        opcode = parts[0].upper()
+        opcode, operands = self._parse_instruction(instruction)
         if opcode not in self.opcode_map:
             return None
 
         vector_operation = {
             'original_instruction': instruction,
             'vector_operation': self.opcode_map[opcode],
-            'operands': parts[1:] if len(parts) > 1 else [],
+            'operands': operands,
             'translation_time': datetime.now().isoformat()
         }
 
         self.performance_stats['translations'] += 1
         return vector_operation
 
+    def _split_basic_blocks(self, program):
+        """
+        Split a program into basic blocks.
+
+        A block ends after JMP, CALL or RET, and a ``label:`` line starts a
+        new one. ``;`` starts a comment.
+
+        Returns:
+            List of (label, normalized instruction lines) tuples
+        """
+        lines = program.splitlines() if isinstance(program, str) else program
+        blocks = []
+        label, current = None, []
+
+        for line in lines:
+            line = ' '.join(line.split(';', 1)[0].split()).upper()
+            if not line:
+                continue
+            if line.endswith(':'):
+                if current or label:
+                    blocks.append((label, current))
+                label, current = line[:-1], []
+                continue
+
+            current.append(line)
+            if line.split()[0] in self.BLOCK_TERMINATORS:
+                blocks.append((label, current))
+                label, current = None, []
+
+        if current or label:
+            blocks.append((label, current))
+        return blocks
+
+    def translate_block(self, instructions, label=None):
+        """
+        Translate one basic block, reusing the cached translation if present.
+
+        Blocks are cached by a hash of their normalized text, so a hot loop
+        body is translated once no matter how often it is submitted.
+        """
+        block_text = '\n'.join([f"{label}:" if label else ''] + list(instructions))
+        block_key = hashlib.blake2b(block_text.encode('utf-8'), digest_size=16).hexdigest()
+        block = self.translation_cache.get(block_key)
+        if block is not None:
+            self.performance_stats['cache_hits'] += 1
+            return block
+
+        self.performance_stats['cache_misses'] += 1
+        operations = []
+        unsupported = []
+        for instruction in instructions:
+            expanded = self._expand_instruction(*self._parse_instruction(instruction))
+            if expanded is None:
+                unsupported.append(instruction)
+                continue
+            operations.extend({
+                'original_instruction': instruction,
+                'opcode': opcode,
+                'vector_operation': self.opcode_map[opcode],
+                'operands': operands
+            } for opcode, operands in expanded)
+
+        terminator = operations[-1] if operations and operations[-1]['opcode'] in self.BLOCK_TERMINATORS else None
+        block = {
+            'block_id': block_key,
+            'label': label,
+            'instructions': list(instructions),
+            'operations': operations,
+            'terminator': terminator['opcode'] if terminator else None,
+            'target': terminator['operands'][0] if terminator and terminator['operands'] else None,
+            'unsupported': unsupported
+        }
+
+        self.translation_cache.put(block_key, block)
+        self.performance_stats['block_translations'] += 1
+        self.performance_stats['translations'] += len(operations)
+        self.performance_stats['cache_evictions'] = self.translation_cache.evictions
+        return block
+
+    def translate_program(self, program):
+        """
+        Translate a whole instruction sequence into cached basic blocks.
+
+        Args:
+            program: Newline-separated assembly text or a list of instructions
+
+        Returns:
+            Dictionary with the translated blocks and cache statistics
+        """
+        hits_before = self.performance_stats['cache_hits']
+        blocks = [self.translate_block(instructions, label)
+                  for label, instructions in self._split_basic_blocks(program)]
+
+        return {
+            'blocks': blocks,
+            'block_count': len(blocks),
+            'cache_hits': self.performance_stats['cache_hits'] - hits_before,
+            'cache_size': self.translation_cache.current_size,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def decode_binary(self, source, base_address=0):
+        """
+        Lazily decode x86-64 machine code.
+
+        Args:
+            source: bytes-like object, mmap, or path of a file to map
+            base_address: Address of the first byte, used for branch targets
+
+        Yields:
+            Decoded instruction dictionaries
+        """
+        return X86BinaryDecoder(base_address).decode(source)
+
+    def translate_binary(self, source, base_address=0):
+        """
+        Decode machine code and translate it into cached basic blocks.
+
+        Branch targets become ``L_<address>`` labels so decoded jumps and
+        calls resolve in execute_program. Displacements stay byte offsets,
+        matching the byte-addressed execution memory; an operand outside
+        the memory_size execute_program models raises ValueError when run.
+
+        Raises:
+            ValueError: If any instruction cannot be decoded or translated
+                faithfully; instructions are never silently dropped
+        """
+        decoded = list(self.decode_binary(source, base_address))
+        targets = {instruction['target'] for instruction in decoded if instruction['target'] is not None}
+
+        lines = []
+        for instruction in decoded:
+            if instruction['address'] in targets:
+                lines.append(f"{X86BinaryDecoder.label(instruction['address'])}:")
+            lines.extend(self._binary_lines(instruction))
+
+        translation = self.translate_program(lines)
+        translation.update({
+            'instructions_decoded': len(decoded),
+            'bytes_decoded': sum(instruction['length'] for instruction in decoded),
+            'undecoded': []
+        })
+        return translation
+
+    def _binary_lines(self, instruction):
+        """
+        Assembly lines for one decoded instruction.
+
+        Writes to a 32-bit register zero-extend into the full register, so
+        they are followed by an AND with 0xFFFFFFFF (or, for an immediate
+        MOV, use the zero-extended immediate).
+        """
+        mnemonic, operands = instruction['mnemonic'], instruction['operands']
+        location = f"{instruction['address']:#x} ({instruction['bytes']})"
+        if mnemonic == '(bad)':
+            raise ValueError(f"Cannot decode instruction at {location}")
+        if (mnemonic in self.UNTRANSLATABLE
+                or (mnemonic in ('MUL', 'IMUL') and len(operands) == 1)
+                or (mnemonic in ('CALL', 'JMP') and instruction['target'] is None)
+                or self._expand_instruction(mnemonic, operands) is None):
+            raise ValueError(f"Cannot translate {instruction['text']} at {location}")
+
+        size = instruction['operand_size']
+        if size == 64 or mnemonic in self.NON_WRITING:
+            return [instruction['text']] if mnemonic != 'NOP' else []
+        destination = operands[0]
+        if size == 16 or destination.startswith('['):
+            raise ValueError(f"Cannot translate {size}-bit {'store' if size == 32 else 'operation'} "
+                             f"{instruction['text']} at {location}")
+        if mnemonic == 'MOV' and not operands[1].startswith('[') and operands[1] not in X86BinaryDecoder.REGISTERS:
+            return [f"MOV {destination}, {int(operands[1], 0) & 0xFFFFFFFF}"]
+        return [instruction['text'], f"AND {destination}, {0xFFFFFFFF}"]
+
+    def _compile_operation(self, operation):
+        """Compile one data operation into a kernel over a VectorExecutionContext."""
+        opcode = operation['opcode']
+        operands = [VectorExecutionContext.parse_operand(operand) for operand in operation['operands']]
+        ufuncs = self.UFUNCS
+
+        if opcode == 'MOV':
+            destination, source = operands
+            return lambda context: context.write(destination, context.read(source))
+
+        if opcode in ('CMP', 'TEST'):
+            # Flags are not modelled (all jumps are unconditional); the
+            # operands are still read so bad addresses fail the same way
+            def compare(context):
+                for operand in operands:
+                    context.read(operand)
+            return compare
+
+        if opcode == 'FUSED':
+            # A chain of elementwise ops on one register, applied in place
+            # so the whole chain allocates no intermediate arrays
+            row = operands[0][1]
+            steps = [(ufuncs[step['opcode']], VectorExecutionContext.parse_operand(step['operands'][1]))
+                     for step in operation['steps']]
+
+            def fused(context):
+                destination = context.registers[row]
+                for ufunc, source in steps:
+                    ufunc(destination, context.read(source), out=destination)
+            return fused
+
+        ufunc = ufuncs[opcode]
+        if len(operands) == 1:
+            # One-operand MUL multiplies into RAX
+            operands = [('reg', VectorExecutionContext.REGISTERS.index('RAX'))] + operands
+        destination, source = operands
+
+        if destination[0] == 'reg':
+            # Registers are rows of the register file: update in place, no temporaries
+            row = destination[1]
+            return lambda context: ufunc(context.registers[row], context.read(source), out=context.registers[row])
+        return lambda context: context.write(destination, ufunc(context.read(destination), context.read(source)))
+
+    def _block_kernels(self, block):
+        """Get the compiled data-operation kernels for a block, compiling on first use."""
+        kernels = self.kernel_cache.get(block['block_id'])
+        if kernels is None:
+            kernels = [self._compile_operation(operation)
+                       for operation in block['operations']
+                       if operation['opcode'] not in self.BLOCK_TERMINATORS]
+            self.kernel_cache.put(block['block_id'], kernels)
+        return kernels
+
     def execute_operation(self, vector_operation):
-        """Execute vector operation."""
-        # Simulate execution
+        """Execute a translated instruction on the layer's default register context."""
+        start_time = time.perf_counter()
+        opcode, operands = self._parse_instruction(vector_operation['original_instruction'])
+
+        # Control flow needs a program to jump within; on its own it is a no-op
+        if opcode not in self.BLOCK_TERMINATORS:
+            self._compile_operation({'opcode': opcode, 'operands': operands})(self.context)
+
         execution_result = {
             'operation': vector_operation['vector_operation'],
             'status': 'completed',
-            'duration': 0.001,
+            'duration': time.perf_counter() - start_time,
+            'registers': self.context.snapshot(),
             'timestamp': datetime.now().isoformat()
         }
 
         self.performance_stats['executions'] += 1
         return execution_result
 
-    def optimize_operation(self, operation):
-        """Optimize vector operation."""
-        # Simulate optimization
-        optimization_result = {
-            'operation': operation,
-            'optimization': 'vector_caching_applied',
-            'improvement': 0.3,  # 30% improvement
+    def execute_program(self, program, batch_size=1, registers=None, max_blocks=10000, optimize=False,
+                        memory_size=1 << 20):
+        """
+        Execute a program across a batch of independent register contexts.
+
+        Every instruction is one NumPy operation over all ``batch_size``
+        instances at once, so running thousands of instances costs about
+        as much interpreter overhead as running one. Control flow is shared
+        by all instances (the supported jumps are unconditional). CALL
+        pushes a return slot (holding the index of the block to return to)
+        and RET pops it, so a callee sees the stack it would on x86.
+
+        Args:
+            program: Assembly text or list of instructions
+            batch_size: Number of program instances (SIMD lanes)
+            registers: Optional initial values, register name -> scalar or per-lane list
+            max_blocks: Upper bound on executed blocks, guarding infinite loops
+            optimize: Run blocks through the peephole optimizer first
+            memory_size: Bytes of (lazily allocated) memory per instance
+
+        Returns:
+            Dictionary with final registers, execution counts and duration
+        """
+        start_time = time.perf_counter()
+        blocks = self.translate_program(program)['blocks']
+        for block in blocks:
+            if block['unsupported']:
+                raise ValueError(f"Unsupported instructions: {', '.join(block['unsupported'])}")
+        if optimize:
+            blocks = [self.optimize_block(block) for block in blocks]
+        labels = {block['label']: index for index, block in enumerate(blocks) if block['label']}
+
+        context = VectorExecutionContext(batch_size, memory_size)
+        for name, values in (registers or {}).items():
+            context.registers[VectorExecutionContext.register_index(name)] = values
+        rsp = VectorExecutionContext.REGISTERS.index('RSP')
+        stack_top = ('mem', rsp, 0, None, 1)
+
+        def jump_target(block):
+            if block['target'] not in labels:
+                raise ValueError(f"Unknown jump target: {block['target']}")
+            return labels[block['target']]
+
+        pc = 0
+        call_stack = []
+        blocks_executed = 0
+        instructions_executed = 0
+        status = 'completed'
+
+        while pc < len(blocks):
+            if blocks_executed >= max_blocks:
+                status = 'block_limit_reached'
+                break
+
+            block = blocks[pc]
+            for kernel in self._block_kernels(block):
+                kernel(context)
+            blocks_executed += 1
+            instructions_executed += len(block['operations'])
+
+            if block['terminator'] == 'JMP':
+                pc = jump_target(block)
+            elif block['terminator'] == 'CALL':
+                context.registers[rsp] -= VectorExecutionContext.WORD_SIZE
+                context.write(stack_top, pc + 1)
+                call_stack.append(pc + 1)
+                pc = jump_target(block)
+            elif block['terminator'] == 'RET':
+                # A RET with no CALL in the program returns to the host
+                if not call_stack:
+                    break
+                context.registers[rsp] += VectorExecutionContext.WORD_SIZE
+                pc = call_stack.pop()
+            else:
+                pc += 1
+
+        self.performance_stats['executions'] += instructions_executed
+        return {
+            'status': status,
+            'batch_size': batch_size,
+            'blocks_executed': blocks_executed,
+            'instructions_executed': instructions_executed,
+            'registers': context.snapshot(),
+            'duration': time.perf_counter() - start_time,
             'timestamp': datetime.now().isoformat()
         }
 
-        self.performance_stats['optimizations'] += 1
-        return optimization_result
+    def optimize_block(self, block, optimizer=None):
+        """Get the peephole-optimized version of a translated block (cached)."""
+        optimized = self.optimized_blocks.get(block['block_id'])
+        if optimized is None:
+            optimizer = optimizer or X86BlockOptimizer()
+            optimized = dict(block,
+                             block_id=f"{block['block_id']}:optimized",
+                             operations=optimizer.optimize(block['operations']),
+                             optimized=True)
+            self.optimized_blocks.put(block['block_id'], optimized)
+        return optimized
+
+    def _benchmark_block(self, block, batch_size=1024, repeats=20):
+        """
+        Time a block's kernels on scratch contexts with small random register values.
+
+        Every repeat starts from a fresh context with the same registers, so
+        a block that moves its own address registers cannot walk out of
+        memory. Register values are offset past the largest displacement and
+        memory is sized to the addresses they can form.
+
+        Returns:
+            Total seconds over all repeats, or None if a kernel faults
+        """
+        operands = [VectorExecutionContext.parse_operand(operand)
+                    for operation in block['operations'] if operation['opcode'] not in self.BLOCK_TERMINATORS
+                    for operand in operation['operands']
+                    + [source for step in operation.get('steps', ()) for source in step['operands']]]
+        memory = [operand for operand in operands if operand[0] == 'mem']
+        reach = max([abs(operand[2]) for operand in memory], default=0)
+        scale = max([operand[4] for operand in memory], default=1)
+        registers = np.random.default_rng(0).integers(
+            reach, reach + 64, (len(VectorExecutionContext.REGISTERS), batch_size))
+
+        kernels = self._block_kernels(block)
+        elapsed = 0.0
+        for _ in range(repeats):
+            context = VectorExecutionContext(batch_size, memory_size=(reach + 64) * (1 + scale) + reach + 8)
+            context.registers[:] = registers
+            start_time = time.perf_counter()
+            try:
+                for kernel in kernels:
+                    kernel(context)
+            except ValueError:
+                return None
+            elapsed += time.perf_counter() - start_time
+        return elapsed
+
+    def optimize_operation(self, operation):
+        """
+        Optimize translated code and measure the gain.
+
+        Args:
+            operation: A translated block, a translated instruction, or
+                program text / instruction list
+
+        Returns:
+            Dictionary with optimized blocks, op counts, per-pass rewrite
+            counts and the measured speedup (None, with the block left
+            unoptimized, if a block faults on the benchmark inputs)
+        """
+        if isinstance(operation, dict) and 'operations' in operation:
+            blocks = [operation]
+        elif isinstance(operation, dict):
+            blocks = self.translate_program([operation['original_instruction']])['blocks']
+        else:
+            blocks = self.translate_program(operation)['blocks']
+
+        optimizer = X86BlockOptimizer()
+        optimized = []
+        before_time = after_time = 0.0
+        measured = True
+        for block in blocks:
+            # Always re-run the passes so per-pass counts describe this input
+            self.optimized_blocks.cache.pop(block['block_id'], None)
+            optimized_block = self.optimize_block(block, optimizer)
+            before = self._benchmark_block(block)
+            after = self._benchmark_block(optimized_block) if before is not None else None
+            if after is None:
+                # The block faults on the scratch inputs (e.g. it computes an
+                # address outside memory): keep it as is, with no timing
+                measured = False
+                optimized.append(block)
+                continue
+            optimized.append(optimized_block)
+            before_time += before
+            after_time += after
+
+        ops_before = sum(len(block['operations']) for block in blocks)
+        ops_after = sum(len(block['operations']) for block in optimized)
+        speedup = before_time / after_time if measured and after_time > 0 else None
+
+        stats = self.performance_stats['optimizations']
+        stats['runs'] += 1
+        stats['ops_before'] += ops_before
+        stats['ops_after'] += ops_after
+        stats['last_speedup'] = speedup
+        for name, count in optimizer.counts.items():
+            stats['passes'][name] += count
+
+        return {
+            'blocks': optimized,
+            'optimization': 'peephole_fusion',
+            'ops_before': ops_before,
+            'ops_after': ops_after,
+            'passes': dict(optimizer.counts),
+            'speedup': speedup,
+            'improvement': 1 - after_time / before_time if measured and before_time > 0 else None,
+            'timestamp': datetime.now().isoformat()
+        }
 
 # Helper classes for self-contained operation
+class VMExecutionEngine:
+    """
+    Worker pool that runs VM operations on host cores.
+
+    Each VM owns a FIFO run queue. Idle workers pick the runnable VM with the
+    lowest virtual time, which advances by wall time divided by the VM's
+    ``cpu_cores`` share, so a 4-core VM gets roughly four times the
+    throughput of a 1-core VM. ``cpu_cores`` also caps how many operations
+    of one VM run at once.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.run_queues = {}
+        self.shares = {}
+        self.virtual_time = {}
+        self.in_flight = defaultdict(int)
+        self.condition = threading.Condition()
+        self.threads = []
+        self.running = False
+        self._local = threading.local()  # .worker is set on this pool's worker threads
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'busy_time': 0.0
+        }
+
+    def configure(self, workers=None):
+        """Resize the pool; takes effect before the first submission only."""
+        with self.condition:
+            if not self.threads:
+                self.workers = workers or os.cpu_count() or 1
+
+    def register_vm(self, vm_id, cpu_cores):
+        """Create a run queue for a VM with its core share."""
+        with self.condition:
+            self.run_queues.setdefault(vm_id, deque())
+            self.shares[vm_id] = max(1, int(cpu_cores))
+            # New VMs start level with the least-served VM so they can't
+            # monopolize the pool while "catching up"
+            self.virtual_time[vm_id] = min(self.virtual_time.values(), default=0.0)
+
+    def submit(self, vm_id, task):
+        """Queue a zero-argument callable on a VM and return its Future."""
+        future = Future()
+        with self.condition:
+            if vm_id not in self.run_queues:
+                raise ValueError(f"VM not registered with scheduler: {vm_id}")
+            self.run_queues[vm_id].append((future, task))
+            self.stats['submitted'] += 1
+            self._start_workers()
+            self.condition.notify()
+        return future
+
+    def _start_workers(self):
+        """Start worker threads on first use (caller holds the lock)."""
+        if self.running:
+            return
+        self.running = True
+        self.threads = [
+            threading.Thread(target=self._worker_loop, name=f'vm-worker-{i}', daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def in_worker(self):
+        """Whether the calling thread is one of this pool's workers."""
+        return getattr(self._local, 'worker', False)
+
+    def _next_task(self):
+        """Pop the next task from the fairest runnable VM (caller holds the lock)."""
+        runnable = [vm_id for vm_id, queue in self.run_queues.items()
+                    if queue and self.in_flight[vm_id] < self.shares[vm_id]]
+        if not runnable:
+            return None
+
+        vm_id = min(runnable, key=self.virtual_time.__getitem__)
+        future, task = self.run_queues[vm_id].popleft()
+        self.in_flight[vm_id] += 1
+        return vm_id, future, task
+
+    def _worker_loop(self):
+        """Run queued tasks until shutdown and all queues are drained."""
+        self._local.worker = True
+        while True:
+            with self.condition:
+                picked = self._next_task()
+                while picked is None:
+                    if not self.running:
+                        return
+                    self.condition.wait()
+                    picked = self._next_task()
+
+            vm_id, future, task = picked
+            start_time = time.perf_counter()
+            failed = False
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(task())
+                except BaseException as e:
+                    future.set_exception(e)
+                    failed = True
+            elapsed = time.perf_counter() - start_time
+
+            with self.condition:
+                self.in_flight[vm_id] -= 1
+                self.virtual_time[vm_id] += elapsed / self.shares[vm_id]
+                self.stats['failed' if failed else 'completed'] += 1
+                self.stats['busy_time'] += elapsed
+                # A finished task may unblock a VM that was at its core quota
+                self.condition.notify_all()
+
+    def shutdown(self, wait=True):
+        """Stop accepting work once queues drain and join the workers."""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+            threads, self.threads = self.threads, []
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def get_stats(self):
+        """Get worker pool and run queue statistics."""
+        with self.condition:
+            return {
+                'workers': self.workers,
+                'queued': sum(len(queue) for queue in self.run_queues.values()),
+                'in_flight': sum(self.in_flight.values()),
+                'virtual_time': dict(self.virtual_time),
+                **self.stats
+            }
+
+class VectorExecutionContext:
+    """
+    Register file and memory for a batch of independent x86 program instances.
+
+    Each register is a row of an int64 array with one column per instance,
+    so one NumPy call applies an instruction to every instance. Arithmetic
+    wraps at 64 bits like x86. Memory is ``memory_size`` bytes per
+    instance, byte-addressed like x86: an operand reads or writes the
+    little-endian quadword at its address, so unaligned accesses overlap.
+    It is allocated lazily as (instances x page bytes) arrays the first
+    time a page is written; untouched memory reads as zero. An access
+    outside memory raises ValueError. RSP starts at the top of memory,
+    where an empty downward-growing stack begins.
+    """
+
+    REGISTERS = ('RAX', 'RBX', 'RCX', 'RDX', 'RSI', 'RDI', 'RBP', 'RSP',
+                 'R8', 'R9', 'R10', 'R11', 'R12', 'R13', 'R14', 'R15')
+    PAGE_SIZE = 512
+    WORD_SIZE = 8
+
+    def __init__(self, batch_size=1, memory_size=1 << 20):
+        self.batch_size = batch_size
+        self.memory_size = memory_size
+        self.registers = np.zeros((len(self.REGISTERS), batch_size), dtype=np.int64)
+        self.registers[self.REGISTERS.index('RSP')] = memory_size
+        self.pages = {}  # page number -> (batch_size x PAGE_SIZE) uint8 array
+        self.lanes = np.arange(batch_size)
+
+    @classmethod
+    def register_index(cls, name):
+        """Row index of a named register."""
+        try:
+            return cls.REGISTERS.index(name.upper())
+        except ValueError:
+            raise ValueError(f"Unknown register: {name}") from None
+
+    @classmethod
+    def parse_operand(cls, operand):
+        """
+        Parse an operand into ('reg', row), ('imm', value) or
+        ('mem', base_row, displacement, index_row, scale).
+
+        Memory operands look like ``[16]``, ``[RBX]``, ``[RBX+8]`` or
+        ``[RBX+RCX*4-8]``; absent base or index rows are None.
+        """
+        operand = operand.upper().replace('QWORD PTR', '').strip()
+        if operand.startswith('[') and operand.endswith(']'):
+            base, displacement, index, scale = None, 0, None, 1
+            for term in re.findall(r'[+-]?[^+-]+', operand[1:-1].replace(' ', '')):
+                sign, term = (-1, term[1:]) if term.startswith('-') else (1, term.lstrip('+'))
+                register, _, factor = term.partition('*')
+                if register in cls.REGISTERS and (factor or base is not None):
+                    if index is not None or sign < 0:
+                        raise ValueError(f"Unsupported operand: {operand}")
+                    index, scale = cls.REGISTERS.index(register), int(factor or 1, 0)
+                elif term in cls.REGISTERS:
+                    base = cls.REGISTERS.index(term)
+                else:
+                    try:
+                        displacement += sign * int(term, 0)
+                    except ValueError:
+                        raise ValueError(f"Unsupported operand: {operand}") from None
+            return ('mem', base, displacement, index, scale)
+        if operand in cls.REGISTERS:
+            return ('reg', cls.REGISTERS.index(operand))
+        try:
+            return ('imm', int(operand, 0))
+        except ValueError:
+            raise ValueError(f"Unsupported operand: {operand}") from None
+
+    @classmethod
+    def format_operand(cls, operand):
+        """Inverse of parse_operand."""
+        if operand[0] == 'reg':
+            return cls.REGISTERS[operand[1]]
+        if operand[0] == 'imm':
+            return str(operand[1])
+        _, base, displacement, index, scale = operand
+        terms = [cls.REGISTERS[base]] if base is not None else []
+        if index is not None:
+            terms.append(f"{cls.REGISTERS[index]}*{scale}" if scale != 1 else cls.REGISTERS[index])
+        if not terms:
+            return f"[{displacement}]"
+        return f"[{'+'.join(terms)}{displacement:+d}]" if displacement else f"[{'+'.join(terms)}]"
+
+    @staticmethod
+    def address_registers(operand):
+        """Register rows a memory operand's address depends on."""
+        if operand[0] != 'mem':
+            return ()
+        return tuple(row for row in (operand[1], operand[3]) if row is not None)
+
+    def _address(self, operand):
+        """Byte address of an operand: a scalar, or one per lane if it uses registers."""
+        _, base, displacement, index, scale = operand
+        address = displacement
+        if base is not None:
+            address = self.registers[base] + address
+        if index is not None:
+            address = self.registers[index] * scale + address
+        if np.min(address) < 0 or np.max(address) > self.memory_size - self.WORD_SIZE:
+            raise ValueError(f"Memory operand {self.format_operand(operand)} addresses outside "
+                             f"the {self.memory_size}-byte memory")
+        if not np.isscalar(address) and (address == address[0]).all():
+            # Every lane agrees (e.g. a pointer set by an immediate MOV)
+            return int(address[0])
+        return address
+
+    def _page(self, number):
+        """A page's storage, allocated (zeroed) on first use."""
+        page = self.pages.get(number)
+        if page is None:
+            page = self.pages[number] = np.zeros((self.batch_size, self.PAGE_SIZE), dtype=np.uint8)
+        return page
+
+    def _lane_groups(self, address):
+        """
+        Group lanes by the page their quadword starts in.
+
+        Yields:
+            (page number, lane indices, (lanes x 8) byte columns) tuples;
+            columns past the page's end belong to the next page
+        """
+        numbers, offsets = np.divmod(address, self.PAGE_SIZE)
+        order = np.argsort(numbers, kind='stable')
+        ordered = numbers[order]
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+        for begin, end in zip(starts, np.r_[starts[1:], len(order)]):
+            lanes = order[begin:end]
+            yield int(ordered[begin]), lanes, offsets[lanes, None] + np.arange(self.WORD_SIZE)
+
+    def read(self, operand):
+        """Read an operand as a per-lane array (or scalar immediate)."""
+        kind = operand[0]
+        if kind == 'reg':
+            return self.registers[operand[1]]
+        if kind == 'imm':
+            return operand[1]
+        address = self._address(operand)
+        if np.isscalar(address) and address % self.PAGE_SIZE <= self.PAGE_SIZE - self.WORD_SIZE:
+            # One page, same offset in every lane: a strided slice
+            page = self.pages.get(address // self.PAGE_SIZE)
+            if page is None:
+                return np.zeros(self.batch_size, dtype=np.int64)
+            offset = address % self.PAGE_SIZE
+            data = np.ascontiguousarray(page[:, offset:offset + self.WORD_SIZE])
+        else:
+            data = np.zeros((self.batch_size, self.WORD_SIZE), dtype=np.uint8)
+            address = np.broadcast_to(address, (self.batch_size,))
+            for number, lanes, columns in self._lane_groups(address):
+                rows = lanes[:, None]
+                for page, inside in ((self.pages.get(number), columns < self.PAGE_SIZE),
+                                     (self.pages.get(number + 1), columns >= self.PAGE_SIZE)):
+                    if page is not None and inside.any():
+                        data[lanes] |= np.where(
+                            inside, page[rows, columns % self.PAGE_SIZE], 0).astype(np.uint8)
+        return data.view('<i8')[:, 0].astype(np.int64, copy=False)
+
+    def write(self, operand, value):
+        """Write a per-lane array or scalar into a register or memory operand."""
+        kind = operand[0]
+        if kind == 'reg':
+            self.registers[operand[1]] = value
+        elif kind == 'mem':
+            address = self._address(operand)
+            data = (np.broadcast_to(np.asarray(value, dtype=np.int64), (self.batch_size,))
+                    .astype('<i8').view(np.uint8).reshape(self.batch_size, self.WORD_SIZE))
+            if np.isscalar(address) and address % self.PAGE_SIZE <= self.PAGE_SIZE - self.WORD_SIZE:
+                offset = address % self.PAGE_SIZE
+                self._page(address // self.PAGE_SIZE)[:, offset:offset + self.WORD_SIZE] = data
+                return
+            address = np.broadcast_to(address, (self.batch_size,))
+            for number, lanes, columns in self._lane_groups(address):
+                inside = columns < self.PAGE_SIZE
+                if inside.all():
+                    self._page(number)[lanes[:, None], columns] = data[lanes]
+                    continue
+                rows = np.broadcast_to(lanes[:, None], columns.shape)
+                self._page(number)[rows[inside], columns[inside]] = data[lanes][inside]
+                self._page(number + 1)[rows[~inside], columns[~inside] - self.PAGE_SIZE] = data[lanes][~inside]
+        else:
+            raise ValueError("Cannot write to an immediate operand")
+
+    def snapshot(self):
+        """Register values as JSON-friendly lists (scalars for a single instance)."""
+        if self.batch_size == 1:
+            return {name: int(self.registers[i, 0]) for i, name in enumerate(self.REGISTERS)}
+        return {name: self.registers[i].tolist() for i, name in enumerate(self.REGISTERS)}
+
+class X86BlockOptimizer:
+    """
+    Peephole optimizer for translated x86 basic blocks.
+
+    Passes run in order: constant folding and propagation, redundant
+    load/store removal, dead register write elimination, and fusion of
+    consecutive elementwise ops on one register into a single in-place
+    kernel. Every register is assumed live at block exit, so only writes
+    overwritten later in the same block are dropped. CMP and TEST are
+    dropped outright, since no translated jump reads flags.
+    """
+
+    ARITHMETIC = {
+        'ADD': lambda a, b: a + b,
+        'SUB': lambda a, b: a - b,
+        'MUL': lambda a, b: a * b,
+        'AND': lambda a, b: a & b,
+        'OR': lambda a, b: a | b,
+        'XOR': lambda a, b: a ^ b
+    }
+    # (opcode, immediate) pairs that leave the destination unchanged
+    IDENTITIES = {('ADD', 0), ('SUB', 0), ('MUL', 1), ('AND', -1), ('OR', 0), ('XOR', 0)}
+    # (opcode, immediate) pairs whose result does not depend on the destination
+    ABSORBING = {('MUL', 0): 0, ('AND', 0): 0, ('OR', -1): -1}
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+
+    @staticmethod
+    def _wrap(value):
+        """Wrap an integer to signed 64 bits, like the register file."""
+        return ((value + 2 ** 63) % 2 ** 64) - 2 ** 63
+
+    def optimize(self, operations):
+        """Optimize a block's translated operations and return the new list."""
+        ops = [self._parse(operation) for operation in operations if operation['opcode'] not in ('CMP', 'TEST')]
+        self.counts['flag_ops_removed'] += len(operations) - len(ops)
+        ops = self._fold_constants(ops)
+        ops = self._remove_redundant_memory(ops)
+        ops = self._eliminate_dead_writes(ops)
+        ops = self._fuse_elementwise(ops)
+        return [self._format(op) for op in ops]
+
+    def _parse(self, operation):
+        """Convert a translated operation to the optimizer's parsed form."""
+        if operation['opcode'] in VectorX86AbstractionLayer.BLOCK_TERMINATORS or operation['opcode'] == 'FUSED':
+            return {'opcode': operation['opcode'], 'raw': operation}
+        args = [VectorExecutionContext.parse_operand(operand) for operand in operation['operands']]
+        if len(args) == 1:
+            args = [('reg', VectorExecutionContext.REGISTERS.index('RAX'))] + args
+        return {'opcode': operation['opcode'], 'args': args}
+
+    def _format(self, op):
+        """Convert a parsed op back to a translated operation dict."""
+        if 'raw' in op:
+            return op['raw']
+        if op['opcode'] == 'FUSED':
+            destination = VectorExecutionContext.format_operand(op['args'][0])
+            steps = [{'opcode': opcode, 'operands': [destination, VectorExecutionContext.format_operand(source)]}
+                     for opcode, source in op['steps']]
+            return {
+                'original_instruction': '; '.join(f"{step['opcode']} {', '.join(step['operands'])}" for step in steps),
+                'opcode': 'FUSED',
+                'vector_operation': 'fused_elementwise',
+                'operands': [destination],
+                'steps': steps
+            }
+        operands = [VectorExecutionContext.format_operand(arg) for arg in op['args']]
+        return {
+            'original_instruction': f"{op['opcode']} {', '.join(operands)}",
+            'opcode': op['opcode'],
+            'vector_operation': VectorX86AbstractionLayer.OPCODE_MAP[op['opcode']],
+            'operands': operands
+        }
+
+    def _fold_constants(self, ops):
+        """Propagate known register constants and fold arithmetic on them."""
+        constants = {}
+        result = []
+
+        def substitute(arg):
+            if arg[0] == 'reg' and arg[1] in constants:
+                return ('imm', constants[arg[1]])
+            if arg[0] == 'mem':
+                _, base, displacement, index, scale = arg
+                if base in constants:
+                    base, displacement = None, displacement + constants[base]
+                if index in constants:
+                    index, displacement = None, displacement + constants[index] * scale
+                return ('mem', base, displacement, index, scale if index is not None else 1)
+            return arg
+
+        for op in ops:
+            if 'raw' in op:
+                constants.clear()
+                result.append(op)
+                continue
+
+            opcode, (destination, source) = op['opcode'], op['args']
+            if opcode in ('SUB', 'XOR') and destination[0] == 'reg' and source == destination:
+                # SUB/XOR of a register with itself is a zeroing idiom
+                opcode, source = 'MOV', ('imm', 0)
+                self.counts['constants_folded'] += 1
+            new_source = substitute(source)
+            if destination[0] == 'mem':
+                destination = substitute(destination)
+            if new_source != source:
+                self.counts['constants_propagated'] += 1
+            source = new_source
+
+            if opcode != 'MOV' and source[0] == 'imm':
+                if destination[0] == 'reg' and destination[1] in constants:
+                    value = self._wrap(self.ARITHMETIC[opcode](constants[destination[1]], source[1]))
+                    opcode, source = 'MOV', ('imm', value)
+                    self.counts['constants_folded'] += 1
+                elif (opcode, source[1]) in self.IDENTITIES:
+                    self.counts['identities_removed'] += 1
+                    continue
+                elif (opcode, source[1]) in self.ABSORBING:
+                    opcode, source = 'MOV', ('imm', self.ABSORBING[opcode, source[1]])
+                    self.counts['constants_folded'] += 1
+
+            if destination[0] == 'reg':
+                if opcode == 'MOV' and source[0] == 'imm':
+                    constants[destination[1]] = source[1]
+                else:
+                    constants.pop(destination[1], None)
+            result.append({'opcode': opcode, 'args': [destination, source]})
+
+        return result
+
+    def _remove_redundant_memory(self, ops):
+        """Drop loads of values already in a register and stores of unchanged values."""
+        known = {}  # memory operand -> register row holding the same value
+        pending_stores = {}  # memory operand -> index of a store not yet read
+        result = []
+
+        def invalidate(row):
+            for address in [a for a, holder in known.items()
+                            if holder == row or row in VectorExecutionContext.address_registers(a)]:
+                del known[address]
+            for address in [a for a in pending_stores if row in VectorExecutionContext.address_registers(a)]:
+                del pending_stores[address]
+
+        for op in ops:
+            if 'raw' in op:
+                known.clear()
+                pending_stores.clear()
+                result.append(op)
+                continue
+
+            destination, source = op['args']
+            if op['opcode'] == 'MOV' and destination[0] == 'mem' and source[0] == 'reg':
+                if known.get(destination) == source[1]:
+                    self.counts['redundant_stores_removed'] += 1
+                    continue
+                if destination in pending_stores:
+                    # Overwritten before anything read it
+                    result[pending_stores[destination]] = None
+                    self.counts['dead_stores_removed'] += 1
+                # The store may alias any other address we knew about
+                known = {destination: source[1]}
+                pending_stores[destination] = len(result)
+                result.append(op)
+                continue
+
+            if op['opcode'] == 'MOV' and destination[0] == 'reg' and source[0] == 'mem':
+                holder = known.get(source)
+                if holder == destination[1]:
+                    self.counts['redundant_loads_removed'] += 1
+                    continue
+                # Writing the register also invalidates addresses based on it
+                invalidate(destination[1])
+                if holder is not None:
+                    op = {'opcode': 'MOV', 'args': [destination, ('reg', holder)]}
+                    self.counts['loads_forwarded'] += 1
+                else:
+                    pending_stores.clear()
+                    # After MOV RBX, [RBX] the address [RBX] names a different
+                    # quadword, so only loads through other registers are recorded
+                    if destination[1] not in VectorExecutionContext.address_registers(source):
+                        known[source] = destination[1]
+                result.append(op)
+                continue
+
+            reads_memory = source[0] == 'mem' or (op['opcode'] != 'MOV' and destination[0] == 'mem')
+            if reads_memory:
+                pending_stores.clear()
+            if destination[0] == 'mem':
+                known.clear()
+            else:
+                invalidate(destination[1])
+            result.append(op)
+
+        return [op for op in result if op is not None]
+
+    def _eliminate_dead_writes(self, ops):
+        """Drop register writes overwritten later in the block before being read."""
+        live = set(range(len(VectorExecutionContext.REGISTERS)))
+        kept = []
+
+        for op in reversed(ops):
+            if 'raw' in op:
+                live = set(range(len(VectorExecutionContext.REGISTERS)))
+                kept.append(op)
+                continue
+
+            destination, source = op['args']
+            if destination[0] == 'reg':
+                if destination[1] not in live or (op['opcode'] == 'MOV' and source == destination):
+                    self.counts['dead_moves_removed'] += 1
+                    continue
+                if op['opcode'] == 'MOV':
+                    live.discard(destination[1])
+
+            for arg in (source, destination):
+                live.update(VectorExecutionContext.address_registers(arg))
+            if source[0] == 'reg':
+                live.add(source[1])
+            if op['opcode'] != 'MOV' and destination[0] == 'reg':
+                live.add(destination[1])
+            kept.append(op)
+
+        return kept[::-1]
+
+    def _fuse_elementwise(self, ops):
+        """Merge runs of elementwise ops on the same register into FUSED ops."""
+        result = []
+        for op in ops:
+            previous = result[-1] if result else None
+            if ('raw' not in op and op['opcode'] in self.ARITHMETIC and op['args'][0][0] == 'reg'
+                    and previous is not None and 'raw' not in previous
+                    and previous['opcode'] in tuple(self.ARITHMETIC) + ('FUSED',)
+                    and previous['args'][0] == op['args'][0]):
+                if previous['opcode'] != 'FUSED':
+                    previous = result[-1] = {
+                        'opcode': 'FUSED',
+                        'args': [previous['args'][0]],
+                        'steps': [(previous['opcode'], previous['args'][1])]
+                    }
+                previous['steps'].append((op['opcode'], op['args'][1]))
+                self.counts['ops_fused'] += 1
+                continue
+            result.append(op)
+
+        fused = []
+        for op in result:
+            if op['opcode'] == 'FUSED':
+                op['steps'] = self._compose_affine(op['steps'])
+                if not op['steps']:
+                    continue
+                if len(op['steps']) == 1:
+                    opcode, source = op['steps'][0]
+                    op = {'opcode': opcode, 'args': [op['args'][0], source]}
+            fused.append(op)
+        return fused
+
+    def _compose_affine(self, steps):
+        """Collapse runs of immediate steps into at most one MUL and one ADD (x * m + c)."""
+        composed = []
+        multiplier, offset = 1, 0
+
+        def flush():
+            if multiplier != 1:
+                composed.append(('MUL', ('imm', self._wrap(multiplier))))
+            if offset != 0:
+                composed.append(('ADD', ('imm', self._wrap(offset))))
+
+        for opcode, source in steps:
+            if source[0] != 'imm' or opcode not in ('ADD', 'SUB', 'MUL'):
+                flush()
+                multiplier, offset = 1, 0
+                composed.append((opcode, source))
+            elif opcode == 'ADD':
+                offset += source[1]
+            elif opcode == 'SUB':
+                offset -= source[1]
+            else:
+                multiplier *= source[1]
+                offset *= source[1]
+        flush()
+        return composed
+
+class X86BinaryDecoder:
+    """
+    Lazy decoder for a practical subset of x86-64 machine code.
+
+    Handles legacy prefixes (operand size, address size, LOCK, REP, segment),
+    REX, ModRM/SIB addressing with 8/32-bit and RIP-relative displacements,
+    and 8/16/32/64-bit immediates. Decoding reads straight from a memoryview,
+    so bytes, mmap objects and mapped files are never copied.
+
+    Registers are reported by their 64-bit names (``operand_size`` records
+    the encoded width), immediates are reported sign-extended as encoded,
+    RIP-relative operands are resolved to absolute addresses, and
+    two-operand IMUL is emitted as this layer's two-operand ``MUL``, which
+    keeps the same low 64 bits.
+    """
+
+    # Register numbering used by ModRM, SIB, REX and +r opcodes
+    REGISTERS = ('RAX', 'RCX', 'RDX', 'RBX', 'RSP', 'RBP', 'RSI', 'RDI',
+                 'R8', 'R9', 'R10', 'R11', 'R12', 'R13', 'R14', 'R15')
+    LEGACY_PREFIXES = frozenset((0x66, 0x67, 0xF0, 0xF2, 0xF3, 0x26, 0x2E, 0x36, 0x3E, 0x64, 0x65))
+    GROUP1 = ('ADD', 'OR', 'ADC', 'SBB', 'AND', 'SUB', 'XOR', 'CMP')
+    GROUP3 = ('TEST', 'TEST', 'NOT', 'NEG', 'MUL', 'IMUL', 'DIV', 'IDIV')
+    GROUP5 = ('INC', 'DEC', 'CALL', 'CALLF', 'JMP', 'JMPF', 'PUSH', None)
+    # opcode -> (mnemonic, operand order) for "op r/m, reg" and "op reg, r/m" forms:
+    # the full-width Group-1 ALU encodings (0x01, 0x03, 0x09, ... 0x3B), TEST and MOV
+    MODRM_FORMS = dict(
+        [(row << 3 | 1, (mnemonic, 'rm_reg')) for row, mnemonic in enumerate(GROUP1)]
+        + [(row << 3 | 3, (mnemonic, 'reg_rm')) for row, mnemonic in enumerate(GROUP1)]
+        + [(0x85, ('TEST', 'rm_reg')), (0x89, ('MOV', 'rm_reg')), (0x8B, ('MOV', 'reg_rm'))]
+    )
+    # opcode -> mnemonic for "op eAX, imm" forms (0x05, 0x0D, ... 0x3D, and TEST 0xA9)
+    ACCUMULATOR_FORMS = dict([(row << 3 | 5, mnemonic) for row, mnemonic in enumerate(GROUP1)]
+                             + [(0xA9, 'TEST')])
+
+    def __init__(self, base_address=0):
+        self.base_address = base_address
+
+    @staticmethod
+    def label(address):
+        """Label name used for a branch target."""
+        return f"L_{address:X}"
+
+    def decode(self, source):
+        """Yield decoded instructions from a buffer or a file path."""
+        if isinstance(source, (str, os.PathLike)):
+            if os.path.getsize(source) == 0:
+                return
+            with open(source, 'rb') as handle, \
+                    mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                    memoryview(mapped) as code:
+                yield from self._decode_view(code)
+        else:
+            with memoryview(source) as code:
+                yield from self._decode_view(code.cast('B'))
+
+    def _decode_view(self, code):
+        """Decode instructions from a byte memoryview."""
+        position = 0
+        while position < len(code):
+            try:
+                instruction = self._decode_one(code, position)
+            except IndexError:
+                # Truncated instruction at the end of the buffer
+                instruction = self._instruction(code, position, len(code), '(bad)', [], 0)
+            yield instruction
+            position += instruction['length']
+
+    def _instruction(self, code, start, end, mnemonic, operands, operand_size, target=None):
+        """Build the decoded-instruction record."""
+        # RIP-relative displacements count from the end of the instruction
+        next_address = self.base_address + end
+        operands = [re.sub(r'\[RIP([+-]\d+)?\]', lambda match: f"[{next_address + int(match.group(1) or 0)}]",
+                           operand)
+                    for operand in operands]
+        text = None
+        if mnemonic != '(bad)':
+            text = f"{mnemonic} {', '.join(operands)}" if operands else mnemonic
+        return {
+            'address': self.base_address + start,
+            'length': end - start,
+            'bytes': code[start:end].hex(),
+            'mnemonic': mnemonic,
+            'operands': operands,
+            'operand_size': operand_size,
+            'text': text,
+            'target': target
+        }
+
+    @staticmethod
+    def _signed(code, position, size):
+        """Read a little-endian signed integer of ``size`` bytes."""
+        if position + size > len(code):
+            raise IndexError("truncated immediate")
+        return int.from_bytes(code[position:position + size], 'little', signed=True)
+
+    def _modrm(self, code, position, rex):
+        """
+        Decode a ModRM byte (plus SIB and displacement).
+
+        Returns:
+            Tuple of (reg field, r/m operand text, position after the operand)
+        """
+        modrm = code[position]
+        position += 1
+        mod, reg, rm = modrm >> 6, ((modrm >> 3) & 7) | ((rex & 4) << 1), modrm & 7
+        registers = self.REGISTERS
+
+        if mod == 3:
+            return reg, registers[rm | ((rex & 1) << 3)], position
+
+        parts = []
+        displacement_size = {0: 0, 1: 1, 2: 4}[mod]
+        if rm == 4:
+            sib = code[position]
+            position += 1
+            scale, index, base = 1 << (sib >> 6), ((sib >> 3) & 7) | ((rex & 2) << 2), sib & 7
+            if base == 5 and mod == 0:
+                displacement_size = 4
+            else:
+                parts.append(registers[base | ((rex & 1) << 3)])
+            if index != 4:
+                parts.append(f"{registers[index]}*{scale}" if scale > 1 else registers[index])
+        elif rm == 5 and mod == 0:
+            parts.append('RIP')
+            displacement_size = 4
+        else:
+            parts.append(registers[rm | ((rex & 1) << 3)])
+
+        displacement = self._signed(code, position, displacement_size) if displacement_size else 0
+        position += displacement_size
+
+        if not parts:
+            return reg, f"[{displacement}]", position
+        address = '+'.join(parts)
+        if displacement:
+            address += f"{displacement:+d}"
+        return reg, f"[{address}]", position
+
+    def _decode_one(self, code, start):
+        """Decode the instruction at ``start``."""
+        registers = self.REGISTERS
+        position = start
+        operand_size = 32
+        while code[position] in self.LEGACY_PREFIXES:
+            if code[position] == 0x66:
+                operand_size = 16
+            position += 1
+
+        rex = 0
+        if 0x40 <= code[position] <= 0x4F:
+            rex = code[position]
+            position += 1
+            if rex & 8:
+                operand_size = 64
+
+        immediate_size = 2 if operand_size == 16 else 4
+        opcode = code[position]
+        position += 1
+
+        def done(mnemonic, operands, target=None):
+            return self._instruction(code, start, position, mnemonic, operands, operand_size, target)
+
+        if opcode in self.MODRM_FORMS:
+            mnemonic, order = self.MODRM_FORMS[opcode]
+            reg, rm, position = self._modrm(code, position, rex)
+            operands = [rm, registers[reg]] if order == 'rm_reg' else [registers[reg], rm]
+            return done(mnemonic, operands)
+
+        if opcode in self.ACCUMULATOR_FORMS:
+            value = self._signed(code, position, immediate_size)
+            position += immediate_size
+            return done(self.ACCUMULATOR_FORMS[opcode], ['RAX', str(value)])
+
+        if opcode in (0x81, 0x83):
+            reg, rm, position = self._modrm(code, position, rex)
+            size = 1 if opcode == 0x83 else immediate_size
+            value = self._signed(code, position, size)
+            position += size
+            return done(self.GROUP1[reg & 7], [rm, str(value)])
+
+        if 0xB8 <= opcode <= 0xBF:
+            size = 8 if operand_size == 64 else immediate_size
+            value = self._signed(code, position, size)
+            position += size
+            return done('MOV', [registers[(opcode - 0xB8) | ((rex & 1) << 3)], str(value)])
+
+        if opcode == 0xC7:
+            reg, rm, position = self._modrm(code, position, rex)
+            value = self._signed(code, position, immediate_size)
+            position += immediate_size
+            return done('MOV' if reg & 7 == 0 else '(bad)', [rm, str(value)])
+
+        if opcode == 0x0F and code[position] == 0xAF:
+            reg, rm, position = self._modrm(code, position + 1, rex)
+            return done('MUL', [registers[reg], rm])
+
+        if opcode in (0x69, 0x6B):
+            reg, rm, position = self._modrm(code, position, rex)
+            size = 1 if opcode == 0x6B else immediate_size
+            value = self._signed(code, position, size)
+            position += size
+            return done('IMUL', [registers[reg], rm, str(value)])
+
+        if opcode == 0xF7:
+            reg, rm, position = self._modrm(code, position, rex)
+            mnemonic = self.GROUP3[reg & 7]
+            operands = [rm]
+            if mnemonic == 'TEST':
+                value = self._signed(code, position, immediate_size)
+                position += immediate_size
+                operands.append(str(value))
+            return done(mnemonic, operands)
+
+        if opcode == 0xFF:
+            reg, rm, position = self._modrm(code, position, rex)
+            mnemonic = self.GROUP5[reg & 7]
+            return done(mnemonic or '(bad)', [rm])
+
+        if opcode in (0xE8, 0xE9, 0xEB):
+            size = 1 if opcode == 0xEB else 4
+            offset = self._signed(code, position, size)
+            position += size
+            target = self.base_address + position + offset
+            return done('CALL' if opcode == 0xE8 else 'JMP', [self.label(target)], target)
+
+        if 0x50 <= opcode <= 0x5F:
+            # PUSH and POP default to 64-bit operands in long mode
+            operand_size = 16 if operand_size == 16 else 64
+            register = registers[(opcode & 7) | ((rex & 1) << 3)]
+            return done('PUSH' if opcode < 0x58 else 'POP', [register])
+
+        if opcode == 0x90:
+            return done('NOP', [])
+        if opcode == 0xC3:
+            return done('RET', [])
+
+        # Unknown opcode: consume one byte, like a disassembler's "(bad)"
+        return self._instruction(code, start, start + 1, '(bad)', [], operand_size)
+
 class VectorIndex:
     """Simple vector index for self-contained operation."""
 
@@ -905,39 +2719,325 @@ class VectorIndex:
         """Optimize index."""
         return ['index_optimized']
 
+class VectorFileSystem:
+    """
+    In-memory filesystem with an inode table and a flat path index.
+
+    Every absolute path maps straight to its inode number, so lookups cost a
+    single dict access however deep the tree is. Directory inodes hold
+    name -> inode entries; file inodes point at a content blob, and files
+    with identical contents share one buffer. Appends collect in a per-file
+    chunk list and are only joined and interned when the file is next read,
+    so a loop of ``>>`` redirections costs linear time.
+    """
+
+    def __init__(self):
+        self.inodes = {}
+        self.path_index = {}
+        self.blobs = {}  # digest -> {'data': bytes, 'refs': int}
+        self.next_inode = 1
+        self.path_index['/'] = self._allocate_inode('dir')
+
+    @classmethod
+    def from_tree(cls, tree):
+        """Build a filesystem from nested dicts (dicts are dirs, strings are files)."""
+        filesystem = cls()
+
+        def populate(base, node):
+            for name, child in node.items():
+                path = posixpath.join(base, name)
+                if isinstance(child, dict):
+                    filesystem.mkdir(path)
+                    populate(path, child)
+                else:
+                    filesystem.write(path, child)
+
+        populate('/', tree)
+        return filesystem
+
+    @staticmethod
+    def normalize(path):
+        """Normalize to an absolute path without trailing slashes or dot segments."""
+        return posixpath.normpath('/' + path.lstrip('/'))
+
+    def _allocate_inode(self, kind):
+        """Create an empty inode of the given type and return its number."""
+        ino = self.next_inode
+        self.next_inode += 1
+        now = time.time()
+        self.inodes[ino] = {
+            'ino': ino,
+            'type': kind,
+            'size': 0,
+            'ctime': now,
+            'mtime': now,
+            'entries': {} if kind == 'dir' else None,
+            'blob': None,
+            'chunks': None  # Unsealed appended contents (see _seal)
+        }
+        return ino
+
+    def _lookup(self, path):
+        """Resolve a path to its inode or raise FileNotFoundError."""
+        path = self.normalize(path)
+        ino = self.path_index.get(path)
+        if ino is None:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+        return self.inodes[ino]
+
+    def _parent_dir(self, path):
+        """Resolve the directory that will contain ``path``."""
+        parent = self._lookup(posixpath.dirname(path))
+        if parent['type'] != 'dir':
+            raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), posixpath.dirname(path))
+        return parent
+
+    def _link(self, path, kind):
+        """Create a new inode at ``path`` and index it."""
+        parent = self._parent_dir(path)
+        ino = self._allocate_inode(kind)
+        parent['entries'][posixpath.basename(path)] = ino
+        parent['mtime'] = time.time()
+        self.path_index[path] = ino
+        return self.inodes[ino]
+
+    def _store_blob(self, data):
+        """Intern file contents, sharing the buffer with identical files."""
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        blob = self.blobs.setdefault(digest, {'data': data, 'refs': 0})
+        blob['refs'] += 1
+        return digest
+
+    def _release_blob(self, digest):
+        """Drop one reference to a blob, freeing it when unused."""
+        if digest is None:
+            return
+        blob = self.blobs[digest]
+        blob['refs'] -= 1
+        if blob['refs'] == 0:
+            del self.blobs[digest]
+
+    def mkdir(self, path, parents=False):
+        """Create a directory."""
+        path = self.normalize(path)
+        if path in self.path_index:
+            if self.inodes[self.path_index[path]]['type'] == 'dir' and parents:
+                return self.stat(path)
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), path)
+        if parents and posixpath.dirname(path) not in self.path_index:
+            self.mkdir(posixpath.dirname(path), parents=True)
+        self._link(path, 'dir')
+        return self.stat(path)
+
+    def write(self, path, data, append=False):
+        """Write (or append) data to a file, creating it if needed."""
+        path = self.normalize(path)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        if path in self.path_index:
+            inode = self.inodes[self.path_index[path]]
+            if inode['type'] == 'dir':
+                raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+        else:
+            inode = self._link(path, 'file')
+
+        if append and (inode['blob'] is not None or inode['chunks'] is not None):
+            if inode['chunks'] is None:
+                # Unshare the contents: from here on the file grows chunk by chunk
+                inode['chunks'] = [self.blobs[inode['blob']]['data']]
+                self._release_blob(inode['blob'])
+                inode['blob'] = None
+            inode['chunks'].append(bytes(data))
+            inode['size'] += len(data)
+        else:
+            old_blob = inode['blob']
+            inode['blob'] = self._store_blob(bytes(data))
+            self._release_blob(old_blob)
+            inode['chunks'] = None
+            inode['size'] = len(data)
+        inode['mtime'] = time.time()
+        return inode['size']
+
+    def _seal(self, inode):
+        """Join a file's appended chunks into one interned blob."""
+        if inode['chunks'] is not None:
+            inode['blob'] = self._store_blob(b''.join(inode['chunks']))
+            inode['chunks'] = None
+
+    def read(self, path):
+        """Read a file's contents as bytes."""
+        inode = self._lookup(path)
+        if inode['type'] == 'dir':
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), self.normalize(path))
+        self._seal(inode)
+        return self.blobs[inode['blob']]['data'] if inode['blob'] is not None else b''
+
+    def listdir(self, path):
+        """List the names in a directory."""
+        inode = self._lookup(path)
+        if inode['type'] != 'dir':
+            raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), self.normalize(path))
+        return sorted(inode['entries'])
+
+    def stat(self, path):
+        """Get inode metadata for a path."""
+        inode = self._lookup(path)
+        return {
+            'path': self.normalize(path),
+            'ino': inode['ino'],
+            'type': inode['type'],
+            'size': inode['size'] if inode['type'] == 'file' else len(inode['entries']),
+            'ctime': inode['ctime'],
+            'mtime': inode['mtime']
+        }
+
+    def get_stats(self):
+        """Get filesystem usage statistics."""
+        return {
+            'inodes': len(self.inodes),
+            'blobs': len(self.blobs),
+            'bytes_stored': (sum(len(blob['data']) for blob in self.blobs.values()) +
+                             sum(inode['size'] for inode in self.inodes.values() if inode['chunks'] is not None))
+        }
+
+class BootPhaseGraph:
+    """
+    Boot phases modelled as a dependency DAG, scheduled systemd-style.
+
+    Each phase starts as soon as every phase listed in its ``after`` key has
+    finished, so independent phases overlap and the boot takes as long as the
+    critical path. Phases flagged ``cacheable`` can be skipped when resuming
+    from a checkpointed image.
+    """
+
+    def __init__(self, phases):
+        self.phases = {phase['phase']: phase for phase in phases}
+        self.order = self._topological_order()
+
+    def _topological_order(self):
+        """Order phases so dependencies come first (Kahn's algorithm)."""
+        pending = {}
+        dependents = defaultdict(list)
+        for name, phase in self.phases.items():
+            for dependency in phase.get('after', []):
+                if dependency not in self.phases:
+                    raise ValueError(f"Boot phase {name} depends on unknown phase {dependency}")
+                dependents[dependency].append(name)
+            pending[name] = len(phase.get('after', []))
+
+        ready = deque(name for name, count in pending.items() if count == 0)
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.phases):
+            raise ValueError("Boot phase dependencies contain a cycle")
+        return order
+
+    def schedule(self, duration_scale=1.0, completed=()):
+        """
+        Compute start and finish offsets for every phase.
+
+        Args:
+            duration_scale: Multiplier applied to each phase duration
+            completed: Phase names already done in a checkpointed image
+
+        Returns:
+            Dictionary with per-phase timings, critical path and boot times
+        """
+        finish = {}
+        critical_parent = {}
+        phase_results = []
+        skipped = []
+        serial_time = 0.0
+
+        for name in self.order:
+            phase = self.phases[name]
+            dependencies = phase.get('after', [])
+            start = max((finish[dep] for dep in dependencies), default=0.0)
+            critical_parent[name] = max(dependencies, key=finish.__getitem__, default=None)
+
+            if phase.get('cacheable') and name in completed:
+                duration = 0.0
+                status = 'skipped'
+                skipped.append(name)
+            else:
+                duration = phase['duration'] * duration_scale
+                status = 'completed'
+
+            finish[name] = start + duration
+            serial_time += duration
+            phase_results.append({
+                'phase': name,
+                'duration': duration,
+                'start': start,
+                'finish': finish[name],
+                'status': status,
+                'timestamp': datetime.now().isoformat()
+            })
+
+        # Walk back from the last phase to finish along the slowest dependency
+        critical_path = []
+        name = max(finish, key=finish.__getitem__, default=None)
+        while name is not None:
+            critical_path.append(name)
+            name = critical_parent[name]
+
+        return {
+            'phases': phase_results,
+            'critical_path': critical_path[::-1],
+            'skipped_phases': skipped,
+            'total_boot_time': max(finish.values(), default=0.0),
+            'serial_boot_time': serial_time
+        }
+
+    def fingerprint(self):
+        """Stable hash of the phases, their durations, dependencies and cacheability."""
+        canonical = json.dumps(
+            [[name, phase['duration'], sorted(phase.get('after', [])), bool(phase.get('cacheable'))]
+             for name, phase in sorted(self.phases.items())])
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+    def checkpoint(self):
+        """Phases whose results can be reused by a resumed boot."""
+        return {name for name, phase in self.phases.items() if phase.get('cacheable')}
+
 class LRUCache:
     """Simple LRU cache implementation."""
 
     def __init__(self, max_size=100):
         self.max_size = max_size
-        self.cache = {}
-        self.access_order = []
+        self.cache = OrderedDict()
+        self.evictions = 0
 
     def get(self, key):
         """Get item from cache."""
         if key in self.cache:
             # Move to end of access order
-            self.access_order.remove(key)
-            self.access_order.append(key)
+            self.cache.move_to_end(key)
             return self.cache[key]
         return None
 
     def put(self, key, value):
         """Put item in cache."""
         if key in self.cache:
-            self.access_order.remove(key)
+            self.cache.move_to_end(key)
         elif len(self.cache) >= self.max_size:
             # Remove least recently used
-            lru_key = self.access_order.pop(0)
-            del self.cache[lru_key]
+            self.cache.popitem(last=False)
+            self.evictions += 1
 
         self.cache[key] = value
-        self.access_order.append(key)
 
     def clear(self):
         """Clear cache."""
         self.cache.clear()
-        self.access_order.clear()
 
     @property
     def current_size(self):
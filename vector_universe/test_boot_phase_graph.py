@@ -0,0 +1,42 @@
+"""Boot phase scheduling and checkpoint resume."""
+
+import pytest
+
+from self_contained_vector_universe import BootPhaseGraph, VectorHypervisorEngine
+
+
+@pytest.fixture
+def hypervisor():
+    hypervisor = VectorHypervisorEngine()
+    hypervisor.initialize({})
+    yield hypervisor
+    hypervisor.shutdown()
+
+
+def test_default_boot_overlaps_independent_phases(hypervisor):
+    vm = hypervisor.create_vm({'cpu_cores': 2})
+    boot = hypervisor.boot_linux(vm['id'], {})
+    assert boot['total_boot_time'] < boot['serial_boot_time']
+    assert 'network' not in boot['critical_path']
+    starts = {phase['phase']: phase['start'] for phase in boot['boot_phases']}
+    assert starts['udev'] == starts['network'] == starts['logging']
+
+
+def test_resume_only_uses_checkpoints_of_the_same_phase_graph(hypervisor):
+    vm = hypervisor.create_vm({'cpu_cores': 2})
+    custom = [{'phase': 'kernel', 'duration': 1.0, 'after': [], 'cacheable': True},
+              {'phase': 'init', 'duration': 1.0, 'after': ['kernel']}]
+    hypervisor.boot_linux(vm['id'], {'image': 'base'})
+
+    resumed = hypervisor.boot_linux(vm['id'], {'image': 'base', 'boot_phases': custom,
+                                               'resume_from_checkpoint': True})
+    assert resumed['skipped_phases'] == []
+    resumed = hypervisor.boot_linux(vm['id'], {'image': 'base', 'resume_from_checkpoint': True})
+    assert set(resumed['skipped_phases']) == {'bootloader', 'kernel', 'init'}
+
+
+def test_fingerprint_tracks_graph_changes():
+    phases = [{'phase': 'a', 'duration': 1.0, 'after': []}, {'phase': 'b', 'duration': 1.0, 'after': ['a']}]
+    changed = [dict(phases[0]), dict(phases[1], duration=2.0)]
+    assert BootPhaseGraph(phases).fingerprint() == BootPhaseGraph(list(reversed(phases))).fingerprint()
+    assert BootPhaseGraph(phases).fingerprint() != BootPhaseGraph(changed).fingerprint()
@@ -0,0 +1,30 @@
+"""Command lines run by the embedded Linux simulator."""
+
+import pytest
+
+from self_contained_vector_universe import EmbeddedLinuxSimulator
+
+
+@pytest.fixture
+def linux():
+    return EmbeddedLinuxSimulator()
+
+
+def test_invalid_grep_pattern_fails_with_exit_code_2(linux):
+    result = linux.execute_command("echo a | grep '['")
+    assert result['exit_code'] == 2
+    assert result['output'].startswith('grep: invalid pattern:')
+
+    batch = linux.execute_batch(["grep '('", 'echo ok'])
+    assert [r['exit_code'] for r in batch['results']] == [2, 0]
+    assert batch['results'][1]['output'] == 'ok'
+
+
+def test_only_trailing_redirect_is_parsed(linux):
+    assert linux.execute_command('echo one > /home/out')['output'] == ''
+    assert linux.execute_command('echo two >> /home/out')['output'] == ''
+    assert linux.execute_command('cat /home/out')['output'] == 'one\ntwo'
+
+    # A '>' that does not end the command line stays an argument
+    assert linux.execute_command("echo '>' /home/out | cat")['output'] == '> /home/out'
+    assert linux.execute_command('echo a >')['exit_code'] == 2
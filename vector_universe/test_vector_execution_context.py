@@ -0,0 +1,35 @@
+"""Register file and memory of batched x86 execution contexts."""
+
+import numpy as np
+import pytest
+
+from self_contained_vector_universe import VectorExecutionContext, VectorX86AbstractionLayer
+
+
+def test_memory_is_allocated_only_for_touched_pages():
+    context = VectorExecutionContext(10000)
+    assert context.pages == {}
+    context.write(VectorExecutionContext.parse_operand('[100]'), 7)
+    assert list(context.pages) == [100 // VectorExecutionContext.PAGE_SIZE]
+    assert context.read(VectorExecutionContext.parse_operand('[100]')).tolist() == [7] * 10000
+    assert not context.read(VectorExecutionContext.parse_operand('[3000]')).any()
+
+
+def test_per_lane_addresses_span_pages():
+    context = VectorExecutionContext(3)
+    # Lane 1's quadword straddles a page boundary
+    page = VectorExecutionContext.PAGE_SIZE
+    context.registers[VectorExecutionContext.register_index('RBX')] = [0, page - 12, 4000]
+    context.write(VectorExecutionContext.parse_operand('[RBX+8]'), np.array([1, -2, 3]))
+    assert context.read(VectorExecutionContext.parse_operand(f'[{page}]')).tolist() == [0, 0xFFFFFFFF, 0]
+    assert context.read(VectorExecutionContext.parse_operand('[RBX+8]')).tolist() == [1, -2, 3]
+
+
+@pytest.mark.parametrize('lines', [
+    ['MOV [RBX-8], RAX'],  # negative address must not wrap to the end of memory
+    ['MOV RAX, [1048573]'],  # the quadword runs past the end of memory
+    ['MOV RBX, 1048576', 'MOV RAX, [RBX]'],
+])
+def test_addresses_outside_memory_raise(lines):
+    with pytest.raises(ValueError):
+        VectorX86AbstractionLayer().execute_program(lines)
@@ -0,0 +1,40 @@
+"""In-memory filesystem contents, sharing and append behaviour."""
+
+import time
+
+from self_contained_vector_universe import VectorFileSystem
+
+
+def test_appends_read_back_in_order_and_share_blobs_once_sealed():
+    filesystem = VectorFileSystem.from_tree({'a': 'x', 'b': 'xyz'})
+    filesystem.write('/a', 'y', append=True)
+    assert filesystem.write('/a', b'z', append=True) == 3
+    assert filesystem.stat('/a')['size'] == 3
+    assert filesystem.read('/a') == b'xyz'
+    # Once read, the appended file is interned and shares /b's blob
+    assert filesystem.get_stats()['blobs'] == 1
+    filesystem.write('/a', 'new')
+    assert filesystem.read('/a') == b'new' and filesystem.read('/b') == b'xyz'
+
+
+def test_append_to_new_and_shared_files():
+    filesystem = VectorFileSystem.from_tree({'a': 'same', 'b': 'same'})
+    filesystem.write('/a', '!', append=True)
+    filesystem.write('/c', 'first', append=True)
+    assert filesystem.read('/b') == b'same'
+    assert filesystem.read('/a') == b'same!'
+    assert filesystem.read('/c') == b'first'
+
+
+def test_append_loop_is_linear():
+    def append_time(count):
+        filesystem = VectorFileSystem()
+        start = time.perf_counter()
+        for _ in range(count):
+            filesystem.write('/log', b'x' * 64, append=True)
+        elapsed = time.perf_counter() - start
+        assert len(filesystem.read('/log')) == 64 * count
+        return elapsed
+
+    # Quadratic appends would take ~16x as long for 4x the writes
+    assert append_time(40000) < 8 * append_time(10000) + 0.05
@@ -0,0 +1,32 @@
+"""VM operations on the hypervisor's worker pool."""
+
+import pytest
+
+from self_contained_vector_universe import VectorHypervisorEngine
+
+
+@pytest.fixture
+def hypervisor():
+    hypervisor = VectorHypervisorEngine()
+    hypervisor.initialize({'worker_threads': 2})
+    yield hypervisor
+    hypervisor.shutdown()
+
+
+def test_nested_execute_runs_inline_instead_of_deadlocking(hypervisor):
+    vm = hypervisor.create_vm({'cpu_cores': 4})
+
+    def outer(current):
+        return hypervisor.execute_vm(current['id'], lambda inner: inner['id'])['output']
+
+    # More nested calls than workers: waiting on the pool would deadlock
+    futures = [hypervisor.submit_vm(vm['id'], outer) for _ in range(6)]
+    assert [future.result(timeout=5)['output'] for future in futures] == [vm['id']] * 6
+
+
+def test_named_operations_report_their_output(hypervisor):
+    vm = hypervisor.create_vm({})
+    assert hypervisor.execute_vm(vm['id'], 'status')['output']['id'] == vm['id']
+    assert hypervisor.execute_vm(vm['id'], 'boot_linux')['output']['status'] == 'success'
+    with pytest.raises(ValueError):
+        hypervisor.execute_vm(vm['id'], 'no_such_operation')
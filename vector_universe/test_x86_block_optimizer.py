@@ -0,0 +1,171 @@
+"""Optimized x86 blocks must compute exactly what the unoptimized blocks do; decoded code must run faithfully."""
+
+import random
+
+import numpy as np
+import pytest
+
+from self_contained_vector_universe import (VectorExecutionContext, VectorX86AbstractionLayer,
+                                            X86BlockOptimizer)
+
+REGISTERS = ['RAX', 'RBX', 'RCX', 'RDX']
+MEMORY = ['[RBX]', '[RBX+8]', '[RCX]', '[RCX+8]', '[RAX]', '[16]', '[24]', '[RBX+RCX*2]', '[RDX*4+8]']
+MEMORY_SIZE = 512
+
+
+def random_block(rng):
+    """A short block of data ops over a few registers and aliasing addresses."""
+    lines = []
+    for _ in range(rng.randint(1, 8)):
+        opcode = rng.choice(['MOV', 'MOV', 'MOV', 'ADD', 'SUB', 'MUL', 'AND', 'OR', 'XOR', 'CMP'])
+        form = rng.random()
+        if form < 0.35:
+            destination, source = rng.choice(REGISTERS), rng.choice(MEMORY)
+        elif form < 0.6:
+            destination, source = rng.choice(MEMORY), rng.choice(REGISTERS + [str(rng.randint(0, 40))])
+        else:
+            destination, source = rng.choice(REGISTERS), rng.choice(REGISTERS + [str(rng.randint(-1, 40))])
+        lines.append(f"{opcode} {destination}, {source}")
+    return lines
+
+
+def run_block(layer, block, initial):
+    """Final (registers, memory), or None if the block addresses outside memory."""
+    context = VectorExecutionContext(1, memory_size=MEMORY_SIZE)
+    context.registers[:len(initial), 0] = initial
+    pages = range(MEMORY_SIZE // VectorExecutionContext.PAGE_SIZE)
+    for number in pages:
+        context.pages[number] = (np.arange(VectorExecutionContext.PAGE_SIZE, dtype=np.uint8)[None, :] % 48)
+    try:
+        for kernel in layer._block_kernels(block):
+            kernel(context)
+    except ValueError:
+        return None
+    return context.registers.copy(), np.concatenate([context.pages[number] for number in pages], axis=1)
+
+
+def assert_equivalent(layer, lines, initial):
+    block = layer.translate_block(lines)
+    optimized = dict(block, block_id=f"{block['block_id']}:optimized",
+                     operations=X86BlockOptimizer().optimize(block['operations']))
+    expected = run_block(layer, block, initial)
+    if expected is None:
+        return
+    actual = run_block(layer, optimized, initial)
+    assert actual is not None, lines
+    np.testing.assert_array_equal(actual[0], expected[0], err_msg=str(lines))
+    np.testing.assert_array_equal(actual[1], expected[1], err_msg=str(lines))
+
+
+@pytest.mark.parametrize('lines', [
+    ['MOV RBX, [RBX]', 'MOV RAX, [RBX]'],
+    ['MOV RCX, [RCX+8]', 'MOV [RCX+8], RCX'],
+    ['MOV RBX, [RBX+8]', 'MOV [RBX+8], RBX', 'MOV RCX, [RBX+8]'],
+    ['MOV [RBX], RAX', 'ADD RBX, 8', 'MOV RCX, [RBX]'],
+])
+def test_loads_through_overwritten_base_register(lines):
+    assert_equivalent(VectorX86AbstractionLayer(), lines, [3, 5, 7, 9])
+
+
+def test_random_blocks_match_unoptimized():
+    rng = random.Random(0)
+    layer = VectorX86AbstractionLayer(cache_size=8)
+    for _ in range(5000):
+        assert_equivalent(layer, random_block(rng), [rng.randint(0, 40) for _ in REGISTERS])
+
+
+@pytest.mark.parametrize('lines', [
+    ['XOR RAX, RAX', 'ADD RAX, RBX'],
+    ['SUB RCX, RCX', 'MOV RDX, [RBX+RCX*2]'],
+    ['MOV RCX, 2', 'MOV [RBX+RCX*4], RAX', 'ADD RCX, 1', 'MOV RDX, [RBX+RCX*4]'],
+    ['MOV RDX, [RBX+RCX*2]', 'MOV RCX, [RBX+RCX*2]', 'MOV RAX, [RBX+RCX*2]'],
+    ['AND RAX, 0', 'OR RBX, -1', 'XOR RCX, 0', 'AND RDX, -1'],
+    ['ADD RAX, 3', 'AND RAX, 6', 'MUL RAX, 5', 'ADD RAX, 1'],
+])
+def test_bitwise_and_indexed_forms(lines):
+    assert_equivalent(VectorX86AbstractionLayer(), lines, [3, 5, 7, 9])
+
+
+def run_binary(code, registers=None, base_address=0, **options):
+    layer = VectorX86AbstractionLayer()
+    lines = []
+    for block in layer.translate_binary(bytes.fromhex(code), base_address)['blocks']:
+        lines.extend(([f"{block['label']}:"] if block['label'] else []) + block['instructions'])
+    return layer.execute_program(lines, registers=registers, **options)['registers']
+
+
+def test_32_bit_writes_zero_extend():
+    assert run_binary('b8ffffffff')['RAX'] == 0xFFFFFFFF  # mov eax, 0xffffffff
+    assert run_binary('48c7c0ffffffff')['RAX'] == -1  # mov rax, -1
+    assert run_binary('31c0', {'RAX': -5})['RAX'] == 0  # xor eax, eax
+    assert run_binary('ffc8', {'RAX': 0})['RAX'] == 0xFFFFFFFF  # dec eax
+    assert run_binary('01c8', {'RAX': 0xFFFFFFFF, 'RCX': 1})['RAX'] == 0  # add eax, ecx
+
+
+def test_decoded_forms_execute():
+    # mov rax, [rbx+rcx*4]; or rax, 0x10; imul rdx, rax, 3; push rdx; pop rsi
+    registers = run_binary('488b048b4883c810486bd003525e', {'RBX': 2, 'RCX': 1, 'RSP': 32})
+    assert registers['RAX'] == 0x10 and registers['RDX'] == 0x30 and registers['RSI'] == 0x30
+    assert registers['RSP'] == 32
+
+
+def test_rip_relative_operands_are_absolute():
+    instruction = next(VectorX86AbstractionLayer().decode_binary(bytes.fromhex('488b0510000000')))
+    assert instruction['operands'] == ['RAX', '[23]']
+
+
+def test_memory_is_byte_addressed():
+    # mov [rbx], rax; mov rcx, [rbx+4] reads the upper half of the stored quadword
+    registers = run_binary('488903488b4b04', {'RAX': -1, 'RBX': 16})
+    assert registers['RCX'] == 0xFFFFFFFF
+
+
+def test_call_and_ret_move_the_stack():
+    # push rax; call f; pop rcx; ret; f: mov rbx, [rsp+8]; ret
+    registers = run_binary('50e80200000059c3488b5c2408c3', {'RAX': 7})
+    assert registers['RBX'] == 7 and registers['RCX'] == 7
+    assert registers['RSP'] == 1 << 20
+
+
+def test_operands_outside_modelled_memory_raise():
+    code = '488b0510000000'  # mov rax, [rip+0x10]
+    with pytest.raises(ValueError):
+        run_binary(code, base_address=0x401000)
+    assert run_binary(code, base_address=0x401000, memory_size=1 << 32)['RAX'] == 0
+
+
+@pytest.mark.parametrize('code', [
+    'f7e1',  # mul ecx writes RDX:RAX
+    '4811c8',  # adc rax, rcx
+    'ffd0',  # call rax
+    '8908',  # 32-bit store
+    '66b80100',  # 16-bit write
+    '0f0b',  # ud2
+])
+def test_untranslatable_binary_raises(code):
+    with pytest.raises(ValueError):
+        VectorX86AbstractionLayer().translate_binary(bytes.fromhex(code))
+
+
+def test_unsupported_text_instruction_raises():
+    with pytest.raises(ValueError):
+        VectorX86AbstractionLayer().execute_program(['MOV RAX, 1', 'SHL RAX, 2'])
+
+
+@pytest.mark.parametrize('lines', [
+    ['ADD RBX, RBX', 'MOV RAX, [RBX]'],
+    ['MOV RAX, [5000]', 'ADD RAX, 1', 'ADD RAX, 2'],
+    ['MOV RAX, [RBX-40]', 'MOV [RCX+RDX*8+100], RAX', 'ADD RBX, 8'],
+])
+def test_optimize_operation_benchmarks_memory_operands(lines):
+    result = VectorX86AbstractionLayer().optimize_operation(lines)
+    assert result['speedup'] is not None and result['speedup'] > 0
+    assert result['ops_after'] <= result['ops_before']
+
+
+def test_optimize_operation_keeps_blocks_that_fault():
+    lines = ['MUL RBX, RBX', 'MUL RBX, RBX', 'MUL RBX, RBX', 'MOV RAX, [RBX]', 'ADD RAX, 1', 'ADD RAX, 1']
+    layer = VectorX86AbstractionLayer()
+    result = layer.optimize_operation(lines)
+    assert result['speedup'] is None
+    assert result['blocks'] == layer.translate_program(lines)['blocks']